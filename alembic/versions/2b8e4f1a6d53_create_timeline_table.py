@@ -0,0 +1,41 @@
+"""create_timeline_table
+
+Revision ID: 2b8e4f1a6d53
+Revises: 9d4e6b2a7c15
+Create Date: 2026-10-18 16:12:31.508214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "2b8e4f1a6d53"
+down_revision = "9d4e6b2a7c15"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Filled by `python -m app.backfill_timelines` for the existing data.
+    op.create_table(
+        "timeline",
+        sa.Column("viewer_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("start_time", sa.DateTime(), nullable=False),
+        sa.Column("training_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["training_id"],
+            ["training.id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["viewer_id"],
+            ["user.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("viewer_id", "start_time", "training_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("timeline")
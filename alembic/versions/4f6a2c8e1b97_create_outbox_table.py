@@ -0,0 +1,36 @@
+"""create_outbox_table
+
+Revision ID: 4f6a2c8e1b97
+Revises: 7c1d9e5b3f24
+Create Date: 2026-10-18 18:21:40.538112
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "4f6a2c8e1b97"
+down_revision = "7c1d9e5b3f24"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "outbox",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False), nullable=False),
+        sa.Column("task", sa.String(), nullable=False),
+        sa.Column("kwargs", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade():
+    op.drop_table("outbox")
@@ -0,0 +1,125 @@
+"""add_training_reaction_counts
+
+Revision ID: 5f2a9c7e1d38
+Revises: c5a7e9d3b214
+Create Date: 2026-10-18 14:21:09.331542
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "5f2a9c7e1d38"
+down_revision = "c5a7e9d3b214"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "training",
+        sa.Column("likes_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "training",
+        sa.Column("dislikes_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION update_training_reaction_counts() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM 1 FROM training
+                WHERE id IN (SELECT training_id FROM new_reactions)
+                ORDER BY id
+                FOR NO KEY UPDATE;
+                UPDATE training
+                SET likes_count = training.likes_count + counts.likes_count,
+                    dislikes_count = training.dislikes_count + counts.dislikes_count
+                FROM (
+                    SELECT
+                        training_id,
+                        count(*) FILTER (WHERE reaction_type = 'like') AS likes_count,
+                        count(*) FILTER (WHERE reaction_type = 'dislike')
+                            AS dislikes_count
+                    FROM new_reactions
+                    GROUP BY training_id
+                ) AS counts
+                WHERE training.id = counts.training_id;
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                PERFORM 1 FROM training
+                WHERE id IN (SELECT training_id FROM old_reactions)
+                ORDER BY id
+                FOR NO KEY UPDATE;
+                UPDATE training
+                SET likes_count = training.likes_count - counts.likes_count,
+                    dislikes_count = training.dislikes_count - counts.dislikes_count
+                FROM (
+                    SELECT
+                        training_id,
+                        count(*) FILTER (WHERE reaction_type = 'like') AS likes_count,
+                        count(*) FILTER (WHERE reaction_type = 'dislike')
+                            AS dislikes_count
+                    FROM old_reactions
+                    GROUP BY training_id
+                ) AS counts
+                WHERE training.id = counts.training_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER reaction_counts_insert
+        AFTER INSERT ON reaction
+        REFERENCING NEW TABLE AS new_reactions
+        FOR EACH STATEMENT EXECUTE FUNCTION update_training_reaction_counts()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER reaction_counts_delete
+        AFTER DELETE ON reaction
+        REFERENCING OLD TABLE AS old_reactions
+        FOR EACH STATEMENT EXECUTE FUNCTION update_training_reaction_counts()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER reaction_counts_update
+        AFTER UPDATE ON reaction
+        REFERENCING OLD TABLE AS old_reactions NEW TABLE AS new_reactions
+        FOR EACH STATEMENT EXECUTE FUNCTION update_training_reaction_counts()
+        """
+    )
+    # The triggers exist from here on, the backfill only has to cover the
+    # reactions that were already there.
+    op.execute(
+        """
+        UPDATE training
+        SET likes_count = counts.likes_count,
+            dislikes_count = counts.dislikes_count
+        FROM (
+            SELECT
+                training_id,
+                count(*) FILTER (WHERE reaction_type = 'like') AS likes_count,
+                count(*) FILTER (WHERE reaction_type = 'dislike') AS dislikes_count
+            FROM reaction
+            GROUP BY training_id
+        ) AS counts
+        WHERE training.id = counts.training_id
+        """
+    )
+
+
+def downgrade():
+    op.execute("DROP TRIGGER reaction_counts_update ON reaction")
+    op.execute("DROP TRIGGER reaction_counts_delete ON reaction")
+    op.execute("DROP TRIGGER reaction_counts_insert ON reaction")
+    op.execute("DROP FUNCTION update_training_reaction_counts()")
+    op.drop_column("training", "dislikes_count")
+    op.drop_column("training", "likes_count")
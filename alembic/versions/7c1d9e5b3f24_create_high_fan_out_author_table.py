@@ -0,0 +1,33 @@
+"""create_high_fan_out_author_table
+
+Revision ID: 7c1d9e5b3f24
+Revises: 2b8e4f1a6d53
+Create Date: 2026-10-18 17:03:52.117093
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "7c1d9e5b3f24"
+down_revision = "2b8e4f1a6d53"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "high_fan_out_author",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("high_fan_out_author")
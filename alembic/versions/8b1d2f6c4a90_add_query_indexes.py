@@ -0,0 +1,70 @@
+"""add_query_indexes
+
+Revision ID: 8b1d2f6c4a90
+Revises: e3c4fd9a8e11
+Create Date: 2026-10-18 10:12:41.518233
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "8b1d2f6c4a90"
+down_revision = "e3c4fd9a8e11"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Built concurrently so that existing tables stay writable meanwhile.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_training_user_id_start_time",
+            "training",
+            ["user_id", "start_time"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_reaction_training_id_created_at",
+            "reaction",
+            ["training_id", "created_at"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_friendship_request_pending_receiver_id_timestamp",
+            "friendship_request",
+            ["receiver_id", "timestamp"],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_friendship_request_pending_sender_id_timestamp",
+            "friendship_request",
+            ["sender_id", "timestamp"],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_friendship_request_pending_sender_id_timestamp",
+            table_name="friendship_request",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_friendship_request_pending_receiver_id_timestamp",
+            table_name="friendship_request",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_reaction_training_id_created_at",
+            table_name="reaction",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_training_user_id_start_time",
+            table_name="training",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,45 @@
+"""add_reaction_user_training_unique_index
+
+Revision ID: 9d4e6b2a7c15
+Revises: 5f2a9c7e1d38
+Create Date: 2026-10-18 15:02:44.816390
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9d4e6b2a7c15"
+down_revision = "5f2a9c7e1d38"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep only the latest reaction per user and training, the delete trigger
+    # takes the removed ones off the counters.
+    op.execute(
+        """
+        DELETE FROM reaction
+        USING reaction AS newer
+        WHERE reaction.user_id = newer.user_id
+            AND reaction.training_id = newer.training_id
+            AND (reaction.created_at, reaction.id) < (newer.created_at, newer.id)
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_reaction_user_id_training_id",
+            "reaction",
+            ["user_id", "training_id"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_reaction_user_id_training_id",
+            table_name="reaction",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,57 @@
+"""add_friendship_request_pending_pair_index
+
+Revision ID: a6d3f9b2c8e4
+Revises: 4f6a2c8e1b97
+Create Date: 2026-10-18 19:02:13.804551
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "a6d3f9b2c8e4"
+down_revision = "4f6a2c8e1b97"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Concurrent sends could create several pending requests between the same
+    # users, only the oldest one is kept pending.
+    op.execute(
+        """
+        UPDATE friendship_request SET status = 'cancelled'
+        WHERE status = 'pending' AND id NOT IN (
+            SELECT DISTINCT ON (
+                least(sender_id, receiver_id), greatest(sender_id, receiver_id)
+            ) id
+            FROM friendship_request
+            WHERE status = 'pending'
+            ORDER BY
+                least(sender_id, receiver_id),
+                greatest(sender_id, receiver_id),
+                timestamp
+        )
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_friendship_request_pending_pair",
+            "friendship_request",
+            [
+                sa.text("least(sender_id, receiver_id)"),
+                sa.text("greatest(sender_id, receiver_id)"),
+            ],
+            unique=True,
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_friendship_request_pending_pair",
+            table_name="friendship_request",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,65 @@
+"""store_friendships_once
+
+Revision ID: b7e2d5f1a903
+Revises: d1e8c4a7f329
+Create Date: 2026-10-18 20:31:05.418226
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "b7e2d5f1a903"
+down_revision = "d1e8c4a7f329"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Friendships were stored in both directions, only the row with the lower
+    # user id first is kept.
+    op.execute(
+        """
+        INSERT INTO friendship (user_1_id, user_2_id)
+        SELECT user_2_id, user_1_id FROM friendship WHERE user_1_id > user_2_id
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.execute("DELETE FROM friendship WHERE user_1_id > user_2_id")
+    # NOT VALID only checks the rows written from now on, the existing ones are
+    # validated below without blocking writes.
+    op.create_check_constraint(
+        "ck_friendship_user_1_id_lt_user_2_id",
+        "friendship",
+        sa.column("user_1_id") < sa.column("user_2_id"),
+        postgresql_not_valid=True,
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TABLE friendship "
+            "VALIDATE CONSTRAINT ck_friendship_user_1_id_lt_user_2_id"
+        )
+        op.create_index(
+            "ix_friendship_user_2_id",
+            "friendship",
+            ["user_2_id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_friendship_user_2_id",
+            table_name="friendship",
+            postgresql_concurrently=True,
+        )
+    op.drop_constraint(
+        "ck_friendship_user_1_id_lt_user_2_id", "friendship", type_="check"
+    )
+    op.execute(
+        """
+        INSERT INTO friendship (user_1_id, user_2_id)
+        SELECT user_2_id, user_1_id FROM friendship
+        """
+    )
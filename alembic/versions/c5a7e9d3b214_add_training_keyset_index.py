@@ -0,0 +1,45 @@
+"""add_training_keyset_index
+
+Revision ID: c5a7e9d3b214
+Revises: 8b1d2f6c4a90
+Create Date: 2026-10-18 11:03:27.904115
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c5a7e9d3b214"
+down_revision = "8b1d2f6c4a90"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # (start_time, id) is the keyset of the trainings connection.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_training_user_id_start_time_id",
+            "training",
+            ["user_id", "start_time", "id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_training_user_id_start_time",
+            table_name="training",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_training_user_id_start_time",
+            "training",
+            ["user_id", "start_time"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_training_user_id_start_time_id",
+            table_name="training",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,50 @@
+"""add_friendship_request_keyset_indexes
+
+Revision ID: d1e8c4a7f329
+Revises: a6d3f9b2c8e4
+Create Date: 2026-10-18 19:48:27.160394
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "d1e8c4a7f329"
+down_revision = "a6d3f9b2c8e4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # (timestamp, id) is the keyset of the pending friendship request connections.
+    with op.get_context().autocommit_block():
+        for column in ("receiver_id", "sender_id"):
+            op.create_index(
+                f"ix_friendship_request_pending_{column}_timestamp_id",
+                "friendship_request",
+                [column, "timestamp", "id"],
+                postgresql_where=sa.text("status = 'pending'"),
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                f"ix_friendship_request_pending_{column}_timestamp",
+                table_name="friendship_request",
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for column in ("receiver_id", "sender_id"):
+            op.create_index(
+                f"ix_friendship_request_pending_{column}_timestamp",
+                "friendship_request",
+                [column, "timestamp"],
+                postgresql_where=sa.text("status = 'pending'"),
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                f"ix_friendship_request_pending_{column}_timestamp_id",
+                table_name="friendship_request",
+                postgresql_concurrently=True,
+            )
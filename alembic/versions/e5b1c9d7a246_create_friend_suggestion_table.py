@@ -0,0 +1,32 @@
+"""create_friend_suggestion_table
+
+Revision ID: e5b1c9d7a246
+Revises: b7e2d5f1a903
+Create Date: 2026-10-18 21:14:52.602137
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "e5b1c9d7a246"
+down_revision = "b7e2d5f1a903"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "friend_suggestion",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("suggested_user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("mutual_friends_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["suggested_user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "suggested_user_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("friend_suggestion")
@@ -1,9 +1,41 @@
 from fastapi import FastAPI
 from strawberry.fastapi import GraphQLRouter
 
+from app.config import FRIENDSHIP_GRAPH_ENABLED
+from app.database import dispose_engine
+from app.domain.services.friendship_graph_sync import friendship_graph_sync
+from app.domain.services.reaction_write_buffer import reaction_write_buffer
+from app.graphql.context import get_context
 from app.graphql.schema import schema
+from app.metrics import get_metrics
+from app.passwords import password_hashing_pool
+from app.rabbitmq import publisher, subscription_hub
 
-graphql_app = GraphQLRouter(schema)
+graphql_app = GraphQLRouter(schema, context_getter=get_context)
 
 app = FastAPI()
 app.include_router(graphql_app, prefix="/graphql")
+
+
+@app.get("/metrics")
+async def metrics():
+    return get_metrics()
+
+
+@app.on_event("startup")
+async def startup():
+    if FRIENDSHIP_GRAPH_ENABLED:
+        # Loaded in the background, friendships are read from the database
+        # until it is.
+        friendship_graph_sync.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await friendship_graph_sync.close()
+    password_hashing_pool.shutdown()
+    # Pending reactions are written before the engine goes away.
+    await reaction_write_buffer.close()
+    await publisher.close()
+    await subscription_hub.close()
+    await dispose_engine()
@@ -0,0 +1,50 @@
+"""Fills the friend timelines from the existing friendships and trainings.
+
+Timelines are written when trainings are created and friendships accepted, run
+this once for the data that predates them: `python -m app.backfill_timelines`.
+It can be rerun safely, entries already on a timeline are skipped.
+"""
+import argparse
+import asyncio
+import logging
+
+from app.config import TIMELINE_BACKFILL_BATCH_SIZE
+from app.database import dispose_engine
+from app.domain.repositories.timeline_repository import TimelineRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def backfill_timelines(batch_size: int) -> int:
+    # Every batch of viewers is committed on its own.
+    written_count = 0
+    last_user_id = None
+    while True:
+        async with TimelineRepository() as repository:
+            last_user_id, batch_written_count = await repository.backfill_timelines(
+                after=last_user_id, limit=batch_size
+            )
+        written_count += batch_written_count
+        if last_user_id is None:
+            return written_count
+        logger.info(
+            "Backfilled timelines up to user %s, %d entries written",
+            last_user_id,
+            written_count,
+        )
+
+
+async def main(batch_size: int):
+    try:
+        written_count = await backfill_timelines(batch_size=batch_size)
+    finally:
+        await dispose_engine()
+    logger.info("Timelines backfilled, %d entries written", written_count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=TIMELINE_BACKFILL_BATCH_SIZE)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(batch_size=args.batch_size))
@@ -0,0 +1,47 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """In-process cache evicting the least recently used key when full.
+
+    Entries also expire `ttl_in_seconds` after they were set, the cache is per
+    process so this bounds how long another process' change can go unnoticed.
+    """
+
+    def __init__(self, max_size: int, ttl_in_seconds: float):
+        self.max_size = max_size
+        self.ttl_in_seconds = ttl_in_seconds
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl_in_seconds: float | None = None):
+        if ttl_in_seconds is None:
+            ttl_in_seconds = self.ttl_in_seconds
+        self._entries[key] = (time.monotonic() + ttl_in_seconds, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
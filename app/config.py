@@ -1,5 +1,10 @@
 import os
 
+
+def get_bool_from_env(name: str, default: bool) -> bool:
+    return os.environ.get(name, str(default)).lower() == "true"
+
+
 # Postgres database
 POSTGRES_USER = os.environ["POSTGRES_USER"]
 POSTGRES_PASSWORD = os.environ["POSTGRES_PASSWORD"]
@@ -7,16 +12,115 @@ POSTGRES_HOST = os.environ["POSTGRES_HOST"]
 POSTGRES_PORT = os.environ["POSTGRES_PORT"]
 POSTGRES_DB = os.environ["POSTGRES_DB"]
 
+# Database engine
+DATABASE_ECHO = get_bool_from_env("DATABASE_ECHO", False)
+DATABASE_POOL_ENABLED = get_bool_from_env("DATABASE_POOL_ENABLED", True)
+DATABASE_POOL_SIZE = int(os.environ.get("DATABASE_POOL_SIZE", "10"))
+DATABASE_POOL_MAX_OVERFLOW = int(os.environ.get("DATABASE_POOL_MAX_OVERFLOW", "10"))
+DATABASE_POOL_TIMEOUT_IN_SECONDS = int(
+    os.environ.get("DATABASE_POOL_TIMEOUT_IN_SECONDS", "30")
+)
+DATABASE_POOL_RECYCLE_IN_SECONDS = int(
+    os.environ.get("DATABASE_POOL_RECYCLE_IN_SECONDS", "1800")
+)
+DATABASE_POOL_PRE_PING = get_bool_from_env("DATABASE_POOL_PRE_PING", True)
+
+# SQL instrumentation
+SQL_DEBUG_HEADER = "X-Debug-SQL"
+SQL_DEBUG_HEADER_ENABLED = get_bool_from_env("SQL_DEBUG_HEADER_ENABLED", False)
+SQL_REPEATED_STATEMENT_THRESHOLD = int(
+    os.environ.get("SQL_REPEATED_STATEMENT_THRESHOLD", "3")
+)
+
 # JWT
 JWT_SECRET = os.environ["JWT_SECRET"]
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRE_TIME_IN_MINUTES = 15
+JWT_CACHE_SIZE = int(os.environ.get("JWT_CACHE_SIZE", "10000"))
 
 # RabbitMQ
 RABBITMQ_USER = "guest"
 RABBITMQ_PASSWORD = "guest"
 RABBITMQ_HOST = "rabbitmq"
 RABBITMQ_URL = f"amqp://{RABBITMQ_USER}:{RABBITMQ_PASSWORD}@{RABBITMQ_HOST}/"
+RABBITMQ_CHANNEL_POOL_SIZE = int(os.environ.get("RABBITMQ_CHANNEL_POOL_SIZE", "10"))
+RABBITMQ_TRAININGS_EXCHANGE = "trainings"
+RABBITMQ_SUBSCRIBER_QUEUE_SIZE = int(
+    os.environ.get("RABBITMQ_SUBSCRIBER_QUEUE_SIZE", "100")
+)
+
+# Reactions
+REACTION_WRITE_FLUSH_INTERVAL_IN_MILLISECONDS = int(
+    os.environ.get("REACTION_WRITE_FLUSH_INTERVAL_IN_MILLISECONDS", "10")
+)
+REACTION_WRITE_MAX_BATCH_SIZE = int(
+    os.environ.get("REACTION_WRITE_MAX_BATCH_SIZE", "500")
+)
+REACTION_COUNTS_RECONCILIATION_INTERVAL_IN_SECONDS = int(
+    os.environ.get("REACTION_COUNTS_RECONCILIATION_INTERVAL_IN_SECONDS", "3600")
+)
+REACTION_COUNTS_RECONCILIATION_BATCH_SIZE = int(
+    os.environ.get("REACTION_COUNTS_RECONCILIATION_BATCH_SIZE", "1000")
+)
+
+# Timelines
+# Trainings of authors with more friends are merged into the feeds when read
+# instead of being written to every friend's timeline.
+FEED_FAN_OUT_MAX_FRIENDS = int(os.environ.get("FEED_FAN_OUT_MAX_FRIENDS", "1000"))
+# Friends per fan-out subtask, and how many times a failed subtask is retried.
+FEED_FAN_OUT_CHUNK_SIZE = int(os.environ.get("FEED_FAN_OUT_CHUNK_SIZE", "100"))
+FEED_FAN_OUT_CHUNK_MAX_RETRIES = int(
+    os.environ.get("FEED_FAN_OUT_CHUNK_MAX_RETRIES", "5")
+)
+TIMELINE_BACKFILL_BATCH_SIZE = int(
+    os.environ.get("TIMELINE_BACKFILL_BATCH_SIZE", "1000")
+)
+
+# Outbox
+# Messages sent per relay transaction, and how long the relay waits for new
+# messages once the outbox is drained.
+OUTBOX_RELAY_BATCH_SIZE = int(os.environ.get("OUTBOX_RELAY_BATCH_SIZE", "500"))
+OUTBOX_RELAY_POLL_INTERVAL_IN_MILLISECONDS = int(
+    os.environ.get("OUTBOX_RELAY_POLL_INTERVAL_IN_MILLISECONDS", "200")
+)
+
+# Caches
+TRAINING_CACHE_SIZE = int(os.environ.get("TRAINING_CACHE_SIZE", "10000"))
+TRAINING_CACHE_TTL_IN_SECONDS = int(
+    os.environ.get("TRAINING_CACHE_TTL_IN_SECONDS", "60")
+)
+FRIENDSHIP_CACHE_SIZE = int(os.environ.get("FRIENDSHIP_CACHE_SIZE", "10000"))
+FRIENDSHIP_CACHE_TTL_IN_SECONDS = int(
+    os.environ.get("FRIENDSHIP_CACHE_TTL_IN_SECONDS", "60")
+)
+
+# Friendship graph
+# Keeps the friendships in the memory of every API process, see
+# app.domain.services.friendship_graph_sync.
+FRIENDSHIP_GRAPH_ENABLED = get_bool_from_env("FRIENDSHIP_GRAPH_ENABLED", False)
+FRIENDSHIP_GRAPH_LOAD_BATCH_SIZE = int(
+    os.environ.get("FRIENDSHIP_GRAPH_LOAD_BATCH_SIZE", "10000")
+)
+# The graph is loaded again on this interval, friendship events lost in
+# between (a broker outage) are then picked up.
+FRIENDSHIP_GRAPH_RELOAD_INTERVAL_IN_SECONDS = int(
+    os.environ.get("FRIENDSHIP_GRAPH_RELOAD_INTERVAL_IN_SECONDS", "3600")
+)
+
+# Friend suggestions
+# Suggestions stored per user, users computed per batch, and how often all of
+# them are computed again.
+FRIEND_SUGGESTIONS_PER_USER = int(os.environ.get("FRIEND_SUGGESTIONS_PER_USER", "50"))
+FRIEND_SUGGESTIONS_BATCH_SIZE = int(
+    os.environ.get("FRIEND_SUGGESTIONS_BATCH_SIZE", "1000")
+)
+FRIEND_SUGGESTIONS_INTERVAL_IN_SECONDS = int(
+    os.environ.get("FRIEND_SUGGESTIONS_INTERVAL_IN_SECONDS", "21600")
+)
 
 # Passwords
 PASSWORD_MIN_LENGTH = 8
+PASSWORD_HASHING_POOL_SIZE = int(os.environ.get("PASSWORD_HASHING_POOL_SIZE", "2"))
+PASSWORD_HASHING_MAX_QUEUE_SIZE = int(
+    os.environ.get("PASSWORD_HASHING_MAX_QUEUE_SIZE", "64")
+)
@@ -1,3 +1,11 @@
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
@@ -10,10 +18,90 @@ database_url = (
 )
 
 
+def get_engine_options() -> dict:
+    if not config.DATABASE_POOL_ENABLED:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": config.DATABASE_POOL_SIZE,
+        "max_overflow": config.DATABASE_POOL_MAX_OVERFLOW,
+        "pool_timeout": config.DATABASE_POOL_TIMEOUT_IN_SECONDS,
+        "pool_recycle": config.DATABASE_POOL_RECYCLE_IN_SECONDS,
+        "pool_pre_ping": config.DATABASE_POOL_PRE_PING,
+    }
+
+
 engine = create_async_engine(
     database_url,
-    echo=True,
-    poolclass=NullPool,
+    echo=config.DATABASE_ECHO,
+    **get_engine_options(),
 )
 
 async_session = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+
+class QueryRecorder:
+    """SQL statements executed while recording, with their duration in seconds."""
+
+    def __init__(self):
+        self.statements: list[tuple[str, float]] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def total_duration(self) -> float:
+        return sum(duration for _, duration in self.statements)
+
+    def get_repeated_statements(self, min_count: int) -> dict[str, int]:
+        # The same statement executed again and again within one operation is
+        # usually a resolver querying row by row instead of through a loader.
+        counts = Counter(statement for statement, _ in self.statements)
+        return {
+            statement: count
+            for statement, count in counts.items()
+            if count >= min_count
+        }
+
+
+query_recorder: ContextVar[QueryRecorder | None] = ContextVar(
+    "query_recorder", default=None
+)
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryRecorder]:
+    recorder = QueryRecorder()
+    token = query_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        query_recorder.reset(token)
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def start_query_timer(connection, cursor, statement, parameters, context, executemany):
+    if query_recorder.get() is not None:
+        connection.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def record_query(connection, cursor, statement, parameters, context, executemany):
+    recorder = query_recorder.get()
+    if recorder is not None and connection.info.get("query_start_times"):
+        start_time = connection.info["query_start_times"].pop()
+        recorder.statements.append((statement, time.perf_counter() - start_time))
+
+
+def reset_engine_pool_after_fork():
+    # Connections inherited from the parent process (e.g. celery prefork pool)
+    # must not be shared, so the child starts with an empty pool without closing
+    # sockets that still belong to the parent.
+    engine.sync_engine.dispose(close=False)
+
+
+async def dispose_engine():
+    await engine.dispose()
+
+
+os.register_at_fork(after_in_child=reset_engine_pool_after_fork)
@@ -4,7 +4,11 @@ from typing import Optional
 from uuid import UUID
 
 from app import models
-from app.enums import FriendshipRequestStatusEnum, ReactionTypeEnum
+from app.enums import (
+    FriendshipRequestStatusEnum,
+    ReactionTypeEnum,
+    TrainingVisibilityEnum,
+)
 
 
 @dataclass
@@ -26,6 +30,25 @@ class Training:
         )
 
 
+@dataclass
+class TrainingWithVisibility(Training):
+    # The training's own visibility, or its author's default when it has none.
+    visibility: TrainingVisibilityEnum = None
+
+    @classmethod
+    def from_model(
+        cls, model_instance: models.Training, visibility: TrainingVisibilityEnum
+    ):
+        return cls(
+            id=model_instance.id,
+            start_time=model_instance.start_time,
+            end_time=model_instance.end_time,
+            name=model_instance.name,
+            user_id=model_instance.user_id,
+            visibility=visibility,
+        )
+
+
 @dataclass
 class Reaction:
     id: UUID
@@ -81,3 +104,31 @@ class FriendshipRequest:
             timestamp=model_instance.timestamp,
             status=model_instance.status,
         )
+
+
+@dataclass
+class OutboxMessage:
+    id: int
+    task: str
+    kwargs: dict
+
+    @classmethod
+    def from_model(cls, model_instance: models.OutboxMessage):
+        return cls(
+            id=model_instance.id,
+            task=model_instance.task,
+            kwargs=model_instance.kwargs,
+        )
+
+
+@dataclass
+class FriendSuggestion:
+    user_id: UUID
+    mutual_friends_count: int
+
+    @classmethod
+    def from_model(cls, model_instance: models.FriendSuggestion):
+        return cls(
+            user_id=model_instance.suggested_user_id,
+            mutual_friends_count=model_instance.mutual_friends_count,
+        )
@@ -0,0 +1,56 @@
+from datetime import datetime
+from uuid import UUID
+
+from app.domain import entities
+from app.enums import TrainingVisibilityEnum
+
+NEW_TRAINING_EVENT_VERSION = 1
+NEW_FRIENDSHIP_EVENT_VERSION = 1
+
+
+def dump_new_training_event(training: entities.TrainingWithVisibility) -> dict:
+    return {
+        "version": NEW_TRAINING_EVENT_VERSION,
+        "training": {
+            "id": str(training.id),
+            "user_id": str(training.user_id),
+            "name": training.name,
+            "start_time": training.start_time.isoformat(),
+            "end_time": training.end_time.isoformat() if training.end_time else None,
+            "visibility": training.visibility.value,
+        },
+    }
+
+
+def load_new_training_event(event: dict) -> entities.TrainingWithVisibility | None:
+    """Returns None for events of another version, which are skipped."""
+    if event.get("version") != NEW_TRAINING_EVENT_VERSION:
+        return None
+    training = event["training"]
+    return entities.TrainingWithVisibility(
+        id=UUID(training["id"]),
+        user_id=UUID(training["user_id"]),
+        name=training["name"],
+        start_time=datetime.fromisoformat(training["start_time"]),
+        end_time=(
+            datetime.fromisoformat(training["end_time"])
+            if training["end_time"]
+            else None
+        ),
+        visibility=TrainingVisibilityEnum(training["visibility"]),
+    )
+
+
+def dump_new_friendship_event(user_1_id: UUID, user_2_id: UUID) -> dict:
+    return {
+        "version": NEW_FRIENDSHIP_EVENT_VERSION,
+        "friendship": {"user_1_id": str(user_1_id), "user_2_id": str(user_2_id)},
+    }
+
+
+def load_new_friendship_event(event: dict) -> tuple[UUID, UUID] | None:
+    """Returns None for events of another version, which are skipped."""
+    if event.get("version") != NEW_FRIENDSHIP_EVENT_VERSION:
+        return None
+    friendship = event["friendship"]
+    return UUID(friendship["user_1_id"]), UUID(friendship["user_2_id"])
@@ -1,11 +1,38 @@
 from app.database import async_session
 
 
-class PostgresRepository:
+class UnitOfWork:
+    """Session and transaction shared by all repositories created with it.
+
+    Repositories only flush their changes, the transaction is committed once when
+    the unit of work exits without an exception and rolled back otherwise (also
+    when a failed flush was handled inside the block).
+    """
+
     async def __aenter__(self):
         self.session = async_session()
         await self.session.begin()
         return self
 
+    async def __aexit__(self, exc_type, *args, **kwargs):
+        try:
+            if exc_type is None and self.session.is_active:
+                await self.session.commit()
+        finally:
+            await self.session.close()
+
+
+class PostgresRepository:
+    def __init__(self, unit_of_work: UnitOfWork | None = None):
+        self._owns_unit_of_work = unit_of_work is None
+        self.unit_of_work = unit_of_work or UnitOfWork()
+
+    async def __aenter__(self):
+        if self._owns_unit_of_work:
+            await self.unit_of_work.__aenter__()
+        self.session = self.unit_of_work.session
+        return self
+
     async def __aexit__(self, *args, **kwargs):
-        await self.session.close()
+        if self._owns_unit_of_work:
+            await self.unit_of_work.__aexit__(*args, **kwargs)
@@ -0,0 +1,97 @@
+from uuid import UUID
+
+from sqlalchemy import Integer, and_, cast, delete, exists, func, insert, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+
+from app import enums, models
+from app.domain import entities
+from app.domain.repositories.base import PostgresRepository
+from app.domain.repositories.friendship_repository import FriendshipRepository
+
+
+class FriendSuggestionRepository(PostgresRepository):
+    async def replace_friend_suggestions(
+        self, suggestions: dict[UUID, list[tuple[UUID, int]]]
+    ):
+        """Replaces the suggestions of the users with the given (suggested user
+        id, mutual friends count) pairs."""
+        await self.session.execute(
+            delete(models.FriendSuggestion).where(
+                models.FriendSuggestion.user_id.in_(list(suggestions))
+            )
+        )
+        rows = [
+            (user_id, suggested_user_id, mutual_friends_count)
+            for user_id, user_suggestions in suggestions.items()
+            for suggested_user_id, mutual_friends_count in user_suggestions
+        ]
+        if not rows:
+            return
+        # Three array parameters whatever the number of rows, a multi-row VALUES
+        # would run into the bind parameters limit.
+        users_ids, suggested_users_ids, mutual_friends_counts = zip(*rows)
+        values = (
+            func.unnest(
+                cast(users_ids, ARRAY(PostgresUUID(as_uuid=True))),
+                cast(suggested_users_ids, ARRAY(PostgresUUID(as_uuid=True))),
+                cast(mutual_friends_counts, ARRAY(Integer)),
+            )
+            .table_valued("user_id", "suggested_user_id", "mutual_friends_count")
+            .render_derived()
+        )
+        sql = insert(models.FriendSuggestion).from_select(
+            ["user_id", "suggested_user_id", "mutual_friends_count"],
+            select(
+                values.c.user_id,
+                values.c.suggested_user_id,
+                values.c.mutual_friends_count,
+            ),
+        )
+
+        await self.session.execute(sql)
+
+    async def get_friend_suggestions(
+        self, user_id: UUID, limit: int
+    ) -> list[entities.FriendSuggestion]:
+        """The user's suggestions, most mutual friends first, without the users
+        who became friends or have a pending request with the user since they
+        were computed."""
+        suggested_user_id = models.FriendSuggestion.suggested_user_id
+        sql = (
+            select(models.FriendSuggestion)
+            .where(
+                models.FriendSuggestion.user_id == user_id,
+                suggested_user_id.not_in(
+                    FriendshipRepository.get_user_friends_ids_query(user_id)
+                ),
+                ~exists().where(
+                    models.FriendshipRequest.status
+                    == enums.FriendshipRequestStatusEnum.pending,
+                    # The expressions of the pending pair index.
+                    and_(
+                        func.least(
+                            models.FriendshipRequest.sender_id,
+                            models.FriendshipRequest.receiver_id,
+                        )
+                        == func.least(user_id, suggested_user_id),
+                        func.greatest(
+                            models.FriendshipRequest.sender_id,
+                            models.FriendshipRequest.receiver_id,
+                        )
+                        == func.greatest(user_id, suggested_user_id),
+                    ),
+                ),
+            )
+            .order_by(
+                models.FriendSuggestion.mutual_friends_count.desc(), suggested_user_id
+            )
+            .limit(limit)
+        )
+
+        suggestions = (await self.session.execute(sql)).scalars()
+
+        return [
+            entities.FriendSuggestion.from_model(suggestion)
+            for suggestion in suggestions
+        ]
@@ -1,18 +1,46 @@
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select, tuple_, union_all
 
 from app import models
 from app.domain.repositories.base import PostgresRepository
 
 
+def get_canonical_pair(user_1_id: UUID, user_2_id: UUID) -> tuple[UUID, UUID]:
+    """The (user_1_id, user_2_id) a friendship between the users is stored as.
+
+    Python orders UUIDs by their bytes like Postgres does.
+    """
+    return min(user_1_id, user_2_id), max(user_1_id, user_2_id)
+
+
 class FriendshipRepository(PostgresRepository):
     @staticmethod
     def get_user_friends_ids_query(user_id: UUID):
-        return select(models.Friendship.user_2_id).where(
-            models.Friendship.user_1_id == user_id
+        return union_all(
+            select(models.Friendship.user_2_id).where(
+                models.Friendship.user_1_id == user_id
+            ),
+            select(models.Friendship.user_1_id).where(
+                models.Friendship.user_2_id == user_id
+            ),
         )
 
+    @staticmethod
+    def get_friends_query():
+        """(user_id, friend_id) of every friendship, in both directions.
+
+        Conditions on user_id are pushed down into both sides of the UNION ALL,
+        each side is then served by its own index.
+        """
+        return union_all(
+            select(
+                models.Friendship.user_1_id.label("user_id"),
+                models.Friendship.user_2_id.label("friend_id"),
+            ),
+            select(models.Friendship.user_2_id, models.Friendship.user_1_id),
+        ).subquery("friends")
+
     async def get_user_friends_ids(self, user_id: UUID) -> set[UUID]:
         sql = self.get_user_friends_ids_query(user_id)
 
@@ -20,7 +48,60 @@ class FriendshipRepository(PostgresRepository):
 
         return {result[0] for result in results}
 
+    async def count_user_friends(self, user_id: UUID) -> int:
+        sql = select(func.count()).select_from(
+            self.get_user_friends_ids_query(user_id).subquery()
+        )
+
+        return (await self.session.execute(sql)).scalar_one()
+
+    async def get_friendships_page(
+        self, after: tuple[UUID, UUID] | None, limit: int
+    ) -> list[tuple[UUID, UUID]]:
+        """The next `limit` (user_1_id, user_2_id) after `after`, in primary key
+        order."""
+        sql = (
+            select(models.Friendship.user_1_id, models.Friendship.user_2_id)
+            .order_by(models.Friendship.user_1_id, models.Friendship.user_2_id)
+            .limit(limit)
+        )
+        if after:
+            sql = sql.where(
+                tuple_(models.Friendship.user_1_id, models.Friendship.user_2_id)
+                > tuple_(*after)
+            )
+
+        return [tuple(row) for row in (await self.session.execute(sql)).all()]
+
+    @classmethod
+    def get_friendships_around_user_query(cls, user_id: UUID):
+        """(user_1_id, user_2_id) of the friendships of the user and of the
+        user's friends, each once.
+
+        One side of the UNION ALL per column, the primary key serves user_1_id
+        and ix_friendship_user_2_id serves user_2_id. A friendship between two
+        friends of the user is only read by the first side.
+        """
+        friends_ids = cls.get_user_friends_ids_query(user_id).cte("friends_ids")
+        return union_all(
+            select(models.Friendship.user_1_id, models.Friendship.user_2_id).where(
+                models.Friendship.user_1_id.in_(select(friends_ids))
+            ),
+            select(models.Friendship.user_1_id, models.Friendship.user_2_id).where(
+                models.Friendship.user_2_id.in_(select(friends_ids)),
+                models.Friendship.user_1_id.not_in(select(friends_ids)),
+            ),
+        )
+
+    async def get_friendships_around_user(
+        self, user_id: UUID
+    ) -> list[tuple[UUID, UUID]]:
+        sql = self.get_friendships_around_user_query(user_id)
+
+        return [tuple(row) for row in (await self.session.execute(sql)).all()]
+
     async def are_users_friends(self, user_1_id: UUID, user_2_id: UUID) -> bool:
+        user_1_id, user_2_id = get_canonical_pair(user_1_id, user_2_id)
         sql = select(models.Friendship).where(
             models.Friendship.user_1_id == user_1_id,
             models.Friendship.user_2_id == user_2_id,
@@ -29,8 +110,3 @@ class FriendshipRepository(PostgresRepository):
         results = (await self.session.execute(sql)).all()
 
         return bool(results)
-
-    async def create_friendship(self, user_1_id: UUID, user_2_id: UUID):
-        friendship = models.Friendship(user_1_id=user_1_id, user_2_id=user_2_id)
-        self.session.add(friendship)
-        await self.session.commit()
@@ -1,86 +1,224 @@
-from uuid import UUID
+from datetime import datetime
+from uuid import UUID, uuid4
 
-from sqlalchemy import and_, or_, select, update
+from sqlalchemy import and_, exists, func, literal, select, true, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 
 from app import enums, models
 from app.domain import entities
 from app.domain.repositories.base import PostgresRepository
+from app.domain.repositories.friendship_repository import get_canonical_pair
+from app.helpers import get_utc_now
 
 
 class FriendshipRequestRepository(PostgresRepository):
-    async def update_status(
-        self, friendship_request_id: UUID, status: enums.FriendshipRequestStatusEnum
+    def _get_update_pending_requests_query(
+        self,
+        friendship_request_ids: list[UUID],
+        status: enums.FriendshipRequestStatusEnum,
+        *whereclauses,
     ):
-        sql = (
+        # Rows are locked in id order so that concurrent batches can not deadlock.
+        # The conditions are evaluated again on the latest row version when a
+        # concurrent transaction changed a request first, so only one of them
+        # applies.
+        locked = (
+            select(models.FriendshipRequest.id)
+            .where(
+                models.FriendshipRequest.id.in_(friendship_request_ids),
+                models.FriendshipRequest.status
+                == enums.FriendshipRequestStatusEnum.pending,
+                *whereclauses,
+            )
+            .order_by(models.FriendshipRequest.id)
+            .with_for_update()
+        )
+        return (
             update(models.FriendshipRequest)
-            .where(models.FriendshipRequest.id == friendship_request_id)
+            .where(models.FriendshipRequest.id.in_(locked.scalar_subquery()))
             .values(status=status)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def accept_pending_requests(
+        self, friendship_request_ids: list[UUID], receiver_id: UUID
+    ) -> dict[UUID, UUID]:
+        """Accepts the requests and creates the friendships in one statement.
+
+        Returns the ids of the senders by the ids of the accepted requests, the
+        ones not pending or not received by the user are left as they are. A
+        request between users who are already friends is accepted as well.
+        """
+        accepted = (
+            self._get_update_pending_requests_query(
+                friendship_request_ids,
+                enums.FriendshipRequestStatusEnum.accepted,
+                models.FriendshipRequest.receiver_id == receiver_id,
+            )
+            .returning(
+                models.FriendshipRequest.id,
+                models.FriendshipRequest.sender_id,
+                models.FriendshipRequest.receiver_id,
+            )
+            .cte("accepted")
+        )
+        # Users may already be friends through legacy data, their request is
+        # accepted all the same, hence the outer join.
+        friendships = (
+            insert(models.Friendship)
+            .from_select(
+                ["user_1_id", "user_2_id"],
+                select(
+                    func.least(accepted.c.sender_id, accepted.c.receiver_id),
+                    func.greatest(accepted.c.sender_id, accepted.c.receiver_id),
+                ),
+            )
+            .on_conflict_do_nothing()
+            .returning(models.Friendship.user_1_id, models.Friendship.user_2_id)
+            .cte("friendships")
+        )
+        sql = select(accepted.c.id, accepted.c.sender_id).outerjoin(
+            friendships,
+            and_(
+                friendships.c.user_1_id
+                == func.least(accepted.c.sender_id, accepted.c.receiver_id),
+                friendships.c.user_2_id
+                == func.greatest(accepted.c.sender_id, accepted.c.receiver_id),
+            ),
         )
 
-        await self.session.execute(sql)
-        await self.session.commit()
+        return dict((await self.session.execute(sql)).all())
 
-    async def get_request_by_id(
-        self, friendship_request_id: UUID
-    ) -> entities.FriendshipRequest | None:
-        sql = select(models.FriendshipRequest).where(
-            models.FriendshipRequest.id == friendship_request_id
+    async def accept_pending_request(
+        self, friendship_request_id: UUID, receiver_id: UUID
+    ) -> UUID | None:
+        """Returns the id of the sender, or None when the request is not pending or
+        was not received by the user."""
+        accepted = await self.accept_pending_requests(
+            friendship_request_ids=[friendship_request_id], receiver_id=receiver_id
         )
+        return accepted.get(friendship_request_id)
 
-        results = (await self.session.execute(sql)).scalar()
+    async def reject_pending_requests(
+        self, friendship_request_ids: list[UUID], receiver_id: UUID
+    ) -> set[UUID]:
+        sql = self._get_update_pending_requests_query(
+            friendship_request_ids,
+            enums.FriendshipRequestStatusEnum.rejected,
+            models.FriendshipRequest.receiver_id == receiver_id,
+        ).returning(models.FriendshipRequest.id)
 
-        if results:
-            return entities.FriendshipRequest.from_model(results[0])
+        return set((await self.session.execute(sql)).scalars())
 
-    async def does_pending_request_exist(
-        self, user_1_id: UUID, user_2_id: UUID
+    async def reject_pending_request(
+        self, friendship_request_id: UUID, receiver_id: UUID
     ) -> bool:
-        sql = self._get_pending_requests_query().where(
-            or_(
-                and_(
-                    models.FriendshipRequest.sender_id == user_1_id,
-                    models.FriendshipRequest.receiver_id == user_2_id,
-                ),
-                and_(
-                    models.FriendshipRequest.sender_id == user_2_id,
-                    models.FriendshipRequest.receiver_id == user_1_id,
-                ),
-            ),
+        return friendship_request_id in await self.reject_pending_requests(
+            friendship_request_ids=[friendship_request_id], receiver_id=receiver_id
         )
 
-        results = (await self.session.execute(sql)).first()
+    async def cancel_pending_requests(
+        self, friendship_request_ids: list[UUID], sender_id: UUID
+    ) -> set[UUID]:
+        sql = self._get_update_pending_requests_query(
+            friendship_request_ids,
+            enums.FriendshipRequestStatusEnum.cancelled,
+            models.FriendshipRequest.sender_id == sender_id,
+        ).returning(models.FriendshipRequest.id)
+
+        return set((await self.session.execute(sql)).scalars())
 
-        return bool(results)
+    async def cancel_pending_request(
+        self, friendship_request_id: UUID, sender_id: UUID
+    ) -> bool:
+        return friendship_request_id in await self.cancel_pending_requests(
+            friendship_request_ids=[friendship_request_id], sender_id=sender_id
+        )
 
     async def create_pending_request(
         self, sender_id: UUID, receiver_id: UUID
-    ) -> entities.FriendshipRequest:
-        friendship_request = models.FriendshipRequest(
-            sender_id=sender_id,
-            receiver_id=receiver_id,
-            status=enums.FriendshipRequestStatusEnum.pending,
+    ) -> tuple[entities.FriendshipRequest | None, bool, bool]:
+        """Creates the request in one statement, unless it can not be sent.
+
+        Returns the created request, whether the receiver exists and whether the
+        users are already friends. No request is created when the receiver does
+        not exist, the users are friends or a request between them is pending.
+        """
+        user_1_id, user_2_id = get_canonical_pair(sender_id, receiver_id)
+        checks = select(
+            exists().where(models.User.id == receiver_id).label("does_receiver_exist"),
+            exists()
+            .where(
+                models.Friendship.user_1_id == user_1_id,
+                models.Friendship.user_2_id == user_2_id,
+            )
+            .label("are_users_friends"),
+        ).cte("checks")
+        columns = models.FriendshipRequest.__table__.c
+        created = (
+            insert(models.FriendshipRequest)
+            .from_select(
+                ["id", "sender_id", "receiver_id", "status", "timestamp"],
+                select(
+                    literal(uuid4(), columns.id.type),
+                    literal(sender_id, columns.sender_id.type),
+                    literal(receiver_id, columns.receiver_id.type),
+                    literal(
+                        enums.FriendshipRequestStatusEnum.pending, columns.status.type
+                    ),
+                    literal(get_utc_now(), columns.timestamp.type),
+                ).where(checks.c.does_receiver_exist, ~checks.c.are_users_friends),
+            )
+            # Skipped when a request between the users, sent by either of them, is
+            # pending.
+            .on_conflict_do_nothing(
+                index_elements=[
+                    func.least(columns.sender_id, columns.receiver_id),
+                    func.greatest(columns.sender_id, columns.receiver_id),
+                ],
+                index_where=columns.status == enums.FriendshipRequestStatusEnum.pending,
+            )
+            .returning(*columns)
+            .cte("created")
         )
-        self.session.add(friendship_request)
-        await self.session.commit()
-        return entities.FriendshipRequest.from_model(friendship_request)
+        sql = select(
+            checks.c.does_receiver_exist, checks.c.are_users_friends, created
+        ).outerjoin(created, true())
 
-    def _get_pending_requests_query(self):
-        return (
+        result = (await self.session.execute(sql)).one()
+
+        friendship_request = (
+            entities.FriendshipRequest.from_model(result) if result.id else None
+        )
+        return friendship_request, result.does_receiver_exist, result.are_users_friends
+
+    def _get_pending_requests_query(self, after: tuple[datetime, UUID] | None = None):
+        """Pending requests, oldest first.
+
+        `after` is the (timestamp, id) of the last request already seen, rows are
+        sought past it in the pending request indexes.
+        """
+        sql = (
             select(models.FriendshipRequest)
             .where(
                 models.FriendshipRequest.status
                 == enums.FriendshipRequestStatusEnum.pending,
             )
-            .order_by(models.FriendshipRequest.timestamp)
+            .order_by(models.FriendshipRequest.timestamp, models.FriendshipRequest.id)
         )
+        if after:
+            sql = sql.where(
+                tuple_(models.FriendshipRequest.timestamp, models.FriendshipRequest.id)
+                > tuple_(*after)
+            )
+        return sql
 
-    async def get_pending_requests_received_by_user(
-        self, user_id: UUID
-    ) -> list[entities.FriendshipRequest]:
-        sql = self._get_pending_requests_query().where(
-            models.FriendshipRequest.receiver_id == user_id
+    def _count_pending_requests_query(self):
+        return select(func.count()).where(
+            models.FriendshipRequest.status == enums.FriendshipRequestStatusEnum.pending
         )
 
+    async def _get_pending_requests(self, sql) -> list[entities.FriendshipRequest]:
         friendship_requests = (await self.session.execute(sql)).scalars()
 
         return [
@@ -88,16 +226,68 @@ class FriendshipRequestRepository(PostgresRepository):
             for friendship_request in friendship_requests
         ]
 
+    def get_pending_requests_received_by_user_query(
+        self, user_id: UUID, after: tuple[datetime, UUID] | None = None
+    ):
+        return self._get_pending_requests_query(after=after).where(
+            models.FriendshipRequest.receiver_id == user_id
+        )
+
+    async def get_pending_requests_received_by_user(
+        self, user_id: UUID
+    ) -> list[entities.FriendshipRequest]:
+        return await self._get_pending_requests(
+            self.get_pending_requests_received_by_user_query(user_id)
+        )
+
+    async def get_pending_requests_received_by_user_page(
+        self, user_id: UUID, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> list[entities.FriendshipRequest]:
+        return await self._get_pending_requests(
+            self.get_pending_requests_received_by_user_query(
+                user_id, after=after
+            ).limit(limit)
+        )
+
+    def count_pending_requests_received_by_user_query(self, user_id: UUID):
+        return self._count_pending_requests_query().where(
+            models.FriendshipRequest.receiver_id == user_id
+        )
+
+    async def count_pending_requests_received_by_user(self, user_id: UUID) -> int:
+        sql = self.count_pending_requests_received_by_user_query(user_id)
+
+        return (await self.session.execute(sql)).scalar_one()
+
+    def get_pending_requests_sent_by_user_query(
+        self, user_id: UUID, after: tuple[datetime, UUID] | None = None
+    ):
+        return self._get_pending_requests_query(after=after).where(
+            models.FriendshipRequest.sender_id == user_id
+        )
+
     async def get_pending_requests_sent_by_user(
         self, user_id: UUID
     ) -> list[entities.FriendshipRequest]:
-        sql = self._get_pending_requests_query().where(
+        return await self._get_pending_requests(
+            self.get_pending_requests_sent_by_user_query(user_id)
+        )
+
+    async def get_pending_requests_sent_by_user_page(
+        self, user_id: UUID, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> list[entities.FriendshipRequest]:
+        return await self._get_pending_requests(
+            self.get_pending_requests_sent_by_user_query(user_id, after=after).limit(
+                limit
+            )
+        )
+
+    def count_pending_requests_sent_by_user_query(self, user_id: UUID):
+        return self._count_pending_requests_query().where(
             models.FriendshipRequest.sender_id == user_id
         )
 
-        friendship_requests = (await self.session.execute(sql)).scalars()
+    async def count_pending_requests_sent_by_user(self, user_id: UUID) -> int:
+        sql = self.count_pending_requests_sent_by_user_query(user_id)
 
-        return [
-            entities.FriendshipRequest.from_model(friendship_request)
-            for friendship_request in friendship_requests
-        ]
+        return (await self.session.execute(sql)).scalar_one()
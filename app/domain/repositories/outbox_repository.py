@@ -0,0 +1,43 @@
+from sqlalchemy import delete, insert, select
+
+from app import models
+from app.domain import entities
+from app.domain.repositories.base import PostgresRepository
+
+
+class OutboxRepository(PostgresRepository):
+    async def add_message(self, task: str, kwargs: dict):
+        sql = insert(models.OutboxMessage).values(task=task, kwargs=kwargs)
+
+        await self.session.execute(sql)
+
+    async def add_messages(self, task: str, kwargs_list: list[dict]):
+        if not kwargs_list:
+            return
+        sql = insert(models.OutboxMessage).values(
+            [{"task": task, "kwargs": kwargs} for kwargs in kwargs_list]
+        )
+
+        await self.session.execute(sql)
+
+    async def lock_messages(self, limit: int) -> list[entities.OutboxMessage]:
+        """The oldest `limit` messages, locked until the transaction ends.
+
+        Messages another relay has locked are skipped instead of waited for,
+        so relays running side by side take disjoint batches.
+        """
+        sql = (
+            select(models.OutboxMessage)
+            .order_by(models.OutboxMessage.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        messages = (await self.session.execute(sql)).scalars()
+
+        return [entities.OutboxMessage.from_model(message) for message in messages]
+
+    async def delete_messages(self, ids: list[int]):
+        sql = delete(models.OutboxMessage).where(models.OutboxMessage.id.in_(ids))
+
+        await self.session.execute(sql)
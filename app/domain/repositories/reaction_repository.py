@@ -1,48 +1,146 @@
 from collections import defaultdict
-from uuid import UUID
+from datetime import datetime
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import and_, delete, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.sql.functions import count
 
 from app import models
 from app.domain import entities
 from app.domain.repositories.base import PostgresRepository
+from app.enums import ReactionTypeEnum
 
 
 class ReactionRepository(PostgresRepository):
+    @staticmethod
+    def get_reaction_count_by_training_ids_query(training_ids: list[UUID]):
+        # The counters are kept up to date by triggers on reaction.
+        return select(
+            models.Training.id,
+            models.Training.likes_count + models.Training.dislikes_count,
+        ).where(models.Training.id.in_(training_ids))
+
     async def get_reaction_count_by_training_ids(
         self, training_ids: list[UUID]
     ) -> list[int]:
-        reactions_query = (
-            select(
-                models.Reaction.training_id,
-            )
-            .where(models.Reaction.training_id.in_(training_ids))
-            .subquery()
-        )
-        sql = (
-            select(reactions_query.c.training_id, count(reactions_query.c.training_id))
-            .group_by(reactions_query.c.training_id)
-            .select_from(reactions_query)
-        )
+        sql = self.get_reaction_count_by_training_ids_query(training_ids)
 
         counts = (await self.session.execute(sql)).all()
 
         counts_dict = {c[0]: c[1] for c in counts}
         return [counts_dict.get(training_id, 0) for training_id in training_ids]
 
-    async def get_reactions_by_training_ids(
-        self, training_ids: list[UUID]
-    ) -> list[list[entities.Reaction]]:
-        sql = (
+    @staticmethod
+    def get_reactions_by_training_ids_query(training_ids: list[UUID]):
+        return (
             select(models.Reaction)
             .where(models.Reaction.training_id.in_(training_ids))
             .order_by(models.Reaction.created_at.desc())
         )
 
+    async def get_reactions_by_training_ids(
+        self, training_ids: list[UUID]
+    ) -> list[list[entities.Reaction]]:
+        sql = self.get_reactions_by_training_ids_query(training_ids)
+
         reactions = (await self.session.execute(sql)).scalars()
 
         results = defaultdict(list)
         for reaction in reactions:
             results[reaction.training_id].append(entities.Reaction.from_model(reaction))
         return [results.get(training_id, []) for training_id in training_ids]
+
+    async def upsert_reactions(
+        self, reactions: list[tuple[UUID, UUID, ReactionTypeEnum, datetime]]
+    ):
+        """Creates or changes the (user_id, training_id, reaction_type, created_at)
+        reactions in one statement."""
+        sql = insert(models.Reaction).values(
+            [
+                {
+                    "id": uuid4(),
+                    "user_id": user_id,
+                    "training_id": training_id,
+                    "reaction_type": reaction_type,
+                    "created_at": created_at,
+                }
+                for user_id, training_id, reaction_type, created_at in reactions
+            ]
+        )
+        sql = sql.on_conflict_do_update(
+            index_elements=[models.Reaction.user_id, models.Reaction.training_id],
+            set_={
+                "reaction_type": sql.excluded.reaction_type,
+                "created_at": sql.excluded.created_at,
+            },
+            # Reacting again the same way leaves the row, and the counters, alone.
+            where=models.Reaction.reaction_type != sql.excluded.reaction_type,
+        )
+        await self.session.execute(sql)
+
+    async def delete_reactions(self, user_and_training_ids: list[tuple[UUID, UUID]]):
+        await self.session.execute(
+            delete(models.Reaction)
+            .where(
+                tuple_(models.Reaction.user_id, models.Reaction.training_id).in_(
+                    user_and_training_ids
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def reconcile_reaction_counts(
+        self, after: UUID | None, limit: int
+    ) -> tuple[UUID | None, int]:
+        """Recounts the reactions of the next `limit` trainings by id.
+
+        The trainings are locked before counting, a reaction inserted
+        concurrently is then either counted here or applied by its trigger once
+        the lock is released, never both or neither. Returns the last training
+        id of the batch (None when there are no more trainings) and the number
+        of trainings whose counters were repaired.
+        """
+        sql = select(models.Training.id).order_by(models.Training.id).limit(limit)
+        if after:
+            sql = sql.where(models.Training.id > after)
+        training_ids = (
+            (await self.session.execute(sql.with_for_update(key_share=True)))
+            .scalars()
+            .all()
+        )
+        if not training_ids:
+            return None, 0
+        counts = (
+            select(
+                models.Training.id.label("training_id"),
+                count(models.Reaction.id)
+                .filter(models.Reaction.reaction_type == ReactionTypeEnum.like)
+                .label("likes_count"),
+                count(models.Reaction.id)
+                .filter(models.Reaction.reaction_type == ReactionTypeEnum.dislike)
+                .label("dislikes_count"),
+            )
+            .outerjoin(models.Reaction)
+            .where(models.Training.id.in_(training_ids))
+            .group_by(models.Training.id)
+            .subquery()
+        )
+        result = await self.session.execute(
+            update(models.Training)
+            .where(
+                and_(
+                    models.Training.id == counts.c.training_id,
+                    or_(
+                        models.Training.likes_count != counts.c.likes_count,
+                        models.Training.dislikes_count != counts.c.dislikes_count,
+                    ),
+                )
+            )
+            .values(
+                likes_count=counts.c.likes_count,
+                dislikes_count=counts.c.dislikes_count,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return training_ids[-1], result.rowcount
@@ -0,0 +1,217 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import cast, func, select, true, tuple_, union
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.functions import coalesce
+
+from app import models
+from app.domain import entities
+from app.domain.repositories.base import PostgresRepository
+from app.domain.repositories.friendship_repository import FriendshipRepository
+from app.domain.repositories.training_repository import TrainingRepository
+from app.enums import TrainingVisibilityEnum
+
+
+class TimelineRepository(PostgresRepository):
+    def get_timeline_query(
+        self, viewer_id: UUID, limit: int, after: tuple[datetime, UUID] | None = None
+    ):
+        """The first `limit` trainings of the viewer's feed, newest first.
+
+        The feed is the viewer's timeline merged with the latest trainings of
+        their high fan-out friends, each side is cut to `limit` rows by its own
+        index before the merge. A training written to the timeline before its
+        author became a high fan-out one is on both sides, the UNION keeps it
+        once. `after` is the (start_time, id) of the last training already seen.
+        """
+        timeline_trainings = (
+            select(models.Training)
+            .join(
+                models.TimelineEntry,
+                models.TimelineEntry.training_id == models.Training.id,
+            )
+            .where(models.TimelineEntry.viewer_id == viewer_id)
+            .order_by(
+                models.TimelineEntry.start_time.desc(),
+                models.TimelineEntry.training_id.desc(),
+            )
+            .limit(limit)
+        )
+        if after:
+            timeline_trainings = timeline_trainings.where(
+                tuple_(
+                    models.TimelineEntry.start_time, models.TimelineEntry.training_id
+                )
+                < tuple_(*after)
+            )
+
+        # The author's profile is joined once here rather than once per
+        # training in the lateral.
+        high_fan_out_friends = (
+            self.get_high_fan_out_friends_ids_query(viewer_id)
+            .join(
+                models.Profile,
+                models.Profile.user_id == models.HighFanOutAuthor.user_id,
+            )
+            .add_columns(models.Profile.training_visibility)
+            .subquery()
+        )
+        author_trainings = (
+            select(models.Training)
+            .where(
+                models.Training.user_id == high_fan_out_friends.c.user_id,
+                coalesce(
+                    models.Training.visibility,
+                    high_fan_out_friends.c.training_visibility,
+                )
+                != TrainingVisibilityEnum.private,
+            )
+            .order_by(models.Training.start_time.desc(), models.Training.id.desc())
+            .limit(limit)
+        )
+        if after:
+            author_trainings = author_trainings.where(
+                tuple_(models.Training.start_time, models.Training.id) < tuple_(*after)
+            )
+        author_trainings = author_trainings.lateral()
+
+        feed = union(
+            timeline_trainings,
+            select(author_trainings).select_from(
+                high_fan_out_friends.join(author_trainings, true())
+            ),
+        ).subquery()
+        training = aliased(models.Training, feed)
+        return (
+            select(training)
+            .order_by(training.start_time.desc(), training.id.desc())
+            .limit(limit)
+        )
+
+    async def get_timeline_page(
+        self,
+        viewer_id: UUID,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[entities.Training]:
+        sql = self.get_timeline_query(viewer_id, limit=limit, after=after)
+        trainings = (await self.session.execute(sql)).scalars()
+        return [entities.Training.from_model(training) for training in trainings]
+
+    @staticmethod
+    def get_high_fan_out_friends_ids_query(user_id: UUID):
+        return select(models.HighFanOutAuthor.user_id).where(
+            models.HighFanOutAuthor.user_id.in_(
+                FriendshipRepository.get_user_friends_ids_query(user_id)
+            )
+        )
+
+    async def get_high_fan_out_friends_ids(self, user_id: UUID) -> set[UUID]:
+        sql = self.get_high_fan_out_friends_ids_query(user_id)
+        return set((await self.session.execute(sql)).scalars())
+
+    async def mark_high_fan_out_author(self, user_id: UUID):
+        sql = (
+            insert(models.HighFanOutAuthor)
+            .values(user_id=user_id)
+            .on_conflict_do_nothing()
+        )
+        await self.session.execute(sql)
+
+    @staticmethod
+    def get_friends_trainings_query(
+        viewers_ids: list[UUID], authors_ids: list[UUID] | None = None
+    ):
+        """(viewer_id, start_time, training_id) of every training the viewers can
+        see as a friend of its author, high fan-out authors excepted."""
+        friends = FriendshipRepository.get_friends_query()
+        sql = (
+            select(
+                friends.c.user_id,
+                models.Training.start_time,
+                models.Training.id,
+            )
+            .join(models.Training, models.Training.user_id == friends.c.friend_id)
+            .join(models.Profile, models.Profile.user_id == models.Training.user_id)
+            .where(
+                friends.c.user_id.in_(viewers_ids),
+                TrainingRepository.get_training_visibility_expression()
+                != TrainingVisibilityEnum.private,
+                models.Training.user_id.not_in(select(models.HighFanOutAuthor.user_id)),
+            )
+        )
+        if authors_ids is not None:
+            sql = sql.where(friends.c.friend_id.in_(authors_ids))
+        return sql
+
+    async def _insert_timeline_entries(self, friends_trainings) -> int:
+        sql = (
+            insert(models.TimelineEntry)
+            .from_select(["viewer_id", "start_time", "training_id"], friends_trainings)
+            .on_conflict_do_nothing()
+        )
+        result = await self.session.execute(sql)
+        return result.rowcount
+
+    async def add_training_to_timelines(
+        self, training_id: UUID, viewers_ids: list[UUID]
+    ) -> set[UUID]:
+        """Writes the training to the viewers' timelines in one statement.
+
+        Returns the viewers whose timeline did not have the training yet.
+        """
+        viewers = (
+            func.unnest(cast(viewers_ids, ARRAY(PostgresUUID(as_uuid=True))))
+            .table_valued("viewer_id")
+            .render_derived()
+        )
+        sql = (
+            insert(models.TimelineEntry)
+            .from_select(
+                ["viewer_id", "start_time", "training_id"],
+                select(
+                    viewers.c.viewer_id,
+                    models.Training.start_time,
+                    models.Training.id,
+                )
+                .select_from(viewers.join(models.Training, true()))
+                .where(models.Training.id == training_id),
+            )
+            .on_conflict_do_nothing()
+            .returning(models.TimelineEntry.viewer_id)
+        )
+        return set((await self.session.execute(sql)).scalars())
+
+    async def add_friends_trainings_to_timelines(
+        self, user_1_id: UUID, user_2_id: UUID
+    ) -> int:
+        """Writes the trainings of two new friends to each other's timeline."""
+        return await self._insert_timeline_entries(
+            self.get_friends_trainings_query(
+                viewers_ids=[user_1_id, user_2_id], authors_ids=[user_1_id, user_2_id]
+            )
+        )
+
+    async def backfill_timelines(
+        self, after: UUID | None, limit: int
+    ) -> tuple[UUID | None, int]:
+        """Fills the timelines of the next `limit` users by id with their friends'
+        trainings.
+
+        Returns the last user id of the batch (None when there are no more
+        users) and the number of timeline entries written.
+        """
+        sql = select(models.User.id).order_by(models.User.id).limit(limit)
+        if after:
+            sql = sql.where(models.User.id > after)
+        user_ids = (await self.session.execute(sql)).scalars().all()
+        if not user_ids:
+            return None, 0
+        written_count = await self._insert_timeline_entries(
+            self.get_friends_trainings_query(viewers_ids=user_ids)
+        )
+        return user_ids[-1], written_count
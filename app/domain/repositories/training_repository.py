@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, or_, select, tuple_
 from sqlalchemy.sql.functions import coalesce
 
 from app import models
@@ -23,20 +23,65 @@ class TrainingRepository(PostgresRepository):
             result = results[0]
             return entities.Training.from_model(result)
 
+    async def get_training_with_visibility(
+        self, training_id: UUID
+    ) -> entities.TrainingWithVisibility | None:
+        sql = (
+            select(models.Training, self.get_training_visibility_expression())
+            .join(models.User)
+            .join(models.Profile)
+            .where(models.Training.id == training_id)
+        )
+        result = (await self.session.execute(sql)).first()
+        if result:
+            training, visibility = result
+            return entities.TrainingWithVisibility.from_model(
+                training, visibility=visibility
+            )
+
     async def get_user_trainings(
         self, request_user_id: UUID, user_id: UUID
     ) -> list[entities.Training]:
-        sql = self.get_visible_trainings_for_user_query(request_user_id).where(
-            models.Training.user_id == user_id
+        sql = self.get_user_trainings_query(
+            request_user_id=request_user_id, user_id=user_id
         )
         trainings = (await self.session.execute(sql)).scalars()
         return [entities.Training.from_model(training) for training in trainings]
 
-    def get_visible_trainings_for_user_query(self, user_id):
-        training_visibility = coalesce(
-            models.Training.visibility, models.Profile.training_visibility
-        )
-        return (
+    async def get_user_trainings_page(
+        self,
+        request_user_id: UUID,
+        user_id: UUID,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[entities.Training]:
+        sql = self.get_user_trainings_query(
+            request_user_id=request_user_id, user_id=user_id, after=after
+        ).limit(limit)
+        trainings = (await self.session.execute(sql)).scalars()
+        return [entities.Training.from_model(training) for training in trainings]
+
+    def get_user_trainings_query(
+        self,
+        request_user_id: UUID,
+        user_id: UUID,
+        after: tuple[datetime, UUID] | None = None,
+    ):
+        return self.get_visible_trainings_for_user_query(
+            request_user_id, after=after
+        ).where(models.Training.user_id == user_id)
+
+    def get_visible_trainings_for_user_query(
+        self, user_id, after: tuple[datetime, UUID] | None = None
+    ):
+        """Trainings visible to the user, newest first.
+
+        `after` is the (start_time, id) of the last training already seen, rows
+        are sought past it instead of skipped with an offset, so every page costs
+        the same.
+        """
+        training_visibility = self.get_training_visibility_expression()
+        sql = (
             select(models.Training)
             .join(models.User)
             .join(models.Profile)
@@ -52,8 +97,17 @@ class TrainingRepository(PostgresRepository):
                     ),
                 ),
             )
-            .order_by(models.Training.start_time.desc())
+            .order_by(models.Training.start_time.desc(), models.Training.id.desc())
         )
+        if after:
+            sql = sql.where(
+                tuple_(models.Training.start_time, models.Training.id) < tuple_(*after)
+            )
+        return sql
+
+    @staticmethod
+    def get_training_visibility_expression():
+        return coalesce(models.Training.visibility, models.Profile.training_visibility)
 
     async def create_training(
         self, user_id: UUID, name: str, start_time: datetime, end_time: datetime | None
@@ -62,5 +116,5 @@ class TrainingRepository(PostgresRepository):
             user_id=user_id, name=name, start_time=start_time, end_time=end_time
         )
         self.session.add(training)
-        await self.session.commit()
+        await self.session.flush()
         return entities.Training.from_model(training)
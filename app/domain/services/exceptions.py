@@ -24,3 +24,7 @@ class UsersAreAlreadyFriends(AppError):
 
 class PendingFriendshipRequestDoesNotExist(AppError):
     message = "Pending request does not exist"
+
+
+class TrainingDoesNotExist(AppError):
+    message = "Training does not exist"
@@ -0,0 +1,74 @@
+from uuid import UUID
+
+from scipy.sparse import csr_matrix
+
+from app.config import (
+    FRIEND_SUGGESTIONS_BATCH_SIZE,
+    FRIEND_SUGGESTIONS_PER_USER,
+    FRIENDSHIP_GRAPH_LOAD_BATCH_SIZE,
+)
+from app.domain import entities
+from app.domain.repositories.friend_suggestion_repository import (
+    FriendSuggestionRepository,
+)
+from app.domain.repositories.friendship_repository import FriendshipRepository
+from app.domain.services.friendship_graph_sync import load_friendship_graph
+from app.friend_suggestions import get_adjacency_matrix, rank_friend_suggestions
+from app.friendship_graph import FriendshipGraph
+
+
+class FriendSuggestionService:
+    @staticmethod
+    async def get_friend_suggestions(
+        user_id: UUID, limit: int
+    ) -> list[entities.FriendSuggestion]:
+        async with FriendSuggestionRepository() as repository:
+            return await repository.get_friend_suggestions(user_id=user_id, limit=limit)
+
+    @staticmethod
+    async def _rank_and_store(
+        graph: FriendshipGraph, adjacency: csr_matrix, users_indexes: list[int]
+    ):
+        ranked_suggestions = rank_friend_suggestions(
+            adjacency, users_indexes, limit=FRIEND_SUGGESTIONS_PER_USER
+        )
+        async with FriendSuggestionRepository() as repository:
+            await repository.replace_friend_suggestions(
+                {
+                    graph.get_user_id(index): [
+                        (graph.get_user_id(suggested_index), mutual_friends_count)
+                        for suggested_index, mutual_friends_count in suggestions
+                    ]
+                    for index, suggestions in zip(users_indexes, ranked_suggestions)
+                }
+            )
+
+    @classmethod
+    async def compute_friend_suggestions(cls) -> int:
+        """Computes the suggestions of every user with friends, one batch of
+        users per transaction. Returns the number of users."""
+        graph = await load_friendship_graph(batch_size=FRIENDSHIP_GRAPH_LOAD_BATCH_SIZE)
+        adjacency = get_adjacency_matrix(graph)
+        for start in range(0, len(graph), FRIEND_SUGGESTIONS_BATCH_SIZE):
+            await cls._rank_and_store(
+                graph,
+                adjacency,
+                list(
+                    range(start, min(start + FRIEND_SUGGESTIONS_BATCH_SIZE, len(graph)))
+                ),
+            )
+        return len(graph)
+
+    @classmethod
+    async def refresh_friend_suggestions(cls, user_id: UUID):
+        """Computes the user's suggestions again, from the friendships of the
+        user and of the user's friends only."""
+        async with FriendshipRepository() as repository:
+            friendships = await repository.get_friendships_around_user(user_id)
+        graph = FriendshipGraph()
+        graph.extend(friendships)
+        graph.sort()
+        index = graph.get_index(user_id)
+        if index is None:
+            return
+        await cls._rank_and_store(graph, get_adjacency_matrix(graph), [index])
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import time
+
+from app.config import (
+    FRIENDSHIP_GRAPH_LOAD_BATCH_SIZE,
+    FRIENDSHIP_GRAPH_RELOAD_INTERVAL_IN_SECONDS,
+)
+from app.domain.events import load_new_friendship_event
+from app.domain.repositories.friendship_repository import FriendshipRepository
+from app.friendship_graph import FriendshipGraph
+from app.metrics import Gauge
+from app.rabbitmq import NEW_FRIENDSHIP_ROUTING_KEY, subscription_hub
+
+logger = logging.getLogger(__name__)
+
+friendship_graph_friendships_gauge = Gauge(
+    "friendship_graph_friendships", "Friendships in the friendship graph"
+)
+
+RETRY_DELAY_IN_SECONDS = 5
+
+
+async def load_friendship_graph(batch_size: int) -> FriendshipGraph:
+    """Reads every friendship, `batch_size` at a time, into a new graph.
+
+    The graph is sorted in a thread, it takes about a second per 5M
+    friendships and would block the event loop meanwhile. Nothing else holds
+    the new graph yet.
+    """
+    graph = FriendshipGraph()
+    after = None
+    while True:
+        async with FriendshipRepository() as repository:
+            friendships = await repository.get_friendships_page(
+                after=after, limit=batch_size
+            )
+        graph.extend(friendships)
+        if len(friendships) < batch_size:
+            break
+        after = friendships[-1]
+    await asyncio.to_thread(graph.sort)
+    return graph
+
+
+class FriendshipGraphSync:
+    """Loads the friendship graph of this process and keeps it up to date.
+
+    The graph is loaded from the database page by page, then the new
+    friendship events published by app.tasks.handle_new_friendship are applied
+    to it. The events are subscribed to before the load starts, a friendship
+    made meanwhile is in the loaded pages, the queued events or both. The graph
+    is loaded again every `reload_interval_in_seconds`, into a new graph that
+    replaces the current one once complete.
+
+    `graph` is None until the first load completes, readers fall back to the
+    database until then.
+    """
+
+    def __init__(self, load_batch_size: int, reload_interval_in_seconds: float):
+        self.load_batch_size = load_batch_size
+        self.reload_interval_in_seconds = reload_interval_in_seconds
+        self.graph: FriendshipGraph | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            try:
+                async with subscription_hub.subscribe(
+                    NEW_FRIENDSHIP_ROUTING_KEY, queue_size=0
+                ) as events:
+                    while True:
+                        self.graph = await self.load()
+                        friendship_graph_friendships_gauge.set(
+                            self.graph.friendships_count
+                        )
+                        await self._apply_events(events)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Friendship graph sync failed")
+                await asyncio.sleep(RETRY_DELAY_IN_SECONDS)
+
+    async def load(self) -> FriendshipGraph:
+        return await load_friendship_graph(batch_size=self.load_batch_size)
+
+    async def _apply_events(self, events: asyncio.Queue):
+        """Applies the events until the graph is due to be loaded again."""
+        reload_at = time.monotonic() + self.reload_interval_in_seconds
+        while (timeout := reload_at - time.monotonic()) > 0:
+            try:
+                event = await asyncio.wait_for(events.get(), timeout)
+            except asyncio.TimeoutError:
+                return
+            friendship = load_new_friendship_event(event)
+            if friendship:
+                self.graph.add_friendship(*friendship)
+                friendship_graph_friendships_gauge.set(self.graph.friendships_count)
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self.graph = None
+
+
+friendship_graph_sync = FriendshipGraphSync(
+    load_batch_size=FRIENDSHIP_GRAPH_LOAD_BATCH_SIZE,
+    reload_interval_in_seconds=FRIENDSHIP_GRAPH_RELOAD_INTERVAL_IN_SECONDS,
+)
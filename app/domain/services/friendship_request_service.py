@@ -1,18 +1,20 @@
+from datetime import datetime
 from uuid import UUID
 
-from app import enums
+from app import tasks
 from app.domain import entities
-from app.domain.repositories.friendship_repository import FriendshipRepository
+from app.domain.repositories.base import UnitOfWork
 from app.domain.repositories.friendship_request_repository import (
     FriendshipRequestRepository,
 )
-from app.domain.repositories.user_repository import UserRepository
+from app.domain.repositories.outbox_repository import OutboxRepository
 from app.domain.services.exceptions import (
     FriendshipRequestAlreadyCreated,
     PendingFriendshipRequestDoesNotExist,
     ReceiverDoesNotExist,
     UsersAreAlreadyFriends,
 )
+from app.domain.services.friendship_service import FriendshipService
 
 
 class FriendshipRequestService:
@@ -20,31 +22,21 @@ class FriendshipRequestService:
     async def create_friendship_request(
         sender_id: UUID, receiver_id: UUID
     ) -> entities.FriendshipRequest:
-        async with (
-            UserRepository() as user_repository,
-            FriendshipRepository() as friendship_repository,
-            FriendshipRequestRepository() as friendship_request_repository,
-        ):
-            does_receiver_exist = await user_repository.does_user_with_id_exist(
-                user_id=receiver_id
-            )
-            if not does_receiver_exist:
-                raise ReceiverDoesNotExist
-            are_users_friends = await friendship_repository.are_users_friends(
-                user_1_id=sender_id, user_2_id=receiver_id
-            )
-            if are_users_friends:
-                raise UsersAreAlreadyFriends
-            does_pending_request_exist = (
-                await friendship_request_repository.does_pending_request_exist(
-                    user_1_id=sender_id, user_2_id=receiver_id
-                )
-            )
-            if does_pending_request_exist:
-                raise FriendshipRequestAlreadyCreated
-            return await friendship_request_repository.create_pending_request(
+        async with FriendshipRequestRepository() as friendship_request_repository:
+            (
+                friendship_request,
+                does_receiver_exist,
+                are_users_friends,
+            ) = await friendship_request_repository.create_pending_request(
                 sender_id=sender_id, receiver_id=receiver_id
             )
+        if friendship_request:
+            return friendship_request
+        if not does_receiver_exist:
+            raise ReceiverDoesNotExist
+        if are_users_friends:
+            raise UsersAreAlreadyFriends
+        raise FriendshipRequestAlreadyCreated
 
     @staticmethod
     async def get_pending_requests_sent_by_user(
@@ -66,104 +58,119 @@ class FriendshipRequestService:
                 user_id=user_id
             )
 
-    @classmethod
-    async def accept_friendship_request(
-        cls, user_id: UUID, friendship_request_id: UUID
-    ):
-        async with (
-            FriendshipRequestRepository() as friendship_request_repository,
-            FriendshipRepository() as friendship_repository,
-        ):
-            friendship_request = await cls._get_pending_request_received_by_user(
-                friendship_request_repository=friendship_request_repository,
-                friendship_request_id=friendship_request_id,
-                user_id=user_id,
-            )
-            await friendship_request_repository.update_status(
-                friendship_request_id=friendship_request_id,
-                status=enums.FriendshipRequestStatusEnum.accepted,
-            )
-            await friendship_repository.create_friendship(
-                user_1_id=friendship_request.sender_id,
-                user_2_id=friendship_request.receiver_id,
-            )
-            await friendship_repository.create_friendship(
-                user_1_id=friendship_request.receiver_id,
-                user_2_id=friendship_request.sender_id,
+    @staticmethod
+    async def get_pending_requests_sent_by_user_page(
+        user_id: UUID, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> list[entities.FriendshipRequest]:
+        async with FriendshipRequestRepository() as friendship_request_repository:
+            return await friendship_request_repository.get_pending_requests_sent_by_user_page(  # noqa
+                user_id=user_id, limit=limit, after=after
             )
 
-    @classmethod
-    async def reject_friendship_request(
-        cls, user_id: UUID, friendship_request_id: UUID
-    ):
+    @staticmethod
+    async def count_pending_requests_sent_by_user(user_id: UUID) -> int:
         async with FriendshipRequestRepository() as friendship_request_repository:
-            await cls._get_pending_request_received_by_user(
-                friendship_request_repository=friendship_request_repository,
-                friendship_request_id=friendship_request_id,
-                user_id=user_id,
+            return (
+                await friendship_request_repository.count_pending_requests_sent_by_user(
+                    user_id=user_id
+                )
             )
-            await friendship_request_repository.update_status(
-                friendship_request_id=friendship_request_id,
-                status=enums.FriendshipRequestStatusEnum.rejected,
+
+    @staticmethod
+    async def get_pending_requests_received_by_user_page(
+        user_id: UUID, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> list[entities.FriendshipRequest]:
+        async with FriendshipRequestRepository() as friendship_request_repository:
+            return await friendship_request_repository.get_pending_requests_received_by_user_page(  # noqa
+                user_id=user_id, limit=limit, after=after
             )
 
-    @classmethod
-    async def cancel_friendship_request(
-        cls, user_id: UUID, friendship_request_id: UUID
-    ):
+    @staticmethod
+    async def count_pending_requests_received_by_user(user_id: UUID) -> int:
         async with FriendshipRequestRepository() as friendship_request_repository:
-            await cls._get_pending_request_sent_by_user(
-                friendship_request_repository=friendship_request_repository,
-                friendship_request_id=friendship_request_id,
-                user_id=user_id,
+            return await friendship_request_repository.count_pending_requests_received_by_user(  # noqa
+                user_id=user_id
+            )
+
+    @staticmethod
+    async def accept_friendship_request(user_id: UUID, friendship_request_id: UUID):
+        async with (
+            UnitOfWork() as unit_of_work,
+            FriendshipRequestRepository(unit_of_work) as friendship_request_repository,
+            OutboxRepository(unit_of_work) as outbox_repository,
+        ):
+            sender_id = await friendship_request_repository.accept_pending_request(
+                friendship_request_id=friendship_request_id, receiver_id=user_id
             )
-            await friendship_request_repository.update_status(
-                friendship_request_id=friendship_request_id,
-                status=enums.FriendshipRequestStatusEnum.cancelled,
+            if not sender_id:
+                raise PendingFriendshipRequestDoesNotExist
+            await outbox_repository.add_message(
+                task=tasks.handle_new_friendship.name,
+                kwargs={"user_1_id": str(sender_id), "user_2_id": str(user_id)},
             )
+        FriendshipService.add_friendship(user_1_id=sender_id, user_2_id=user_id)
 
-    @classmethod
-    async def _get_pending_request(
-        cls,
-        friendship_request_repository: FriendshipRequestRepository,
-        friendship_request_id: UUID,
-    ) -> entities.FriendshipRequest:
-        friendship_request = await friendship_request_repository.get_request_by_id(
-            friendship_request_id=friendship_request_id
-        )
-        if (
-            not friendship_request
-            or friendship_request.status != enums.FriendshipRequestStatusEnum.pending
+    @staticmethod
+    async def accept_friendship_requests(
+        user_id: UUID, friendship_request_ids: list[UUID]
+    ) -> set[UUID]:
+        """Returns the ids of the accepted requests, the other ones are not pending
+        or were not received by the user."""
+        async with (
+            UnitOfWork() as unit_of_work,
+            FriendshipRequestRepository(unit_of_work) as friendship_request_repository,
+            OutboxRepository(unit_of_work) as outbox_repository,
         ):
-            raise PendingFriendshipRequestDoesNotExist
-        return friendship_request
+            senders_ids = await friendship_request_repository.accept_pending_requests(
+                friendship_request_ids=friendship_request_ids, receiver_id=user_id
+            )
+            await outbox_repository.add_messages(
+                task=tasks.handle_new_friendship.name,
+                kwargs_list=[
+                    {"user_1_id": str(sender_id), "user_2_id": str(user_id)}
+                    for sender_id in senders_ids.values()
+                ],
+            )
+        for sender_id in senders_ids.values():
+            FriendshipService.add_friendship(user_1_id=sender_id, user_2_id=user_id)
+        return set(senders_ids)
 
-    @classmethod
-    async def _get_pending_request_sent_by_user(
-        cls,
-        friendship_request_repository: FriendshipRequestRepository,
-        friendship_request_id: UUID,
-        user_id: UUID,
-    ) -> entities.FriendshipRequest:
-        friendship_request = await cls._get_pending_request(
-            friendship_request_repository=friendship_request_repository,
-            friendship_request_id=friendship_request_id,
-        )
-        if friendship_request.sender_id != user_id:
+    @staticmethod
+    async def reject_friendship_request(user_id: UUID, friendship_request_id: UUID):
+        async with FriendshipRequestRepository() as friendship_request_repository:
+            is_rejected = await friendship_request_repository.reject_pending_request(
+                friendship_request_id=friendship_request_id, receiver_id=user_id
+            )
+        if not is_rejected:
             raise PendingFriendshipRequestDoesNotExist
-        return friendship_request
 
-    @classmethod
-    async def _get_pending_request_received_by_user(
-        cls,
-        friendship_request_repository: FriendshipRequestRepository,
-        friendship_request_id: UUID,
-        user_id: UUID,
-    ) -> entities.FriendshipRequest:
-        friendship_request = await cls._get_pending_request(
-            friendship_request_repository=friendship_request_repository,
-            friendship_request_id=friendship_request_id,
-        )
-        if friendship_request.receiver_id != user_id:
+    @staticmethod
+    async def reject_friendship_requests(
+        user_id: UUID, friendship_request_ids: list[UUID]
+    ) -> set[UUID]:
+        """Returns the ids of the rejected requests, the other ones are not pending
+        or were not received by the user."""
+        async with FriendshipRequestRepository() as friendship_request_repository:
+            return await friendship_request_repository.reject_pending_requests(
+                friendship_request_ids=friendship_request_ids, receiver_id=user_id
+            )
+
+    @staticmethod
+    async def cancel_friendship_request(user_id: UUID, friendship_request_id: UUID):
+        async with FriendshipRequestRepository() as friendship_request_repository:
+            is_cancelled = await friendship_request_repository.cancel_pending_request(
+                friendship_request_id=friendship_request_id, sender_id=user_id
+            )
+        if not is_cancelled:
             raise PendingFriendshipRequestDoesNotExist
-        return friendship_request
+
+    @staticmethod
+    async def cancel_friendship_requests(
+        user_id: UUID, friendship_request_ids: list[UUID]
+    ) -> set[UUID]:
+        """Returns the ids of the cancelled requests, the other ones are not pending
+        or were not sent by the user."""
+        async with FriendshipRequestRepository() as friendship_request_repository:
+            return await friendship_request_repository.cancel_pending_requests(
+                friendship_request_ids=friendship_request_ids, sender_id=user_id
+            )
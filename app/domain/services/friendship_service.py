@@ -0,0 +1,38 @@
+from uuid import UUID
+
+from app.cache import LRUCache
+from app.config import FRIENDSHIP_CACHE_SIZE, FRIENDSHIP_CACHE_TTL_IN_SECONDS
+from app.domain.repositories.friendship_repository import FriendshipRepository
+from app.domain.services.friendship_graph_sync import friendship_graph_sync
+
+friendship_cache: LRUCache[tuple[UUID, UUID], bool] = LRUCache(
+    max_size=FRIENDSHIP_CACHE_SIZE, ttl_in_seconds=FRIENDSHIP_CACHE_TTL_IN_SECONDS
+)
+
+
+class FriendshipService:
+    @staticmethod
+    async def are_users_friends(user_1_id: UUID, user_2_id: UUID) -> bool:
+        if friendship_graph_sync.graph is not None:
+            return friendship_graph_sync.graph.are_friends(user_1_id, user_2_id)
+        are_users_friends = friendship_cache.get((user_1_id, user_2_id))
+        if are_users_friends is None:
+            async with FriendshipRepository() as repository:
+                are_users_friends = await repository.are_users_friends(
+                    user_1_id=user_1_id, user_2_id=user_2_id
+                )
+            friendship_cache.set((user_1_id, user_2_id), are_users_friends)
+        return are_users_friends
+
+    @staticmethod
+    def invalidate_friendship(user_1_id: UUID, user_2_id: UUID):
+        friendship_cache.invalidate((user_1_id, user_2_id))
+        friendship_cache.invalidate((user_2_id, user_1_id))
+
+    @classmethod
+    def add_friendship(cls, user_1_id: UUID, user_2_id: UUID):
+        """Called once the friendship is committed, this process sees it
+        before the new friendship event comes back from the broker."""
+        cls.invalidate_friendship(user_1_id=user_1_id, user_2_id=user_2_id)
+        if friendship_graph_sync.graph is not None:
+            friendship_graph_sync.graph.add_friendship(user_1_id, user_2_id)
@@ -2,9 +2,35 @@ from uuid import UUID
 
 from app.domain import entities
 from app.domain.repositories.reaction_repository import ReactionRepository
+from app.domain.services.exceptions import TrainingDoesNotExist
+from app.domain.services.reaction_write_buffer import reaction_write_buffer
+from app.domain.services.training_service import TrainingService
+from app.enums import ReactionTypeEnum
 
 
 class ReactionService:
+    @staticmethod
+    async def _check_training_is_visible(user_id: UUID, training_id: UUID):
+        training = await TrainingService.get_visible_training(
+            request_user_id=user_id, training_id=training_id
+        )
+        if training is None:
+            raise TrainingDoesNotExist
+
+    @classmethod
+    async def react(
+        cls, user_id: UUID, training_id: UUID, reaction_type: ReactionTypeEnum
+    ):
+        await cls._check_training_is_visible(user_id=user_id, training_id=training_id)
+        await reaction_write_buffer.react(
+            user_id=user_id, training_id=training_id, reaction_type=reaction_type
+        )
+
+    @classmethod
+    async def unreact(cls, user_id: UUID, training_id: UUID):
+        await cls._check_training_is_visible(user_id=user_id, training_id=training_id)
+        await reaction_write_buffer.unreact(user_id=user_id, training_id=training_id)
+
     @staticmethod
     async def get_reaction_count_by_training_ids(keys: list[UUID]) -> list[int]:
         async with ReactionRepository() as repository:
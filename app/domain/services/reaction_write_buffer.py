@@ -0,0 +1,185 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+
+from app.config import (
+    REACTION_WRITE_FLUSH_INTERVAL_IN_MILLISECONDS,
+    REACTION_WRITE_MAX_BATCH_SIZE,
+)
+from app.domain.repositories.reaction_repository import ReactionRepository
+from app.domain.services.exceptions import TrainingDoesNotExist
+from app.enums import ReactionTypeEnum
+from app.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+reaction_writes_counter = Counter(
+    "reaction_writes_total", "Reaction writes received by the write buffer"
+)
+reaction_write_flushes_counter = Counter(
+    "reaction_write_flushes_total", "Batches flushed by the reaction write buffer"
+)
+
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+@dataclass
+class PendingReactionWrite:
+    # None removes the reaction.
+    reaction_type: ReactionTypeEnum | None
+    created_at: datetime
+    futures: list[asyncio.Future] = field(default_factory=list)
+
+
+class ReactionWriteBuffer:
+    """Coalesces the reaction writes of this process into batches.
+
+    A write waits until the flush interval has passed since the first pending
+    write, or until `max_batch_size` user and training pairs are pending, and
+    the batch is then applied in one transaction with one multi-row upsert and
+    one multi-row delete. Only the last write per user and training is applied.
+    Batches are committed in the order they were taken, and callers resume once
+    their batch is committed.
+    """
+
+    def __init__(self, flush_interval_in_seconds: float, max_batch_size: int):
+        self.flush_interval_in_seconds = flush_interval_in_seconds
+        self.max_batch_size = max_batch_size
+        self._pending: dict[tuple[UUID, UUID], PendingReactionWrite] = {}
+        self._timer: asyncio.Task | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+
+    async def react(
+        self, user_id: UUID, training_id: UUID, reaction_type: ReactionTypeEnum
+    ):
+        await self._write(user_id, training_id, reaction_type)
+
+    async def unreact(self, user_id: UUID, training_id: UUID):
+        await self._write(user_id, training_id, None)
+
+    async def _write(
+        self, user_id: UUID, training_id: UUID, reaction_type: ReactionTypeEnum | None
+    ):
+        reaction_writes_counter.inc()
+        future = asyncio.get_running_loop().create_future()
+        pending_write = self._pending.get((user_id, training_id))
+        if pending_write is None:
+            pending_write = self._pending[
+                (user_id, training_id)
+            ] = PendingReactionWrite(
+                reaction_type=reaction_type, created_at=datetime.utcnow()
+            )
+        else:
+            pending_write.reaction_type = reaction_type
+            pending_write.created_at = datetime.utcnow()
+        pending_write.futures.append(future)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._cancel_timer()
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_interval())
+        await future
+
+    async def _flush_after_interval(self):
+        await asyncio.sleep(self.flush_interval_in_seconds)
+        self._timer = None
+        self._start_flush()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _start_flush(self):
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        task = asyncio.create_task(self._flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: dict[tuple[UUID, UUID], PendingReactionWrite]):
+        # The lock is fair, batches are therefore committed in the order their
+        # flush tasks were created.
+        async with self._lock:
+            reaction_write_flushes_counter.inc()
+            try:
+                await self._apply(batch)
+            except IntegrityError:
+                # A write for a training that no longer exists must not fail the
+                # rest of the batch, the writes are retried one by one instead.
+                for key, pending_write in batch.items():
+                    try:
+                        await self._apply({key: pending_write})
+                    except IntegrityError as e:
+                        if getattr(e.orig, "pgcode", None) == FOREIGN_KEY_VIOLATION:
+                            # The training was deleted after the caller checked
+                            # that it is visible.
+                            e = TrainingDoesNotExist()
+                        self._resolve(pending_write, exception=e)
+                    except Exception as e:
+                        self._resolve(pending_write, exception=e)
+                    else:
+                        self._resolve(pending_write)
+            except Exception as e:
+                logger.exception("Reaction write batch failed")
+                for pending_write in batch.values():
+                    self._resolve(pending_write, exception=e)
+            else:
+                for pending_write in batch.values():
+                    self._resolve(pending_write)
+
+    @staticmethod
+    async def _apply(batch: dict[tuple[UUID, UUID], PendingReactionWrite]):
+        upserts = [
+            (
+                user_id,
+                training_id,
+                pending_write.reaction_type,
+                pending_write.created_at,
+            )
+            for (user_id, training_id), pending_write in batch.items()
+            if pending_write.reaction_type is not None
+        ]
+        deletes = [
+            key
+            for key, pending_write in batch.items()
+            if pending_write.reaction_type is None
+        ]
+        async with ReactionRepository() as repository:
+            if upserts:
+                await repository.upsert_reactions(upserts)
+            if deletes:
+                await repository.delete_reactions(deletes)
+
+    @staticmethod
+    def _resolve(
+        pending_write: PendingReactionWrite, exception: Exception | None = None
+    ):
+        for future in pending_write.futures:
+            # The caller may have been cancelled meanwhile, the write is still
+            # applied.
+            if future.done():
+                continue
+            if exception is None:
+                future.set_result(None)
+            else:
+                future.set_exception(exception)
+
+    async def close(self):
+        """Flushes the pending writes and waits for every batch to commit."""
+        self._cancel_timer()
+        self._start_flush()
+        await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+
+reaction_write_buffer = ReactionWriteBuffer(
+    flush_interval_in_seconds=REACTION_WRITE_FLUSH_INTERVAL_IN_MILLISECONDS / 1000,
+    max_batch_size=REACTION_WRITE_MAX_BATCH_SIZE,
+)
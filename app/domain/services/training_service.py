@@ -2,8 +2,19 @@ from datetime import datetime
 from uuid import UUID
 
 from app import tasks
+from app.cache import LRUCache
+from app.config import TRAINING_CACHE_SIZE, TRAINING_CACHE_TTL_IN_SECONDS
 from app.domain import entities
+from app.domain.repositories.base import UnitOfWork
+from app.domain.repositories.outbox_repository import OutboxRepository
+from app.domain.repositories.timeline_repository import TimelineRepository
 from app.domain.repositories.training_repository import TrainingRepository
+from app.domain.services.friendship_service import FriendshipService
+from app.enums import TrainingVisibilityEnum
+
+training_cache: LRUCache[UUID, entities.TrainingWithVisibility] = LRUCache(
+    max_size=TRAINING_CACHE_SIZE, ttl_in_seconds=TRAINING_CACHE_TTL_IN_SECONDS
+)
 
 
 class TrainingService:
@@ -11,16 +22,21 @@ class TrainingService:
     async def create_training(
         user_id: UUID, name: str, start_time: datetime, end_time: datetime
     ) -> entities.Training:
-        async with TrainingRepository() as repository:
-            training = await repository.create_training(
+        async with (
+            UnitOfWork() as unit_of_work,
+            TrainingRepository(unit_of_work) as training_repository,
+            OutboxRepository(unit_of_work) as outbox_repository,
+        ):
+            training = await training_repository.create_training(
                 user_id=user_id,
                 name=name,
                 start_time=start_time,
                 end_time=end_time,
             )
-        tasks.handle_new_training.delay(
-            user_id=str(user_id), training_id=str(training.id)
-        )
+            await outbox_repository.add_message(
+                task=tasks.handle_new_training.name,
+                kwargs={"user_id": str(user_id), "training_id": str(training.id)},
+            )
         return training
 
     @staticmethod
@@ -32,6 +48,41 @@ class TrainingService:
                 request_user_id=request_user_id, training_id=training_id
             )
 
+    @classmethod
+    async def get_visible_training(
+        cls, request_user_id: UUID, training_id: UUID
+    ) -> entities.TrainingWithVisibility | None:
+        """Like get_training, but cached per process for hot trainings."""
+        training = training_cache.get(training_id)
+        if training is None:
+            async with TrainingRepository() as repository:
+                training = await repository.get_training_with_visibility(
+                    training_id=training_id
+                )
+            if training is None:
+                return None
+            training_cache.set(training_id, training)
+        if await cls.can_user_see_training(
+            request_user_id=request_user_id, training=training
+        ):
+            return training
+
+    @staticmethod
+    async def can_user_see_training(
+        request_user_id: UUID, training: entities.TrainingWithVisibility
+    ) -> bool:
+        """Same rules as the visibility filter of the training queries."""
+        if (
+            training.user_id == request_user_id
+            or training.visibility == TrainingVisibilityEnum.public
+        ):
+            return True
+        if training.visibility == TrainingVisibilityEnum.only_friends:
+            return await FriendshipService.are_users_friends(
+                user_1_id=request_user_id, user_2_id=training.user_id
+            )
+        return False
+
     @staticmethod
     async def get_user_trainings(
         request_user_id: UUID, user_id: UUID
@@ -40,3 +91,32 @@ class TrainingService:
             return await repository.get_user_trainings(
                 request_user_id=request_user_id, user_id=user_id
             )
+
+    @staticmethod
+    async def get_user_trainings_page(
+        request_user_id: UUID,
+        user_id: UUID,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[entities.Training]:
+        async with TrainingRepository() as repository:
+            return await repository.get_user_trainings_page(
+                request_user_id=request_user_id,
+                user_id=user_id,
+                limit=limit,
+                after=after,
+            )
+
+    @staticmethod
+    async def get_friends_feed_page(
+        user_id: UUID, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> list[entities.Training]:
+        async with TimelineRepository() as repository:
+            return await repository.get_timeline_page(
+                viewer_id=user_id, limit=limit, after=after
+            )
+
+    @staticmethod
+    async def get_high_fan_out_friends_ids(user_id: UUID) -> set[UUID]:
+        async with TimelineRepository() as repository:
+            return await repository.get_high_fan_out_friends_ids(user_id=user_id)
@@ -4,7 +4,7 @@ from app.domain import entities
 from app.domain.repositories.user_repository import UserRepository
 from app.domain.services.exceptions import LoginFailed
 from app.jwt_tokens import create_access_token
-from app.passwords import get_password_hash, verify_password
+from app.passwords import async_get_password_hash, async_verify_password
 
 
 class UserService:
@@ -15,7 +15,7 @@ class UserService:
 
     @staticmethod
     async def create_user(email: str, password: str) -> entities.User:
-        hashed_password = get_password_hash(password)
+        hashed_password = await async_get_password_hash(password)
         async with UserRepository() as repository:
             return await repository.create_user(
                 email=email, hashed_password=hashed_password
@@ -25,6 +25,6 @@ class UserService:
     async def get_user_jwt(email: str, password: str) -> str:
         async with UserRepository() as repository:
             user = await repository.get_user_by_email(email)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await async_verify_password(password, user.hashed_password):
             raise LoginFailed()
         return create_access_token(user.id)
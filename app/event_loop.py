@@ -0,0 +1,49 @@
+import asyncio
+from typing import Awaitable, Callable, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+class WorkerEventLoop:
+    """One long-lived event loop per worker process for running async tasks.
+
+    Connections opened by a task (the engine pool, the RabbitMQ publisher) are
+    bound to the loop they were opened in, running every task on the same loop
+    lets the next task reuse them. Tasks run one after another in the thread
+    that started the loop, which is what the prefork and solo pools do.
+    """
+
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._shutdown_callbacks: list[Callable[[], Awaitable]] = []
+
+    def start(self):
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+
+    def run(self, coroutine: Coroutine[None, None, T]) -> T:
+        self.start()
+        return self._loop.run_until_complete(coroutine)
+
+    def on_shutdown(self, callback: Callable[[], Awaitable]):
+        self._shutdown_callbacks.append(callback)
+
+    def shutdown(self):
+        if self._loop is None or self._loop.is_closed():
+            return
+        try:
+            for callback in self._shutdown_callbacks:
+                self._loop.run_until_complete(callback())
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            self._loop.close()
+            self._loop = None
+
+
+worker_event_loop = WorkerEventLoop()
+
+
+def run_async(coroutine: Coroutine[None, None, T]) -> T:
+    return worker_event_loop.run(coroutine)
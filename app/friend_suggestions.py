@@ -0,0 +1,59 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from app.friendship_graph import FRIEND_INDEX_TYPECODE, FriendshipGraph
+
+
+def get_adjacency_matrix(graph: FriendshipGraph) -> csr_matrix:
+    """The graph's adjacency matrix, rows and columns are the interned indexes.
+
+    The sorted friend arrays are already the CSR column indexes of each row,
+    they are concatenated as they are.
+    """
+    users_count = len(graph)
+    friends = [graph.get_friends_indexes(index) for index in range(users_count)]
+    indptr = np.zeros(users_count + 1, dtype=np.int64)
+    np.cumsum([len(indexes) for indexes in friends], out=indptr[1:])
+    indices = np.frombuffer(
+        b"".join(indexes.tobytes() for indexes in friends),
+        dtype=np.dtype(FRIEND_INDEX_TYPECODE),
+    ).astype(np.int32)
+    data = np.ones(len(indices), dtype=np.int32)
+    return csr_matrix((data, indices, indptr), shape=(users_count, users_count))
+
+
+def rank_friend_suggestions(
+    adjacency: csr_matrix, users_indexes: list[int], limit: int
+) -> list[list[tuple[int, int]]]:
+    """The `limit` non-friends with the most mutual friends of each user.
+
+    Returns (index, mutual friends count) pairs per user, most mutual friends
+    first then lowest index first. The mutual friends counts of a batch of
+    users are the rows of one sparse product, only the adjacency rows of the
+    users and of their friends are read.
+    """
+    rows = adjacency[users_indexes]
+    mutual_friends_counts = rows @ adjacency
+    # The users themselves and their friends are not suggested.
+    users = csr_matrix(
+        (
+            np.ones(len(users_indexes), dtype=np.int32),
+            (np.arange(len(users_indexes)), users_indexes),
+        ),
+        shape=rows.shape,
+    )
+    mutual_friends_counts = mutual_friends_counts - mutual_friends_counts.multiply(
+        rows + users
+    )
+    mutual_friends_counts.eliminate_zeros()
+
+    suggestions = []
+    for row in range(len(users_indexes)):
+        start, end = mutual_friends_counts.indptr[row : row + 2]
+        candidates = mutual_friends_counts.indices[start:end]
+        counts = mutual_friends_counts.data[start:end]
+        order = np.lexsort((candidates, -counts))[:limit]
+        suggestions.append(
+            list(zip(candidates[order].tolist(), counts[order].tolist()))
+        )
+    return suggestions
@@ -0,0 +1,101 @@
+from array import array
+from bisect import bisect_left, insort
+from typing import Iterable
+from uuid import UUID
+
+# 4 bytes per friend id, a user id is interned once as an index into _ids.
+FRIEND_INDEX_TYPECODE = "I"
+
+
+class FriendshipGraph:
+    """In-process friendship graph, each user's friends as a sorted int array.
+
+    User ids are interned: a user is an index into `_ids`, and its friends are
+    the sorted array of their indexes at the same position of `_friends`. A
+    friendship costs 8 bytes (one index in each user's array) instead of two
+    set entries pointing at UUID objects. Checking a friendship bisects the
+    smaller array, O(log d), listing friends is O(d).
+
+    Memory is about 8 bytes per friendship plus 170 bytes per user (interning
+    and array headers), the UUID objects aside: 9MB per million friendships
+    between 10k users and 25MB between 100k users, against 81MB and 165MB with
+    sets of friends' UUIDs (benchmarks.friendship_graph_memory).
+
+    `extend` appends without keeping the arrays sorted, to load many
+    friendships at once, `sort` has to be called before the graph is read.
+    """
+
+    def __init__(self):
+        self._indexes: dict[UUID, int] = {}
+        self._ids: list[UUID] = []
+        self._friends: list[array] = []
+        self.friendships_count = 0
+
+    def _intern(self, user_id: UUID) -> int:
+        index = self._indexes.get(user_id)
+        if index is None:
+            index = self._indexes[user_id] = len(self._ids)
+            self._ids.append(user_id)
+            self._friends.append(array(FRIEND_INDEX_TYPECODE))
+        return index
+
+    def extend(self, friendships: Iterable[tuple[UUID, UUID]]):
+        """Adds the friendships without checking for duplicates, each pair
+        has to be passed only once and not be in the graph already."""
+        for user_1_id, user_2_id in friendships:
+            user_1_index = self._intern(user_1_id)
+            user_2_index = self._intern(user_2_id)
+            self._friends[user_1_index].append(user_2_index)
+            self._friends[user_2_index].append(user_1_index)
+            self.friendships_count += 1
+
+    def sort(self):
+        for index, friends in enumerate(self._friends):
+            # A new array is allocated to its exact size, appending
+            # over-allocates.
+            self._friends[index] = array(FRIEND_INDEX_TYPECODE, sorted(friends))
+
+    def add_friendship(self, user_1_id: UUID, user_2_id: UUID):
+        """Adds the friendship unless it is already in the graph."""
+        if self.are_friends(user_1_id, user_2_id):
+            return
+        user_1_index = self._intern(user_1_id)
+        user_2_index = self._intern(user_2_id)
+        insort(self._friends[user_1_index], user_2_index)
+        insort(self._friends[user_2_index], user_1_index)
+        self.friendships_count += 1
+
+    def are_friends(self, user_1_id: UUID, user_2_id: UUID) -> bool:
+        user_1_index = self._indexes.get(user_1_id)
+        user_2_index = self._indexes.get(user_2_id)
+        if user_1_index is None or user_2_index is None:
+            return False
+        if len(self._friends[user_2_index]) < len(self._friends[user_1_index]):
+            user_1_index, user_2_index = user_2_index, user_1_index
+        friends = self._friends[user_1_index]
+        position = bisect_left(friends, user_2_index)
+        return position < len(friends) and friends[position] == user_2_index
+
+    def get_friends_ids(self, user_id: UUID) -> list[UUID]:
+        index = self._indexes.get(user_id)
+        if index is None:
+            return []
+        return [self._ids[friend_index] for friend_index in self._friends[index]]
+
+    def get_index(self, user_id: UUID) -> int | None:
+        return self._indexes.get(user_id)
+
+    def get_user_id(self, index: int) -> UUID:
+        return self._ids[index]
+
+    def get_friends_indexes(self, index: int) -> array:
+        return self._friends[index]
+
+    def count_friends(self, user_id: UUID) -> int:
+        index = self._indexes.get(user_id)
+        if index is None:
+            return 0
+        return len(self._friends[index])
+
+    def __len__(self) -> int:
+        return len(self._ids)
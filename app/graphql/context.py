@@ -0,0 +1,37 @@
+from uuid import UUID
+
+from starlette.requests import HTTPConnection, Request
+from starlette.websockets import WebSocket
+
+from app.graphql.data_loaders import DataLoaders
+from app.jwt_tokens import get_user_id_from_token
+
+
+def get_token(connection: HTTPConnection) -> str | None:
+    token = None
+    if "Authorization" in connection.headers:
+        header: str = connection.headers["Authorization"]
+        bearer, _, token = header.partition(" ")
+        if bearer.lower() != "bearer":
+            return None
+    if "auth" in connection.query_params:
+        token = connection.query_params["auth"]
+    return token
+
+
+def authenticate(connection: HTTPConnection | None) -> UUID | None:
+    if connection is None:
+        return None
+    token = get_token(connection)
+    if not token:
+        return None
+    return get_user_id_from_token(token)
+
+
+async def get_context(request: Request = None, ws: WebSocket = None) -> dict:
+    # The token is verified once per request (once per connection for
+    # subscriptions), permissions and resolvers only read the user id.
+    return {
+        "data_loaders": DataLoaders(),
+        "user_id": authenticate(request or ws),
+    }
@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+
+from strawberry.dataloader import DataLoader
+
+from app.graphql.data_loaders.reactions import (
+    get_reaction_count_by_training_ids,
+    get_reactions_by_training_ids,
+)
+from app.graphql.data_loaders.users import get_users_by_ids
+
+
+@dataclass
+class DataLoaders:
+    """Loaders scoped to a single GraphQL request.
+
+    Created by the request context, so batching and caching never leak between
+    requests or users and everything is freed together with the context.
+    """
+
+    users_by_ids: DataLoader = field(
+        default_factory=lambda: DataLoader(load_fn=get_users_by_ids)
+    )
+    reaction_count_by_training_ids: DataLoader = field(
+        default_factory=lambda: DataLoader(load_fn=get_reaction_count_by_training_ids)
+    )
+    reactions_by_training_ids: DataLoader = field(
+        default_factory=lambda: DataLoader(load_fn=get_reactions_by_training_ids)
+    )
@@ -5,3 +5,22 @@ class InvalidEmail(Exception):
 class InvalidPassword(Exception):
     def __init__(self, message):
         self.message = message
+
+
+class InvalidCursor(Exception):
+    message = "Invalid cursor"
+
+    def __str__(self):
+        return self.message
+
+
+class InvalidPageSize(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+
+class InvalidBatchSize(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
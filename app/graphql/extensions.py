@@ -0,0 +1,87 @@
+import logging
+from contextlib import ExitStack
+
+from strawberry.extensions import Extension
+
+from app import config
+from app.database import record_queries
+from app.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+sql_statements_counter = Counter(
+    "graphql_sql_statements_total", "SQL statements executed by GraphQL operations"
+)
+sql_duration_counter = Counter(
+    "graphql_sql_duration_seconds_total",
+    "Time spent in SQL statements executed by GraphQL operations",
+)
+repeated_sql_statements_counter = Counter(
+    "graphql_repeated_sql_statements_total",
+    "Operations executing the same SQL statement repeatedly (possible N+1)",
+)
+
+
+class SQLQueriesExtension(Extension):
+    """Records the SQL statements executed while an operation is resolved.
+
+    The totals are logged and added to the metrics, the statements themselves
+    are returned in the response extensions when the request has the SQL debug
+    header and the header is enabled in the config.
+    """
+
+    def on_request_start(self):
+        self._exit_stack = ExitStack()
+        self.recorder = self._exit_stack.enter_context(record_queries())
+
+    def on_request_end(self):
+        self._exit_stack.close()
+        operation_name = self.execution_context.operation_name
+        sql_statements_counter.inc(self.recorder.count)
+        sql_duration_counter.inc(self.recorder.total_duration)
+        logger.info(
+            "Operation %s executed %d SQL statements in %.1fms",
+            operation_name,
+            self.recorder.count,
+            self.recorder.total_duration * 1000,
+        )
+        repeated_statements = self._get_repeated_statements()
+        if repeated_statements:
+            repeated_sql_statements_counter.inc()
+        for statement, count in repeated_statements.items():
+            logger.warning(
+                "Operation %s executed the same statement %d times, possible N+1: %s",
+                operation_name,
+                count,
+                statement,
+            )
+
+    def _get_repeated_statements(self) -> dict[str, int]:
+        return self.recorder.get_repeated_statements(
+            min_count=config.SQL_REPEATED_STATEMENT_THRESHOLD
+        )
+
+    def _is_debug_requested(self) -> bool:
+        request = self.execution_context.context["request"]
+        return (
+            config.SQL_DEBUG_HEADER_ENABLED
+            and config.SQL_DEBUG_HEADER in request.headers
+        )
+
+    def get_results(self) -> dict:
+        if not self._is_debug_requested():
+            return {}
+        return {
+            "sql": {
+                "count": self.recorder.count,
+                "durationMs": self.recorder.total_duration * 1000,
+                "statements": [
+                    {"statement": statement, "durationMs": duration * 1000}
+                    for statement, duration in self.recorder.statements
+                ],
+                "repeatedStatements": [
+                    {"statement": statement, "count": count}
+                    for statement, count in self._get_repeated_statements().items()
+                ],
+            }
+        }
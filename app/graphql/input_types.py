@@ -4,7 +4,12 @@ from uuid import UUID
 
 import strawberry
 
-from app.graphql.validators import validate_email, validate_password
+from app.graphql.types.reactions import ReactionTypeEnum
+from app.graphql.validators import (
+    validate_batch_size,
+    validate_email,
+    validate_password,
+)
 
 
 @strawberry.input
@@ -38,3 +43,22 @@ class FriendshipRequestInput:
 @strawberry.input
 class FriendshipRequestIDInput:
     friendship_request_id: UUID
+
+
+@strawberry.input
+class FriendshipRequestIDsInput:
+    friendship_request_ids: list[UUID]
+
+    def validate(self):
+        validate_batch_size(len(self.friendship_request_ids))
+
+
+@strawberry.input
+class ReactionInput:
+    training_id: UUID
+    reaction_type: ReactionTypeEnum
+
+
+@strawberry.input
+class TrainingIDInput:
+    training_id: UUID
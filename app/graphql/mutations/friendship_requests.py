@@ -1,12 +1,26 @@
+from uuid import UUID
+
 import strawberry
 from strawberry.types import Info
 
-from app.domain.services.exceptions import AppError
+from app.domain.services.exceptions import (
+    AppError,
+    PendingFriendshipRequestDoesNotExist,
+)
 from app.domain.services.friendship_request_service import FriendshipRequestService
-from app.graphql.input_types import FriendshipRequestIDInput, FriendshipRequestInput
+from app.graphql.exceptions import InvalidBatchSize
+from app.graphql.input_types import (
+    FriendshipRequestIDInput,
+    FriendshipRequestIDsInput,
+    FriendshipRequestInput,
+)
 from app.graphql.permissions import IsAuthenticated
 from app.graphql.types import OK, Error
-from app.graphql.types.friendship_requests import FriendshipRequest
+from app.graphql.types.friendship_requests import (
+    FriendshipRequest,
+    FriendshipRequestResult,
+    FriendshipRequestResults,
+)
 
 
 async def send_friendship_request(
@@ -60,6 +74,66 @@ async def cancel_friendship_request(
     return OK()
 
 
+def get_results(
+    friendship_request_ids: list[UUID], applied_ids: set[UUID]
+) -> FriendshipRequestResults:
+    return FriendshipRequestResults(
+        results=[
+            FriendshipRequestResult(
+                friendship_request_id=friendship_request_id,
+                result=(
+                    OK()
+                    if friendship_request_id in applied_ids
+                    else Error(message=PendingFriendshipRequestDoesNotExist.message)
+                ),
+            )
+            for friendship_request_id in friendship_request_ids
+        ]
+    )
+
+
+async def accept_friendship_requests(
+    info: Info, input: FriendshipRequestIDsInput
+) -> FriendshipRequestResults | Error:
+    try:
+        input.validate()
+    except InvalidBatchSize as e:
+        return Error(message=e.message)
+    friendship_request_ids = list(dict.fromkeys(input.friendship_request_ids))
+    accepted_ids = await FriendshipRequestService.accept_friendship_requests(
+        user_id=info.context["user_id"], friendship_request_ids=friendship_request_ids
+    )
+    return get_results(friendship_request_ids, accepted_ids)
+
+
+async def reject_friendship_requests(
+    info: Info, input: FriendshipRequestIDsInput
+) -> FriendshipRequestResults | Error:
+    try:
+        input.validate()
+    except InvalidBatchSize as e:
+        return Error(message=e.message)
+    friendship_request_ids = list(dict.fromkeys(input.friendship_request_ids))
+    rejected_ids = await FriendshipRequestService.reject_friendship_requests(
+        user_id=info.context["user_id"], friendship_request_ids=friendship_request_ids
+    )
+    return get_results(friendship_request_ids, rejected_ids)
+
+
+async def cancel_friendship_requests(
+    info: Info, input: FriendshipRequestIDsInput
+) -> FriendshipRequestResults | Error:
+    try:
+        input.validate()
+    except InvalidBatchSize as e:
+        return Error(message=e.message)
+    friendship_request_ids = list(dict.fromkeys(input.friendship_request_ids))
+    cancelled_ids = await FriendshipRequestService.cancel_friendship_requests(
+        user_id=info.context["user_id"], friendship_request_ids=friendship_request_ids
+    )
+    return get_results(friendship_request_ids, cancelled_ids)
+
+
 @strawberry.type
 class FriendshipRequestMutation:
     send_friendship_request: FriendshipRequest | Error = strawberry.mutation(
@@ -74,3 +148,12 @@ class FriendshipRequestMutation:
     cancel_friendship_request: OK | Error = strawberry.mutation(
         resolver=cancel_friendship_request, permission_classes=[IsAuthenticated]
     )
+    accept_friendship_requests: FriendshipRequestResults | Error = strawberry.mutation(
+        resolver=accept_friendship_requests, permission_classes=[IsAuthenticated]
+    )
+    reject_friendship_requests: FriendshipRequestResults | Error = strawberry.mutation(
+        resolver=reject_friendship_requests, permission_classes=[IsAuthenticated]
+    )
+    cancel_friendship_requests: FriendshipRequestResults | Error = strawberry.mutation(
+        resolver=cancel_friendship_requests, permission_classes=[IsAuthenticated]
+    )
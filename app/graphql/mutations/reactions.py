@@ -0,0 +1,40 @@
+import strawberry
+from strawberry.types import Info
+
+from app.domain.services.exceptions import AppError
+from app.domain.services.reaction_service import ReactionService
+from app.graphql.input_types import ReactionInput, TrainingIDInput
+from app.graphql.permissions import IsAuthenticated
+from app.graphql.types import OK, Error
+
+
+async def react(info: Info, input: ReactionInput) -> OK | Error:
+    try:
+        await ReactionService.react(
+            user_id=info.context["user_id"],
+            training_id=input.training_id,
+            reaction_type=input.reaction_type,
+        )
+    except AppError as e:
+        return Error(message=e.message)
+    return OK()
+
+
+async def unreact(info: Info, input: TrainingIDInput) -> OK | Error:
+    try:
+        await ReactionService.unreact(
+            user_id=info.context["user_id"], training_id=input.training_id
+        )
+    except AppError as e:
+        return Error(message=e.message)
+    return OK()
+
+
+@strawberry.type
+class ReactionMutation:
+    react: OK | Error = strawberry.mutation(
+        resolver=react, permission_classes=[IsAuthenticated]
+    )
+    unreact: OK | Error = strawberry.mutation(
+        resolver=unreact, permission_classes=[IsAuthenticated]
+    )
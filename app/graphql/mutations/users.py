@@ -6,6 +6,7 @@ from app.domain.services.user_service import UserService
 from app.graphql.exceptions import InvalidEmail, InvalidPassword
 from app.graphql.input_types import UserInput
 from app.graphql.types import JWT, Error, User
+from app.passwords import PasswordHashingQueueFull
 
 
 async def create_user(input: UserInput) -> User | Error:
@@ -17,13 +18,15 @@ async def create_user(input: UserInput) -> User | Error:
         user = await UserService.create_user(email=input.email, password=input.password)
     except EmailAlreadyExists:
         return Error(message="Email address already taken")
+    except PasswordHashingQueueFull as e:
+        return Error(message=e.message)
     return User.from_entity(user)
 
 
 async def login_user(input: UserInput) -> JWT | Error:
     try:
-        jwt = UserService.get_user_jwt(input.email, input.password)
-    except LoginFailed as e:
+        jwt = await UserService.get_user_jwt(input.email, input.password)
+    except (LoginFailed, PasswordHashingQueueFull) as e:
         return Error(message=e.message)
     return JWT(jwt=jwt)
 
@@ -0,0 +1,66 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Callable, Generic, TypeVar
+
+import strawberry
+
+from app.graphql.exceptions import InvalidCursor, InvalidPageSize
+
+MAX_PAGE_SIZE = 100
+
+T = TypeVar("T")
+
+
+@strawberry.type
+class PageInfo:
+    has_next_page: bool
+    end_cursor: str | None
+
+
+@strawberry.type
+class Edge(Generic[T]):
+    cursor: str
+    node: T
+
+
+@strawberry.type
+class Connection(Generic[T]):
+    edges: list[Edge[T]]
+    page_info: PageInfo
+
+
+def encode_cursor(values: list[str]) -> str:
+    return urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list[str]:
+    try:
+        values = json.loads(urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor()
+    if not isinstance(values, list):
+        raise InvalidCursor()
+    return values
+
+
+def validate_page_size(first: int):
+    if not 0 < first <= MAX_PAGE_SIZE:
+        raise InvalidPageSize(
+            message=f"Page size must be between 1 and {MAX_PAGE_SIZE}"
+        )
+
+
+def build_connection(
+    nodes: list[T], first: int, get_cursor: Callable[[T], str]
+) -> Connection[T]:
+    """Builds a page out of `first + 1` fetched nodes, the extra one only tells
+    whether there is a next page."""
+    edges = [Edge(cursor=get_cursor(node), node=node) for node in nodes[:first]]
+    return Connection(
+        edges=edges,
+        page_info=PageInfo(
+            has_next_page=len(nodes) > first,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+    )
@@ -1,9 +1,10 @@
 import strawberry
 
+from app.graphql.queries.friend_suggestions import FriendSuggestionQuery
 from app.graphql.queries.friendship_requests import FriendshipRequestQuery
 from app.graphql.queries.trainings import TrainingQuery
 
 
 @strawberry.type
-class Query(TrainingQuery, FriendshipRequestQuery):
+class Query(TrainingQuery, FriendshipRequestQuery, FriendSuggestionQuery):
     pass
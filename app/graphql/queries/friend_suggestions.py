@@ -0,0 +1,31 @@
+import strawberry
+from strawberry.types import Info
+
+from app.config import FRIEND_SUGGESTIONS_PER_USER
+from app.domain.services.friend_suggestion_service import FriendSuggestionService
+from app.graphql.exceptions import InvalidPageSize
+from app.graphql.permissions import IsAuthenticated
+from app.graphql.types.friend_suggestions import FriendSuggestion
+
+
+async def get_friend_suggestions(info: Info, first: int = 10) -> list[FriendSuggestion]:
+    # Only the first FRIEND_SUGGESTIONS_PER_USER suggestions are computed.
+    if not 0 < first <= FRIEND_SUGGESTIONS_PER_USER:
+        raise InvalidPageSize(
+            message=f"Page size must be between 1 and {FRIEND_SUGGESTIONS_PER_USER}"
+        )
+    friend_suggestions = await FriendSuggestionService.get_friend_suggestions(
+        user_id=info.context["user_id"], limit=first
+    )
+
+    return [
+        FriendSuggestion.from_entity(friend_suggestion)
+        for friend_suggestion in friend_suggestions
+    ]
+
+
+@strawberry.type
+class FriendSuggestionQuery:
+    friend_suggestions: list[FriendSuggestion] = strawberry.field(
+        resolver=get_friend_suggestions, permission_classes=[IsAuthenticated]
+    )
@@ -1,9 +1,37 @@
+from datetime import datetime
+from functools import partial
+from uuid import UUID
+
 import strawberry
 from strawberry.types import Info
 
 from app.domain.services.friendship_request_service import FriendshipRequestService
+from app.graphql.exceptions import InvalidCursor
+from app.graphql.pagination import (
+    build_connection,
+    decode_cursor,
+    encode_cursor,
+    validate_page_size,
+)
 from app.graphql.permissions import IsAuthenticated
-from app.graphql.types.friendship_requests import FriendshipRequest
+from app.graphql.types.friendship_requests import (
+    FriendshipRequest,
+    FriendshipRequestConnection,
+)
+
+
+def encode_friendship_request_cursor(friendship_request: FriendshipRequest) -> str:
+    return encode_cursor(
+        [friendship_request.timestamp.isoformat(), str(friendship_request.id)]
+    )
+
+
+def decode_friendship_request_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        timestamp, friendship_request_id = decode_cursor(cursor)
+        return datetime.fromisoformat(timestamp), UUID(friendship_request_id)
+    except (TypeError, ValueError):
+        raise InvalidCursor()
 
 
 async def get_my_sent_friendship_requests(info: Info) -> list[FriendshipRequest]:
@@ -32,6 +60,66 @@ async def get_my_received_friendship_requests(info: Info) -> list[FriendshipRequ
     ]
 
 
+async def get_my_sent_friendship_requests_connection(
+    info: Info, first: int = 20, after: str | None = None
+) -> FriendshipRequestConnection:
+    validate_page_size(first)
+    user_id = info.context["user_id"]
+    friendship_requests = (
+        await FriendshipRequestService.get_pending_requests_sent_by_user_page(
+            user_id=user_id,
+            limit=first + 1,
+            after=decode_friendship_request_cursor(after) if after else None,
+        )
+    )
+    connection = build_connection(
+        nodes=[
+            FriendshipRequest.from_entity(friendship_request)
+            for friendship_request in friendship_requests
+        ],
+        first=first,
+        get_cursor=encode_friendship_request_cursor,
+    )
+    return FriendshipRequestConnection(
+        edges=connection.edges,
+        page_info=connection.page_info,
+        count=partial(
+            FriendshipRequestService.count_pending_requests_sent_by_user,
+            user_id=user_id,
+        ),
+    )
+
+
+async def get_my_received_friendship_requests_connection(
+    info: Info, first: int = 20, after: str | None = None
+) -> FriendshipRequestConnection:
+    validate_page_size(first)
+    user_id = info.context["user_id"]
+    friendship_requests = (
+        await FriendshipRequestService.get_pending_requests_received_by_user_page(
+            user_id=user_id,
+            limit=first + 1,
+            after=decode_friendship_request_cursor(after) if after else None,
+        )
+    )
+    connection = build_connection(
+        nodes=[
+            FriendshipRequest.from_entity(friendship_request)
+            for friendship_request in friendship_requests
+        ],
+        first=first,
+        get_cursor=encode_friendship_request_cursor,
+    )
+    return FriendshipRequestConnection(
+        edges=connection.edges,
+        page_info=connection.page_info,
+        count=partial(
+            FriendshipRequestService.count_pending_requests_received_by_user,
+            user_id=user_id,
+        ),
+    )
+
+
 @strawberry.type
 class FriendshipRequestQuery:
     my_sent_friendship_requests: list[FriendshipRequest] = strawberry.field(
@@ -41,3 +129,15 @@ class FriendshipRequestQuery:
         resolver=get_my_received_friendship_requests,
         permission_classes=[IsAuthenticated],
     )
+    my_sent_friendship_requests_connection: FriendshipRequestConnection = (
+        strawberry.field(
+            resolver=get_my_sent_friendship_requests_connection,
+            permission_classes=[IsAuthenticated],
+        )
+    )
+    my_received_friendship_requests_connection: FriendshipRequestConnection = (
+        strawberry.field(
+            resolver=get_my_received_friendship_requests_connection,
+            permission_classes=[IsAuthenticated],
+        )
+    )
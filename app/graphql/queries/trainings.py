@@ -1,13 +1,34 @@
+from datetime import datetime
 from uuid import UUID
 
 import strawberry
 from strawberry.types import Info
 
 from app.domain.services.training_service import TrainingService
+from app.graphql.exceptions import InvalidCursor
+from app.graphql.pagination import (
+    Connection,
+    build_connection,
+    decode_cursor,
+    encode_cursor,
+    validate_page_size,
+)
 from app.graphql.permissions import IsAuthenticated
 from app.graphql.types import Training
 
 
+def encode_training_cursor(training: Training) -> str:
+    return encode_cursor([training.start_time.isoformat(), str(training.id)])
+
+
+def decode_training_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        start_time, training_id = decode_cursor(cursor)
+        return datetime.fromisoformat(start_time), UUID(training_id)
+    except (TypeError, ValueError):
+        raise InvalidCursor()
+
+
 async def get_training(info: Info, id: UUID) -> Training | None:
     training = await TrainingService.get_training(
         request_user_id=info.context["user_id"],
@@ -24,6 +45,39 @@ async def get_user_trainings(info: Info, user_id: UUID) -> list[Training]:
     return [Training.from_entity(training) for training in trainings]
 
 
+async def get_user_trainings_connection(
+    info: Info, user_id: UUID, first: int = 20, after: str | None = None
+) -> Connection[Training]:
+    validate_page_size(first)
+    trainings = await TrainingService.get_user_trainings_page(
+        request_user_id=info.context["user_id"],
+        user_id=user_id,
+        limit=first + 1,
+        after=decode_training_cursor(after) if after else None,
+    )
+    return build_connection(
+        nodes=[Training.from_entity(training) for training in trainings],
+        first=first,
+        get_cursor=encode_training_cursor,
+    )
+
+
+async def get_friends_feed(
+    info: Info, first: int = 20, after: str | None = None
+) -> Connection[Training]:
+    validate_page_size(first)
+    trainings = await TrainingService.get_friends_feed_page(
+        user_id=info.context["user_id"],
+        limit=first + 1,
+        after=decode_training_cursor(after) if after else None,
+    )
+    return build_connection(
+        nodes=[Training.from_entity(training) for training in trainings],
+        first=first,
+        get_cursor=encode_training_cursor,
+    )
+
+
 @strawberry.type
 class TrainingQuery:
     training: Training | None = strawberry.field(
@@ -32,3 +86,9 @@ class TrainingQuery:
     trainings: list[Training] = strawberry.field(
         resolver=get_user_trainings, permission_classes=[IsAuthenticated]
     )
+    trainings_connection: Connection[Training] = strawberry.field(
+        resolver=get_user_trainings_connection, permission_classes=[IsAuthenticated]
+    )
+    friends_feed: Connection[Training] = strawberry.field(
+        resolver=get_friends_feed, permission_classes=[IsAuthenticated]
+    )
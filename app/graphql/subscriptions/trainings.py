@@ -1,23 +1,56 @@
+import math
 from typing import AsyncGenerator
-from uuid import UUID
 
 import strawberry
 from strawberry.types import Info
 
+from app.cache import LRUCache
+from app.config import RABBITMQ_SUBSCRIBER_QUEUE_SIZE
+from app.domain.events import load_new_training_event
 from app.domain.services.training_service import TrainingService
+from app.graphql.data_loaders import DataLoaders
 from app.graphql.permissions import IsAuthenticated
 from app.graphql.types import Training
-from app.rabbitmq import get_message, get_new_training_queue_name
+from app.rabbitmq import (
+    get_author_training_routing_key,
+    get_new_training_routing_key,
+    subscription_hub,
+)
 
 
 async def get_new_friends_training(info: Info):
     user_id = info.context["user_id"]
-    async for message in get_message(get_new_training_queue_name(user_id)):
-        training = await TrainingService.get_training(
-            request_user_id=user_id, training_id=UUID(message["training_id"])
-        )
-        if training:
-            yield Training.from_entity(training)
+    # Trainings of high fan-out friends are published once for all their
+    # friends. Friends who become high fan-out authors later are picked up when
+    # the client subscribes again.
+    high_fan_out_friends_ids = await TrainingService.get_high_fan_out_friends_ids(
+        user_id=user_id
+    )
+    routing_keys = [
+        get_new_training_routing_key(user_id),
+        *(
+            get_author_training_routing_key(friend_id)
+            for friend_id in high_fan_out_friends_ids
+        ),
+    ]
+    # A retried fan-out chunk can send a training again. Duplicates come
+    # within the retry delay, a few recent trainings are enough to catch them.
+    delivered_training_ids = LRUCache(
+        max_size=RABBITMQ_SUBSCRIBER_QUEUE_SIZE, ttl_in_seconds=math.inf
+    )
+    async with subscription_hub.subscribe(*routing_keys) as messages:
+        while True:
+            training = load_new_training_event(await messages.get())
+            if not training or delivered_training_ids.get(training.id):
+                continue
+            delivered_training_ids.set(training.id, True)
+            if await TrainingService.can_user_see_training(
+                request_user_id=user_id, training=training
+            ):
+                # The context lives as long as the websocket connection, every
+                # event gets fresh loaders so their cache does not grow with it.
+                info.context["data_loaders"] = DataLoaders()
+                yield Training.from_entity(training)
 
 
 @strawberry.type
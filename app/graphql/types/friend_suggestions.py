@@ -0,0 +1,24 @@
+from uuid import UUID
+
+import strawberry
+from strawberry.types import Info
+
+from app.domain import entities
+from app.graphql.types import User
+
+
+@strawberry.type
+class FriendSuggestion:
+    user_id: UUID
+    mutual_friends_count: int
+
+    @strawberry.field
+    async def user(self, info: Info) -> User:
+        return await info.context["data_loaders"].users_by_ids.load(self.user_id)
+
+    @classmethod
+    def from_entity(cls, friend_suggestion: entities.FriendSuggestion):
+        return cls(
+            user_id=friend_suggestion.user_id,
+            mutual_friends_count=friend_suggestion.mutual_friends_count,
+        )
@@ -1,10 +1,13 @@
 from datetime import datetime
+from typing import Awaitable, Callable
 from uuid import UUID
 
 import strawberry
+from strawberry.types import Info
 
 from app.domain import entities
-from app.graphql.types import User
+from app.graphql.pagination import Edge, PageInfo
+from app.graphql.types import OK, Error, User
 
 
 @strawberry.type
@@ -15,16 +18,12 @@ class FriendshipRequest:
     timestamp: datetime
 
     @strawberry.field
-    async def sender(self) -> User:
-        from app.graphql.data_loaders.users import get_users_by_ids_loader
-
-        return await get_users_by_ids_loader.load(self.sender_id)
+    async def sender(self, info: Info) -> User:
+        return await info.context["data_loaders"].users_by_ids.load(self.sender_id)
 
     @strawberry.field
-    async def receiver(self) -> User:
-        from app.graphql.data_loaders.users import get_users_by_ids_loader
-
-        return await get_users_by_ids_loader.load(self.receiver_id)
+    async def receiver(self, info: Info) -> User:
+        return await info.context["data_loaders"].users_by_ids.load(self.receiver_id)
 
     @classmethod
     def from_entity(cls, friendship_request: entities.FriendshipRequest):
@@ -34,3 +33,26 @@ class FriendshipRequest:
             receiver_id=friendship_request.receiver_id,
             timestamp=friendship_request.timestamp,
         )
+
+
+@strawberry.type
+class FriendshipRequestResult:
+    friendship_request_id: UUID
+    result: OK | Error
+
+
+@strawberry.type
+class FriendshipRequestResults:
+    results: list[FriendshipRequestResult]
+
+
+@strawberry.type
+class FriendshipRequestConnection:
+    edges: list[Edge[FriendshipRequest]]
+    page_info: PageInfo
+    count: strawberry.Private[Callable[[], Awaitable[int]]]
+
+    @strawberry.field
+    async def total_count(self) -> int:
+        # Only counted when selected.
+        return await self.count()
@@ -3,6 +3,7 @@ from __future__ import annotations
 from uuid import UUID
 
 import strawberry
+from strawberry.types import Info
 
 from app import enums
 from app.domain import entities
@@ -18,10 +19,8 @@ class Reaction:
     user_id: UUID
 
     @strawberry.field
-    async def user(self) -> User:
-        from app.graphql.data_loaders.users import get_users_by_ids_loader
-
-        return await get_users_by_ids_loader.load(self.user_id)
+    async def user(self, info: Info) -> User:
+        return await info.context["data_loaders"].users_by_ids.load(self.user_id)
 
     @classmethod
     def from_entity(cls, reaction: entities.Reaction) -> Reaction:
@@ -4,6 +4,7 @@ from datetime import datetime
 from uuid import UUID
 
 import strawberry
+from strawberry.types import Info
 
 from app.domain import entities
 from app.graphql.types.reactions import Reaction
@@ -17,20 +18,14 @@ class Training:
     name: str
 
     @strawberry.field
-    async def reactions_count(self) -> int:
-        from app.graphql.data_loaders.reactions import (
-            get_reaction_count_by_training_ids_loader,
-        )
-
-        return await get_reaction_count_by_training_ids_loader.load(self.id)
+    async def reactions_count(self, info: Info) -> int:
+        data_loaders = info.context["data_loaders"]
+        return await data_loaders.reaction_count_by_training_ids.load(self.id)
 
     @strawberry.field
-    async def reactions(self) -> list[Reaction]:
-        from app.graphql.data_loaders.reactions import (
-            get_reactions_by_training_ids_loader,
-        )
-
-        return await get_reactions_by_training_ids_loader.load(self.id)
+    async def reactions(self, info: Info) -> list[Reaction]:
+        data_loaders = info.context["data_loaders"]
+        return await data_loaders.reactions_by_training_ids.load(self.id)
 
     @classmethod
     def from_entity(cls, training: entities.Training) -> Training:
@@ -2,7 +2,9 @@ import re
 import string
 
 from app.config import PASSWORD_MIN_LENGTH
-from app.graphql.exceptions import InvalidEmail, InvalidPassword
+from app.graphql.exceptions import InvalidBatchSize, InvalidEmail, InvalidPassword
+
+MAX_BATCH_SIZE = 100
 
 
 def validate_email(email: str):
@@ -31,3 +33,10 @@ def validate_password(password: str):
         raise InvalidPassword(
             message="Password must contain at least one special character"
         )
+
+
+def validate_batch_size(size: int):
+    if not 0 < size <= MAX_BATCH_SIZE:
+        raise InvalidBatchSize(
+            message=f"Batch size must be between 1 and {MAX_BATCH_SIZE}"
+        )
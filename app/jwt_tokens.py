@@ -1,9 +1,18 @@
+import time
 from datetime import datetime, timedelta
 from uuid import UUID
 
 from jose import JWTError, jwt
 
 from app import config
+from app.cache import LRUCache
+
+# Verified tokens, each kept until it expires so an expired token is verified
+# (and rejected) again.
+verified_tokens: LRUCache[str, UUID] = LRUCache(
+    max_size=config.JWT_CACHE_SIZE,
+    ttl_in_seconds=config.JWT_EXPIRE_TIME_IN_MINUTES * 60,
+)
 
 
 def create_access_token(user_id: UUID) -> str:
@@ -14,6 +23,9 @@ def create_access_token(user_id: UUID) -> str:
 
 
 def get_user_id_from_token(token: str) -> UUID | None:
+    user_id = verified_tokens.get(token)
+    if user_id is not None:
+        return user_id
     try:
         payload = jwt.decode(
             token, config.JWT_SECRET, algorithms=[config.JWT_ALGORITHM]
@@ -22,4 +34,9 @@ def get_user_id_from_token(token: str) -> UUID | None:
         return None
     user_id = payload.get("sub")
     if user_id is not None:
-        return UUID(user_id)
+        user_id = UUID(user_id)
+        if "exp" in payload:
+            verified_tokens.set(
+                token, user_id, ttl_in_seconds=payload["exp"] - time.time()
+            )
+        return user_id
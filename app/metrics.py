@@ -0,0 +1,29 @@
+class Metric:
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.value = 0
+        registry[name] = self
+
+
+class Counter(Metric):
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+
+class Gauge(Metric):
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+
+registry: dict[str, Metric] = {}
+
+
+def get_metrics() -> dict[str, float]:
+    return {name: metric.value for name, metric in registry.items()}
@@ -1,6 +1,9 @@
+from app.models.friend_suggestions import *  # noqa
 from app.models.friendship_requests import *  # noqa
 from app.models.friendships import *  # noqa
+from app.models.outbox import *  # noqa
 from app.models.profiles import *  # noqa
 from app.models.reactions import *  # noqa
+from app.models.timelines import *  # noqa
 from app.models.trainings import *  # noqa
 from app.models.users import *  # noqa
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.base import Base
+
+
+class FriendSuggestion(Base):
+    """A user suggested as a friend, with the mutual friends count it was
+    ranked by.
+
+    Computed in the background by app.tasks.compute_friend_suggestions, users
+    who became friends or have a pending request since are filtered out when
+    read.
+    """
+
+    __tablename__ = "friend_suggestion"
+
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("user.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    suggested_user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("user.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    mutual_friends_count = Column(Integer, nullable=False)
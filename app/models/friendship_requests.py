@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -24,3 +24,28 @@ class FriendshipRequest(Base):
 
     sender = relationship("User", foreign_keys=[sender_id])
     receiver = relationship("User", foreign_keys=[receiver_id])
+
+    __table_args__ = (
+        Index(
+            "ix_friendship_request_pending_receiver_id_timestamp_id",
+            receiver_id,
+            timestamp,
+            id,
+            postgresql_where=status == FriendshipRequestStatusEnum.pending,
+        ),
+        Index(
+            "ix_friendship_request_pending_sender_id_timestamp_id",
+            sender_id,
+            timestamp,
+            id,
+            postgresql_where=status == FriendshipRequestStatusEnum.pending,
+        ),
+        # At most one pending request between two users, whoever sent it.
+        Index(
+            "ix_friendship_request_pending_pair",
+            func.least(sender_id, receiver_id),
+            func.greatest(sender_id, receiver_id),
+            unique=True,
+            postgresql_where=status == FriendshipRequestStatusEnum.pending,
+        ),
+    )
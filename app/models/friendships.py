@@ -1,10 +1,16 @@
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
 
 
 class Friendship(Base):
+    """A friendship, stored once with the lower user id first.
+
+    Friends of a user are found through the primary key when the user is
+    user_1 and through the user_2_id index otherwise.
+    """
+
     __tablename__ = "friendship"
 
     user_1_id = Column(ForeignKey("user.id"), primary_key=True)
@@ -12,3 +18,10 @@ class Friendship(Base):
 
     user_1 = relationship("User", foreign_keys=[user_1_id])
     user_2 = relationship("User", foreign_keys=[user_2_id])
+
+    __table_args__ = (
+        CheckConstraint(
+            user_1_id < user_2_id, name="ck_friendship_user_1_id_lt_user_2_id"
+        ),
+        Index("ix_friendship_user_2_id", user_2_id),
+    )
@@ -0,0 +1,20 @@
+from sqlalchemy import BigInteger, Column, DateTime, Identity, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.models.base import Base
+
+
+class OutboxMessage(Base):
+    """A Celery task to send once the transaction that added it commits.
+
+    Written in the same transaction as the change it is about, so the task is
+    sent if and only if the change is committed. app.outbox_relay sends the
+    messages in id order and deletes them.
+    """
+
+    __tablename__ = "outbox"
+
+    id = Column(BigInteger, Identity(), primary_key=True)
+    task = Column(String, nullable=False)
+    kwargs = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey
+from sqlalchemy import DDL, Column, DateTime, Enum, ForeignKey, Index, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -19,3 +19,98 @@ class Reaction(Base):
 
     user = relationship("User", back_populates="reactions")
     training = relationship("Training", back_populates="reactions")
+
+    __table_args__ = (
+        Index("ix_reaction_training_id_created_at", training_id, created_at),
+        # One reaction per user and training, also the conflict target of the
+        # batched reaction upserts.
+        Index("uq_reaction_user_id_training_id", user_id, training_id, unique=True),
+    )
+
+
+# Statement-level triggers keep training.likes_count and training.dislikes_count
+# in step with the reaction rows: every INSERT, DELETE or UPDATE statement on
+# reaction adjusts the counters once per touched training, whatever the number
+# of rows. Training rows are locked in id order first so concurrent multi-row
+# statements can not deadlock on them.
+update_training_reaction_counts_function = DDL(
+    """
+    CREATE OR REPLACE FUNCTION update_training_reaction_counts() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM 1 FROM training
+            WHERE id IN (SELECT training_id FROM new_reactions)
+            ORDER BY id
+            FOR NO KEY UPDATE;
+            UPDATE training
+            SET likes_count = training.likes_count + counts.likes_count,
+                dislikes_count = training.dislikes_count + counts.dislikes_count
+            FROM (
+                SELECT
+                    training_id,
+                    count(*) FILTER (WHERE reaction_type = 'like') AS likes_count,
+                    count(*) FILTER (WHERE reaction_type = 'dislike')
+                        AS dislikes_count
+                FROM new_reactions
+                GROUP BY training_id
+            ) AS counts
+            WHERE training.id = counts.training_id;
+        END IF;
+        IF TG_OP IN ('DELETE', 'UPDATE') THEN
+            PERFORM 1 FROM training
+            WHERE id IN (SELECT training_id FROM old_reactions)
+            ORDER BY id
+            FOR NO KEY UPDATE;
+            UPDATE training
+            SET likes_count = training.likes_count - counts.likes_count,
+                dislikes_count = training.dislikes_count - counts.dislikes_count
+            FROM (
+                SELECT
+                    training_id,
+                    count(*) FILTER (WHERE reaction_type = 'like') AS likes_count,
+                    count(*) FILTER (WHERE reaction_type = 'dislike')
+                        AS dislikes_count
+                FROM old_reactions
+                GROUP BY training_id
+            ) AS counts
+            WHERE training.id = counts.training_id;
+        END IF;
+        RETURN NULL;
+    END;
+    $$
+    """
+)
+# Transition tables are only allowed on triggers with a single event.
+reaction_counts_triggers = [
+    DDL(
+        """
+        CREATE TRIGGER reaction_counts_insert
+        AFTER INSERT ON reaction
+        REFERENCING NEW TABLE AS new_reactions
+        FOR EACH STATEMENT EXECUTE FUNCTION update_training_reaction_counts()
+        """
+    ),
+    DDL(
+        """
+        CREATE TRIGGER reaction_counts_delete
+        AFTER DELETE ON reaction
+        REFERENCING OLD TABLE AS old_reactions
+        FOR EACH STATEMENT EXECUTE FUNCTION update_training_reaction_counts()
+        """
+    ),
+    DDL(
+        """
+        CREATE TRIGGER reaction_counts_update
+        AFTER UPDATE ON reaction
+        REFERENCING OLD TABLE AS old_reactions NEW TABLE AS new_reactions
+        FOR EACH STATEMENT EXECUTE FUNCTION update_training_reaction_counts()
+        """
+    ),
+]
+
+event.listen(
+    Reaction.__table__, "after_create", update_training_reaction_counts_function
+)
+for reaction_counts_trigger in reaction_counts_triggers:
+    event.listen(Reaction.__table__, "after_create", reaction_counts_trigger)
@@ -0,0 +1,44 @@
+from sqlalchemy import Column, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.base import Base
+
+
+class TimelineEntry(Base):
+    """A training of a friend, written to the viewer's timeline when the
+    training is created.
+
+    The primary key orders a viewer's rows newest first, so a feed page is a
+    single range scan of it. start_time is copied from the training to keep it
+    in the key.
+    """
+
+    __tablename__ = "timeline"
+
+    viewer_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("user.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    start_time = Column(DateTime, primary_key=True)
+    training_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("training.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+
+class HighFanOutAuthor(Base):
+    """An author with too many friends to copy trainings to all timelines.
+
+    Their trainings stay off the timelines and are merged into their friends'
+    feeds when read, from the (user_id, start_time, id) index on training.
+    """
+
+    __tablename__ = "high_fan_out_author"
+
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("user.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, String
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -17,8 +17,15 @@ class Training(Base):
     name = Column(String)
     user_id = Column(UUID(as_uuid=True), ForeignKey("user.id"), nullable=False)
     visibility = Column(Enum(TrainingVisibilityEnum))
+    # Maintained by the triggers on reaction, see app/models/reactions.py.
+    likes_count = Column(Integer, nullable=False, server_default="0")
+    dislikes_count = Column(Integer, nullable=False, server_default="0")
 
     user = relationship("User", back_populates="trainings")
     reactions = relationship(
         "Reaction", back_populates="training", cascade="all, delete-orphan"
     )
+
+    __table_args__ = (
+        Index("ix_training_user_id_start_time_id", user_id, start_time, id),
+    )
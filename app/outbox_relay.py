@@ -0,0 +1,87 @@
+"""Sends the Celery tasks written to the outbox: `python -m app.outbox_relay`.
+
+Messages are locked in batches with FOR UPDATE SKIP LOCKED, so several relays
+can run side by side, and deleted in the same transaction once the broker has
+confirmed them. A relay dying in between sends the batch again, the tasks are
+idempotent.
+"""
+import argparse
+import asyncio
+import logging
+import signal
+
+from app import tasks
+from app.config import (
+    OUTBOX_RELAY_BATCH_SIZE,
+    OUTBOX_RELAY_POLL_INTERVAL_IN_MILLISECONDS,
+)
+from app.database import dispose_engine
+from app.domain import entities
+from app.domain.repositories.outbox_repository import OutboxRepository
+
+logger = logging.getLogger(__name__)
+
+RETRY_DELAY_IN_SECONDS = 5
+
+
+def send_tasks(messages: list[entities.OutboxMessage]):
+    # One connection for the batch, publish waits for the broker confirm.
+    with tasks.app.producer_or_acquire() as producer:
+        for message in messages:
+            tasks.app.send_task(message.task, kwargs=message.kwargs, producer=producer)
+
+
+async def relay_batch(batch_size: int) -> int:
+    async with OutboxRepository() as repository:
+        messages = await repository.lock_messages(limit=batch_size)
+        if messages:
+            await asyncio.to_thread(send_tasks, messages)
+            await repository.delete_messages([message.id for message in messages])
+    return len(messages)
+
+
+async def relay(batch_size: int, poll_interval_in_seconds: float):
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, stopping.set)
+
+    while not stopping.is_set():
+        try:
+            sent_count = await relay_batch(batch_size=batch_size)
+        except Exception:
+            # The broker or the database is down, the batch is still in the
+            # outbox and is sent again once they are back.
+            logger.exception("Outbox relay batch failed")
+            delay = RETRY_DELAY_IN_SECONDS
+        else:
+            if sent_count:
+                logger.info("Sent %d outbox messages", sent_count)
+            delay = poll_interval_in_seconds if sent_count < batch_size else 0
+        if delay:
+            try:
+                await asyncio.wait_for(stopping.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+
+async def main(batch_size: int, poll_interval_in_seconds: float):
+    try:
+        await relay(
+            batch_size=batch_size, poll_interval_in_seconds=poll_interval_in_seconds
+        )
+    finally:
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=OUTBOX_RELAY_BATCH_SIZE)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(
+        main(
+            batch_size=args.batch_size,
+            poll_interval_in_seconds=OUTBOX_RELAY_POLL_INTERVAL_IN_MILLISECONDS / 1000,
+        )
+    )
@@ -1,7 +1,27 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 from passlib.context import CryptContext
 
+from app import config
+from app.metrics import Counter, Gauge
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+password_hashing_queue_depth = Gauge(
+    "password_hashing_queue_depth",
+    "Password hashing/verification calls submitted to the pool and not finished",
+)
+password_hashing_rejected = Counter(
+    "password_hashing_rejected_total",
+    "Password hashing/verification calls rejected because the queue was full",
+)
+
+
+class PasswordHashingQueueFull(Exception):
+    message = "Too many requests, try again later"
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -9,3 +29,59 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+class PasswordHashingPool:
+    """Runs bcrypt in worker processes so it does not block the event loop.
+
+    At most `max_queue_size` calls may wait for or run in the pool, further calls
+    fail fast with PasswordHashingQueueFull instead of piling up.
+    """
+
+    def __init__(self, max_workers: int, max_queue_size: int):
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Forking a process that runs an event loop and driver threads is not
+            # safe, workers are started fresh instead.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def run(self, function, *args):
+        if password_hashing_queue_depth.value >= self.max_queue_size:
+            password_hashing_rejected.inc()
+            raise PasswordHashingQueueFull()
+        password_hashing_queue_depth.inc()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), function, *args
+            )
+        finally:
+            password_hashing_queue_depth.dec()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hashing_pool = PasswordHashingPool(
+    max_workers=config.PASSWORD_HASHING_POOL_SIZE,
+    max_queue_size=config.PASSWORD_HASHING_MAX_QUEUE_SIZE,
+)
+
+
+async def async_verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hashing_pool.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def async_get_password_hash(password: str) -> str:
+    return await password_hashing_pool.run(get_password_hash, password)
@@ -1,41 +1,247 @@
+import asyncio
 import json
+import logging
+import os
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from uuid import UUID
 
 import aio_pika
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractExchange,
+    AbstractIncomingMessage,
+    AbstractQueue,
+    AbstractRobustConnection,
+)
+from aio_pika.pool import Pool
 
-from app.config import RABBITMQ_URL
+from app.config import (
+    RABBITMQ_CHANNEL_POOL_SIZE,
+    RABBITMQ_SUBSCRIBER_QUEUE_SIZE,
+    RABBITMQ_TRAININGS_EXCHANGE,
+    RABBITMQ_URL,
+)
+from app.metrics import Counter, Gauge
 
+logger = logging.getLogger(__name__)
 
-def get_new_training_queue_name(user_id: UUID) -> str:
-    return f"new-training-{user_id}"
+subscribers_gauge = Gauge(
+    "subscription_hub_subscribers", "Subscribers listening on this process"
+)
+dropped_messages_counter = Counter(
+    "subscription_hub_dropped_messages_total",
+    "Messages dropped because a subscriber queue was full",
+)
 
 
-async def publish_message(message, routing_key):
-    connection = await aio_pika.connect_robust(RABBITMQ_URL)
+def get_new_training_routing_key(user_id: UUID) -> str:
+    return f"new-training.{user_id}"
+
+
+def get_author_training_routing_key(author_id: UUID) -> str:
+    # Trainings of authors with too many friends to fan out to, published once
+    # for all the friends, see app.tasks.async_handle_new_training.
+    return f"author-training.{author_id}"
+
+
+# Friendships made, consumed by every API process keeping a friendship graph.
+NEW_FRIENDSHIP_ROUTING_KEY = "new-friendship"
+
+
+async def declare_exchange(channel: AbstractChannel, name: str) -> AbstractExchange:
+    return await channel.declare_exchange(
+        name, aio_pika.ExchangeType.DIRECT, durable=True
+    )
+
+
+class RabbitMQPublisher:
+    """Publishes over one long-lived robust connection and a pool of channels.
+
+    The connection is opened lazily on the first publish and opened again when
+    it is used from another event loop than the one it was created in (a
+    connection can not outlive its loop). One instance is meant to be shared by
+    the whole process.
+    """
+
+    def __init__(self, url: str, exchange_name: str, channel_pool_size: int):
+        self.url = url
+        self.exchange_name = exchange_name
+        self.channel_pool_size = channel_pool_size
+        self._connection: AbstractRobustConnection | None = None
+        self._channel_pool: Pool[AbstractChannel] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+
+    async def _open_channel(self) -> AbstractChannel:
+        channel = await self._connection.channel()
+        await declare_exchange(channel, self.exchange_name)
+        return channel
+
+    async def _get_channel_pool(self) -> Pool[AbstractChannel]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self.reset()
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._channel_pool is None:
+                self._connection = await aio_pika.connect_robust(self.url)
+                self._channel_pool = Pool(
+                    self._open_channel, max_size=self.channel_pool_size
+                )
+        return self._channel_pool
 
-    async with connection:
-        channel = await connection.channel()
+    async def publish(self, message, routing_key: str):
+        channel_pool = await self._get_channel_pool()
+        async with channel_pool.acquire() as channel:
+            # The exchange was declared when the channel was opened.
+            exchange = await channel.get_exchange(self.exchange_name, ensure=False)
+            await exchange.publish(
+                aio_pika.Message(body=json.dumps(message).encode()),
+                routing_key=routing_key,
+            )
 
-        await channel.default_exchange.publish(
-            aio_pika.Message(body=json.dumps(message).encode()),
-            routing_key=routing_key,
-        )
+    async def close(self):
+        if self._channel_pool is not None:
+            await self._channel_pool.close()
+        if self._connection is not None:
+            await self._connection.close()
+        self.reset()
 
+    def reset(self):
+        # Forgets the connection without closing it, used when it belongs to
+        # another event loop or to the parent process after a fork.
+        self._connection = None
+        self._channel_pool = None
+        self._loop = None
+        self._lock = None
 
-async def get_message(queue_name):
-    connection = await aio_pika.connect_robust(RABBITMQ_URL)
 
-    async with connection:
-        # Creating channel
-        channel = await connection.channel()
+class SubscriptionHub:
+    """Routes broker messages to the subscribers of this process.
 
-        # Will take no more than 10 messages in advance
-        await channel.set_qos(prefetch_count=10)
+    The hub consumes from one exclusive queue over one connection. The queue is
+    bound to a routing key while at least one local subscriber listens on it,
+    and every message is copied to the bounded queue of each of its
+    subscribers. A subscriber that does not keep up loses messages instead of
+    holding back the others.
+    """
 
-        # Declaring queue
-        queue = await channel.declare_queue(queue_name, auto_delete=True)
+    def __init__(self, url: str, exchange_name: str, subscriber_queue_size: int):
+        self.url = url
+        self.exchange_name = exchange_name
+        self.subscriber_queue_size = subscriber_queue_size
+        self._subscribers: dict[str, set[asyncio.Queue]] = defaultdict(set)
+        self._connection: AbstractRobustConnection | None = None
+        self._exchange: AbstractExchange | None = None
+        self._queue: AbstractQueue | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
 
-        async with queue.iterator() as queue_iter:
-            async for message in queue_iter:
-                async with message.process():
-                    yield json.loads(message.body.decode())
+    def _check_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self.reset()
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+    async def _start(self):
+        self._connection = await aio_pika.connect_robust(self.url)
+        channel = await self._connection.channel()
+        self._exchange = await declare_exchange(channel, self.exchange_name)
+        self._queue = await channel.declare_queue(exclusive=True)
+        await self._queue.consume(self._on_message, no_ack=True)
+
+    async def _on_message(self, message: AbstractIncomingMessage):
+        subscribers = self._subscribers.get(message.routing_key)
+        if not subscribers:
+            return
+        body = json.loads(message.body.decode())
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(body)
+            except asyncio.QueueFull:
+                dropped_messages_counter.inc()
+                logger.warning(
+                    "Subscriber queue is full, dropping message for %s",
+                    message.routing_key,
+                )
+
+    @asynccontextmanager
+    async def subscribe(
+        self, *routing_keys: str, queue_size: int | None = None
+    ) -> AsyncIterator[asyncio.Queue]:
+        """Yields a queue receiving the messages published with any of
+        `routing_keys`.
+
+        The queue holds `queue_size` messages, the hub's subscriber queue size
+        by default, 0 for no limit.
+        """
+        if queue_size is None:
+            queue_size = self.subscriber_queue_size
+        subscriber = asyncio.Queue(maxsize=queue_size)
+        self._check_loop()
+        async with self._lock:
+            if self._queue is None:
+                await self._start()
+            for routing_key in routing_keys:
+                if routing_key not in self._subscribers:
+                    await self._queue.bind(self._exchange, routing_key=routing_key)
+                self._subscribers[routing_key].add(subscriber)
+        subscribers_gauge.inc()
+        try:
+            yield subscriber
+        finally:
+            subscribers_gauge.dec()
+            await self._unsubscribe(routing_keys, subscriber)
+
+    async def _unsubscribe(self, routing_keys: tuple[str], subscriber: asyncio.Queue):
+        if self._lock is None:
+            # The hub was closed while the subscriber was listening.
+            return
+        async with self._lock:
+            for routing_key in routing_keys:
+                subscribers = self._subscribers.get(routing_key)
+                if subscribers is None or subscriber not in subscribers:
+                    # The hub was reset while the subscriber was listening.
+                    continue
+                subscribers.remove(subscriber)
+                if not subscribers:
+                    del self._subscribers[routing_key]
+                    await self._queue.unbind(self._exchange, routing_key=routing_key)
+
+    async def close(self):
+        if self._connection is not None:
+            await self._connection.close()
+        self.reset()
+
+    def reset(self):
+        # Same as RabbitMQPublisher.reset, the exclusive queue and its bindings
+        # go away with the connection so the subscribers have to go as well.
+        self._subscribers.clear()
+        self._connection = None
+        self._exchange = None
+        self._queue = None
+        self._loop = None
+        self._lock = None
+
+
+publisher = RabbitMQPublisher(
+    url=RABBITMQ_URL,
+    exchange_name=RABBITMQ_TRAININGS_EXCHANGE,
+    channel_pool_size=RABBITMQ_CHANNEL_POOL_SIZE,
+)
+os.register_at_fork(after_in_child=publisher.reset)
+
+subscription_hub = SubscriptionHub(
+    url=RABBITMQ_URL,
+    exchange_name=RABBITMQ_TRAININGS_EXCHANGE,
+    subscriber_queue_size=RABBITMQ_SUBSCRIBER_QUEUE_SIZE,
+)
+os.register_at_fork(after_in_child=subscription_hub.reset)
+
+
+async def publish_message(message, routing_key):
+    await publisher.publish(message, routing_key)
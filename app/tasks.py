@@ -1,27 +1,206 @@
+import asyncio
 from uuid import UUID
 
-from asgiref.sync import async_to_sync
-from celery import Celery
+from celery import Celery, group
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
 
-from app.config import RABBITMQ_URL
+from app.config import (
+    FEED_FAN_OUT_CHUNK_MAX_RETRIES,
+    FEED_FAN_OUT_CHUNK_SIZE,
+    FEED_FAN_OUT_MAX_FRIENDS,
+    FRIEND_SUGGESTIONS_INTERVAL_IN_SECONDS,
+    RABBITMQ_URL,
+    REACTION_COUNTS_RECONCILIATION_BATCH_SIZE,
+    REACTION_COUNTS_RECONCILIATION_INTERVAL_IN_SECONDS,
+)
+from app.database import dispose_engine
+from app.domain.events import dump_new_friendship_event, dump_new_training_event
+from app.domain.repositories.base import UnitOfWork
 from app.domain.repositories.friendship_repository import FriendshipRepository
-from app.rabbitmq import get_new_training_queue_name, publish_message
+from app.domain.repositories.reaction_repository import ReactionRepository
+from app.domain.repositories.timeline_repository import TimelineRepository
+from app.domain.repositories.training_repository import TrainingRepository
+from app.domain.services.friend_suggestion_service import FriendSuggestionService
+from app.enums import TrainingVisibilityEnum
+from app.event_loop import run_async, worker_event_loop
+from app.rabbitmq import (
+    NEW_FRIENDSHIP_ROUTING_KEY,
+    get_author_training_routing_key,
+    get_new_training_routing_key,
+    publish_message,
+    publisher,
+)
 
 app = Celery("tasks", broker=RABBITMQ_URL)
+# Publishing returns once the broker has taken the message, app.outbox_relay
+# deletes the outbox messages only then.
+app.conf.broker_transport_options = {"confirm_publish": True}
+app.conf.beat_schedule = {
+    "reconcile-reaction-counts": {
+        "task": "app.tasks.reconcile_reaction_counts",
+        "schedule": REACTION_COUNTS_RECONCILIATION_INTERVAL_IN_SECONDS,
+    },
+    "compute-friend-suggestions": {
+        "task": "app.tasks.compute_friend_suggestions",
+        "schedule": FRIEND_SUGGESTIONS_INTERVAL_IN_SECONDS,
+    },
+}
+
+worker_event_loop.on_shutdown(publisher.close)
+worker_event_loop.on_shutdown(dispose_engine)
+
+
+@worker_process_init.connect
+def start_worker_event_loop(**kwargs):
+    worker_event_loop.start()
+
+
+# worker_shutdown covers the solo pool, where tasks run in the main process.
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def shutdown_worker_event_loop(**kwargs):
+    worker_event_loop.shutdown()
 
 
 async def async_handle_new_training(user_id: str, training_id: str):
-    async with FriendshipRepository() as repository:
-        friends_ids = await repository.get_user_friends_ids(user_id=UUID(user_id))
-    for friend_id in friends_ids:
+    async with (
+        UnitOfWork() as unit_of_work,
+        TrainingRepository(unit_of_work) as training_repository,
+        FriendshipRepository(unit_of_work) as friendship_repository,
+        TimelineRepository(unit_of_work) as timeline_repository,
+    ):
+        training = await training_repository.get_training_with_visibility(
+            training_id=UUID(training_id)
+        )
+        if not training or training.visibility == TrainingVisibilityEnum.private:
+            return
+        friends_count = await friendship_repository.count_user_friends(
+            user_id=training.user_id
+        )
+        if friends_count > FEED_FAN_OUT_MAX_FRIENDS:
+            # Too many friends to write to, the feeds read the training from
+            # the author and the subscribers listen to the author.
+            await timeline_repository.mark_high_fan_out_author(user_id=training.user_id)
+            friends_ids = None
+        else:
+            friends_ids = sorted(
+                await friendship_repository.get_user_friends_ids(
+                    user_id=training.user_id
+                )
+            )
+    # Subscribers build the training from the event instead of querying it.
+    event = dump_new_training_event(training)
+    if friends_ids is None:
         await publish_message(
-            message={
-                "training_id": training_id,
-            },
-            routing_key=get_new_training_queue_name(friend_id),
+            message=event,
+            routing_key=get_author_training_routing_key(training.user_id),
+        )
+        return
+    # Every chunk is a subtask of its own, retried on its own, so the friends
+    # are served by all the workers instead of holding this one.
+    group(
+        fan_out_training_chunk.s(
+            training_id=training_id,
+            event=event,
+            friends_ids=[
+                str(friend_id)
+                for friend_id in friends_ids[start : start + FEED_FAN_OUT_CHUNK_SIZE]
+            ],
         )
+        for start in range(0, len(friends_ids), FEED_FAN_OUT_CHUNK_SIZE)
+    ).delay()
 
 
 @app.task
 def handle_new_training(user_id: str, training_id: str):
-    async_to_sync(async_handle_new_training)(user_id, training_id)
+    run_async(async_handle_new_training(user_id, training_id))
+
+
+async def async_fan_out_training_chunk(
+    training_id: str, event: dict, friends_ids: list[str]
+):
+    """Writes the training to the friends' timelines and sends them the event.
+
+    A timeline entry is the idempotency key of its delivery: only the friends
+    whose entry this call wrote are sent the event, so a retried chunk skips
+    the friends it already served. The entries are committed after the events
+    are published, a chunk failing in between is retried whole and may send
+    an event twice, which subscribers drop.
+    """
+    async with TimelineRepository() as repository:
+        new_viewers_ids = await repository.add_training_to_timelines(
+            training_id=UUID(training_id),
+            viewers_ids=[UUID(friend_id) for friend_id in friends_ids],
+        )
+        await asyncio.gather(
+            *(
+                publish_message(
+                    message=event,
+                    routing_key=get_new_training_routing_key(viewer_id),
+                )
+                for viewer_id in new_viewers_ids
+            )
+        )
+
+
+# acks_late hands the chunk to another worker if this one dies while on it.
+@app.task(
+    acks_late=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=FEED_FAN_OUT_CHUNK_MAX_RETRIES,
+)
+def fan_out_training_chunk(training_id: str, event: dict, friends_ids: list[str]):
+    run_async(async_fan_out_training_chunk(training_id, event, friends_ids))
+
+
+async def async_handle_new_friendship(user_1_id: str, user_2_id: str):
+    async with TimelineRepository() as repository:
+        await repository.add_friends_trainings_to_timelines(
+            user_1_id=UUID(user_1_id), user_2_id=UUID(user_2_id)
+        )
+    await publish_message(
+        message=dump_new_friendship_event(UUID(user_1_id), UUID(user_2_id)),
+        routing_key=NEW_FRIENDSHIP_ROUTING_KEY,
+    )
+    # Each one's friends are new friends of friends of the other. Suggestions
+    # of the friends' other friends are updated by the next full computation.
+    for user_id in (user_1_id, user_2_id):
+        await FriendSuggestionService.refresh_friend_suggestions(UUID(user_id))
+
+
+@app.task
+def handle_new_friendship(user_1_id: str, user_2_id: str):
+    run_async(async_handle_new_friendship(user_1_id, user_2_id))
+
+
+async def async_reconcile_reaction_counts(batch_size: int) -> int:
+    # Every batch is committed on its own so trainings are not locked for the
+    # whole run.
+    repaired_count = 0
+    last_training_id = None
+    while True:
+        async with ReactionRepository() as repository:
+            (
+                last_training_id,
+                batch_repaired_count,
+            ) = await repository.reconcile_reaction_counts(
+                after=last_training_id, limit=batch_size
+            )
+        repaired_count += batch_repaired_count
+        if last_training_id is None:
+            return repaired_count
+
+
+@app.task
+def reconcile_reaction_counts():
+    return run_async(
+        async_reconcile_reaction_counts(
+            batch_size=REACTION_COUNTS_RECONCILIATION_BATCH_SIZE
+        )
+    )
+
+
+@app.task
+def compute_friend_suggestions():
+    return run_async(FriendSuggestionService.compute_friend_suggestions())
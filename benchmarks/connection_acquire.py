@@ -0,0 +1,46 @@
+"""Connection acquire latency of NullPool vs the pooled engine.
+
+Usage: python -m benchmarks.connection_acquire [iterations]
+"""
+import asyncio
+import statistics
+import sys
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.database import database_url, get_engine_options
+
+
+async def measure(engine, iterations: int) -> list[float]:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        timings.append((time.perf_counter() - start) * 1000)
+    await engine.dispose()
+    return timings
+
+
+def report(name: str, timings: list[float]):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(
+        f"{name:<10} p50={statistics.median(timings):.2f}ms p95={p95:.2f}ms "
+        f"max={timings[-1]:.2f}ms"
+    )
+
+
+async def main(iterations: int):
+    null_pool_engine = create_async_engine(database_url, poolclass=NullPool)
+    pooled_engine = create_async_engine(database_url, **get_engine_options())
+
+    report("NullPool", await measure(null_pool_engine, iterations))
+    report("Pooled", await measure(pooled_engine, iterations))
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
@@ -0,0 +1,240 @@
+"""Tuning FEED_FAN_OUT_MAX_FRIENDS: fan-out on write vs merge on read.
+
+First measures what one friend costs to the fan-out subtasks (timeline row and
+message, the broker is the stand-in of benchmarks.rabbitmq_fan_out) and what
+one high fan-out friend adds to a feed page read (the database is real). Then
+sweeps synthetic friend count distributions (Pareto, heavier tail for a smaller
+alpha) and thresholds, and models per distribution:
+
+- the worker time spent fanning out the training of the author with the most
+  friends below the threshold,
+- the average friends fanned out to per training,
+- the average high fan-out friends merged per feed read,
+- the time spent per training posted on fanning it out plus on merging it into
+  `reads` feed reads.
+
+The seeded rows are deleted at the end.
+
+Usage: python -m benchmarks.feed_fan_out_threshold [users] [reads]
+"""
+import asyncio
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+from sqlalchemy import delete, text
+
+from app import models
+from app.config import FEED_FAN_OUT_CHUNK_SIZE
+from app.database import async_session, dispose_engine
+from app.domain.events import dump_new_training_event
+from app.domain.repositories.timeline_repository import TimelineRepository
+from app.domain.repositories.training_repository import TrainingRepository
+from app.enums import TrainingVisibilityEnum
+from app.rabbitmq import publisher
+from app.tasks import async_fan_out_training_chunk
+from benchmarks.rabbitmq_fan_out import connect_robust
+from benchmarks.training_feed_fan_out import clean_up, seed
+
+WRITE_FRIENDS_COUNT = 5000
+READ_HIGH_FAN_OUT_FRIENDS_COUNTS = (0, 10, 50, 200)
+TRAININGS_PER_AUTHOR = 50
+PAGE_SIZE = 20
+REPEATS = 20
+ALPHAS = (1.2, 1.5, 2.0, 2.5)
+MIN_FRIENDS_COUNT = 20
+THRESHOLDS = (100, 300, 1000, 3000, 10000, None)
+
+
+async def measure_write_cost_per_friend() -> float:
+    author_id, training_id, friend_ids = await seed(WRITE_FRIENDS_COUNT)
+    try:
+        timings = []
+        async with TrainingRepository() as repository:
+            training = await repository.get_training_with_visibility(training_id)
+        event = dump_new_training_event(training)
+        friends_ids = [str(friend_id) for friend_id in friend_ids]
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            with patch("aio_pika.connect_robust", connect_robust):
+                for chunk_start in range(
+                    0, WRITE_FRIENDS_COUNT, FEED_FAN_OUT_CHUNK_SIZE
+                ):
+                    await async_fan_out_training_chunk(
+                        str(training_id),
+                        event,
+                        friends_ids[
+                            chunk_start : chunk_start + FEED_FAN_OUT_CHUNK_SIZE
+                        ],
+                    )
+            timings.append(time.perf_counter() - start)
+            async with async_session() as session:
+                await session.execute(
+                    delete(models.TimelineEntry).where(
+                        models.TimelineEntry.training_id == training_id
+                    )
+                )
+                await session.commit()
+    finally:
+        await publisher.close()
+        await clean_up([author_id, *friend_ids])
+    return statistics.median(timings) / WRITE_FRIENDS_COUNT
+
+
+async def seed_viewer(high_fan_out_friends_count: int):
+    viewer = models.User(email=f"{uuid4()}@benchmark.com", hashed_password="-")
+    authors = [
+        models.User(email=f"{uuid4()}@benchmark.com", hashed_password="-")
+        for _ in range(high_fan_out_friends_count)
+    ]
+    for user in (viewer, *authors):
+        user.profile = models.Profile(
+            training_visibility=TrainingVisibilityEnum.only_friends
+        )
+    now = datetime.utcnow()
+    async with async_session() as session:
+        session.add_all([viewer, *authors])
+        await session.flush()
+        session.add_all(
+            [
+                models.Training(
+                    user_id=author.id,
+                    name="Benchmark",
+                    start_time=now - timedelta(hours=random.randrange(24 * 365)),
+                )
+                for author in authors
+                for _ in range(TRAININGS_PER_AUTHOR)
+            ]
+        )
+        session.add_all(
+            [
+                models.Friendship(
+                    user_1_id=min(viewer.id, author.id),
+                    user_2_id=max(viewer.id, author.id),
+                )
+                for author in authors
+            ]
+        )
+        session.add_all(
+            [models.HighFanOutAuthor(user_id=author.id) for author in authors]
+        )
+        await session.commit()
+        # Fresh tables have no statistics, the plans would not be the real ones.
+        await session.execute(text("ANALYZE"))
+        await session.commit()
+    return viewer.id, [author.id for author in authors]
+
+
+async def measure_read_cost(high_fan_out_friends_count: int) -> float:
+    viewer_id, author_ids = await seed_viewer(high_fan_out_friends_count)
+    try:
+        timings = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            async with TimelineRepository() as repository:
+                await repository.get_timeline_page(viewer_id, limit=PAGE_SIZE + 1)
+            timings.append(time.perf_counter() - start)
+    finally:
+        async with async_session() as session:
+            await session.execute(
+                delete(models.HighFanOutAuthor).where(
+                    models.HighFanOutAuthor.user_id.in_(author_ids)
+                )
+            )
+            await session.commit()
+        await clean_up([viewer_id, *author_ids])
+    return statistics.median(timings)
+
+
+def get_friends_counts(users_count: int, alpha: float) -> list[int]:
+    generator = random.Random(alpha)
+    return [
+        min(int(MIN_FRIENDS_COUNT * generator.paretovariate(alpha)), users_count - 1)
+        for _ in range(users_count)
+    ]
+
+
+def model(
+    friends_counts: list[int],
+    threshold: int | None,
+    write_cost_per_friend: float,
+    read_cost_per_friend: float,
+    reads_per_training: int,
+):
+    fanned_out = [
+        count for count in friends_counts if threshold is None or count <= threshold
+    ]
+    # Every user posts as often. A user's friend is a given author with a
+    # probability proportional to the author's friends count.
+    merged_per_read = (sum(friends_counts) - sum(fanned_out)) / len(friends_counts)
+    friends_per_training = sum(fanned_out) / len(friends_counts)
+    cost = (
+        friends_per_training * write_cost_per_friend
+        + reads_per_training * merged_per_read * read_cost_per_friend
+    )
+    return (
+        max(fanned_out, default=0) * write_cost_per_friend,
+        friends_per_training,
+        merged_per_read,
+        cost,
+    )
+
+
+async def main(users_count: int, reads_per_training: int):
+    try:
+        write_cost_per_friend = await measure_write_cost_per_friend()
+        read_costs = {
+            count: await measure_read_cost(count)
+            for count in READ_HIGH_FAN_OUT_FRIENDS_COUNTS
+        }
+    finally:
+        await dispose_engine()
+    read_cost_per_friend = statistics.linear_regression(
+        list(read_costs), list(read_costs.values())
+    ).slope
+    print(f"Fan-out: {write_cost_per_friend * 1e6:.1f}us per friend")
+    for count, cost in read_costs.items():
+        print(f"Feed read, {count:>3} high fan-out friends: {cost * 1000:.2f}ms")
+    print(f"Feed read: +{read_cost_per_friend * 1e6:.1f}us per high fan-out friend")
+
+    for alpha in ALPHAS:
+        friends_counts = get_friends_counts(users_count, alpha)
+        print(
+            f"\nalpha={alpha} users={users_count} "
+            f"median friends={statistics.median(friends_counts):.0f} "
+            f"max friends={max(friends_counts)}"
+        )
+        print(
+            f"{'threshold':>9} {'largest fan-out ms':>18} {'friends/training':>16} "
+            f"{'merged/read':>11} {'ms/training':>11}"
+        )
+        results = {
+            threshold: model(
+                friends_counts,
+                threshold,
+                write_cost_per_friend,
+                read_cost_per_friend,
+                reads_per_training,
+            )
+            for threshold in THRESHOLDS
+        }
+        best = min(results, key=lambda threshold: results[threshold][3])
+        for threshold, (largest_fan_out, friends, merged, cost) in results.items():
+            print(
+                f"{threshold or 'none':>9} {largest_fan_out * 1000:>18.1f} "
+                f"{friends:>16.1f} {merged:>11.2f} {cost * 1000:>11.2f}"
+                f"{'  <- lowest' if threshold == best else ''}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+        )
+    )
@@ -0,0 +1,112 @@
+"""Memory and lookup time of FriendshipGraph vs sets of friends' UUIDs.
+
+Builds both from the same random friendships, without the database, and
+reports the memory allocated by each (tracemalloc, the UUID objects are created
+beforehand and shared by both, they cost the same per user in either), per
+million friendships, and the median time of a friendship check and of listing
+a user's friends.
+
+Usage: python -m benchmarks.friendship_graph_memory [friendships] [users]
+"""
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from uuid import UUID
+
+from app.friendship_graph import FriendshipGraph
+
+SAMPLES = 10_000
+
+
+def build_graph(friendships) -> FriendshipGraph:
+    graph = FriendshipGraph()
+    graph.extend(friendships)
+    graph.sort()
+    return graph
+
+
+def build_sets(friendships) -> dict[UUID, set[UUID]]:
+    friends = defaultdict(set)
+    for user_1_id, user_2_id in friendships:
+        friends[user_1_id].add(user_2_id)
+        friends[user_2_id].add(user_1_id)
+    return dict(friends)
+
+
+def measure_memory(build, friendships):
+    tracemalloc.start()
+    structure = build(friendships)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return structure, size
+
+
+def median_time(function, arguments) -> float:
+    timings = []
+    for argument in arguments:
+        start = time.perf_counter()
+        function(*argument)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main(friendships_count: int, users_count: int):
+    generator = random.Random(0)
+    users_ids = [UUID(int=generator.getrandbits(128)) for _ in range(users_count)]
+    friendships = list(
+        {
+            tuple(sorted(generator.sample(users_ids, 2)))
+            for _ in range(friendships_count)
+        }
+    )
+
+    graph, graph_size = measure_memory(build_graph, friendships)
+    sets, sets_size = measure_memory(build_sets, friendships)
+
+    checks = [
+        generator.choice(friendships)
+        if index % 2
+        else tuple(generator.sample(users_ids, 2))
+        for index in range(SAMPLES)
+    ]
+    listed = [(generator.choice(users_ids),) for _ in range(SAMPLES)]
+    timings = {
+        "FriendshipGraph": (
+            median_time(graph.are_friends, checks),
+            median_time(graph.get_friends_ids, listed),
+        ),
+        "dict of sets": (
+            median_time(
+                lambda user_1_id, user_2_id: user_2_id in sets.get(user_1_id, ()),
+                checks,
+            ),
+            median_time(lambda user_id: list(sets.get(user_id, ())), listed),
+        ),
+    }
+
+    print(
+        f"friendships={len(friendships)} users={users_count} "
+        f"average friends={2 * len(friendships) / users_count:.0f}"
+    )
+    print(
+        f"{'':<16} {'MB':>8} {'MB/1M friendships':>18} {'bytes/friendship':>16} "
+        f"{'check us':>9} {'list us':>8}"
+    )
+    for name, size in (("FriendshipGraph", graph_size), ("dict of sets", sets_size)):
+        check_time, list_time = timings[name]
+        print(
+            f"{name:<16} {size / 2**20:>8.1f} "
+            f"{size / 2**20 / len(friendships) * 1_000_000:>18.1f} "
+            f"{size / len(friendships):>16.1f} "
+            f"{check_time * 1e6:>9.2f} {list_time * 1e6:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 100_000,
+    )
@@ -0,0 +1,284 @@
+"""Friendships stored in both directions vs once, lower user id first.
+
+Seeds users with two only_friends trainings each and random friendships into
+the friendship table (one row per friendship) and into a friendship_doubled
+table (two rows per friendship, the former layout, primary key only). Then
+reports the size of both tables with their indexes, and the median latency of
+the queries reading friendships with each layout:
+
+- the friends ids of a user (training fan-out, friends count),
+- a friend's training by id (the visibility check),
+- the first page of a friend's trainings,
+
+and the time to insert new friendships. The seeded rows are deleted at the end.
+
+Usage: python -m benchmarks.friendship_layout [friendships] [users]
+"""
+import asyncio
+import statistics
+import sys
+import time
+from unittest.mock import patch
+
+from sqlalchemy import column, select, table, text
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+
+from app.database import async_session, dispose_engine
+from app.domain.repositories.friendship_repository import FriendshipRepository
+from app.domain.repositories.training_repository import TrainingRepository
+
+EMAIL_DOMAIN = "friendship-layout.benchmark"
+TRAININGS_PER_USER = 2
+PAGE_SIZE = 20
+SAMPLES = 200
+NEW_FRIENDSHIPS_COUNT = 10_000
+
+doubled = table(
+    "friendship_doubled",
+    column("user_1_id", PostgresUUID(as_uuid=True)),
+    column("user_2_id", PostgresUUID(as_uuid=True)),
+)
+
+
+def get_doubled_friends_ids_query(user_id):
+    return select(doubled.c.user_2_id).where(doubled.c.user_1_id == user_id)
+
+
+async def execute(session, sql: str, **params):
+    start = time.perf_counter()
+    await session.execute(text(sql), params)
+    await session.commit()
+    return time.perf_counter() - start
+
+
+async def seed(friendships_count: int, users_count: int):
+    async with async_session() as session:
+        await execute(
+            session,
+            """
+            INSERT INTO "user" (id, email, hashed_password)
+            SELECT gen_random_uuid(), i || '@' || :domain, '-'
+            FROM generate_series(1, :users_count) AS i
+            """,
+            domain=EMAIL_DOMAIN,
+            users_count=users_count,
+        )
+        await execute(
+            session,
+            """
+            CREATE TABLE friendship_layout_user AS
+            SELECT id, row_number() OVER (ORDER BY id) AS n
+            FROM "user" WHERE email LIKE '%@' || :domain
+            """,
+            domain=EMAIL_DOMAIN,
+        )
+        await execute(session, "CREATE UNIQUE INDEX ON friendship_layout_user (n)")
+        await execute(
+            session,
+            """
+            INSERT INTO profile (id, user_id, training_visibility)
+            SELECT gen_random_uuid(), id, 'only_friends' FROM friendship_layout_user
+            """,
+        )
+        await execute(
+            session,
+            """
+            INSERT INTO training (id, start_time, name, user_id)
+            SELECT gen_random_uuid(), now() - i * interval '1 day', 'Benchmark', id
+            FROM friendship_layout_user, generate_series(1, :trainings_per_user) AS i
+            """,
+            trainings_per_user=TRAININGS_PER_USER,
+        )
+        await execute(
+            session,
+            """
+            CREATE TABLE friendship_doubled (
+                user_1_id uuid NOT NULL REFERENCES "user" (id),
+                user_2_id uuid NOT NULL REFERENCES "user" (id),
+                PRIMARY KEY (user_1_id, user_2_id)
+            )
+            """,
+        )
+        await insert_friendships(session, friendships_count, users_count)
+        await execute(session, "ANALYZE")
+
+
+async def insert_friendships(session, friendships_count: int, users_count: int):
+    """Inserts random friendships in both layouts, returns the time each took."""
+    await execute(
+        session,
+        """
+        CREATE TABLE friendship_layout_new AS
+        SELECT DISTINCT
+            least(user_1.id, user_2.id) AS user_1_id,
+            greatest(user_1.id, user_2.id) AS user_2_id
+        FROM (
+            SELECT
+                1 + floor(random() * :users_count)::int AS n_1,
+                1 + floor(random() * :users_count)::int AS n_2
+            FROM generate_series(1, :friendships_count)
+        ) AS pair
+        JOIN friendship_layout_user AS user_1 ON user_1.n = pair.n_1
+        JOIN friendship_layout_user AS user_2 ON user_2.n = pair.n_2
+        WHERE pair.n_1 <> pair.n_2
+        """,
+        friendships_count=friendships_count,
+        users_count=users_count,
+    )
+    await execute(
+        session,
+        "DELETE FROM friendship_layout_new USING friendship "
+        "WHERE (friendship.user_1_id, friendship.user_2_id) "
+        "= (friendship_layout_new.user_1_id, friendship_layout_new.user_2_id)",
+    )
+    canonical_time = await execute(
+        session,
+        "INSERT INTO friendship (user_1_id, user_2_id) "
+        "SELECT user_1_id, user_2_id FROM friendship_layout_new",
+    )
+    doubled_time = await execute(
+        session,
+        """
+        INSERT INTO friendship_doubled (user_1_id, user_2_id)
+        SELECT user_1_id, user_2_id FROM friendship_layout_new
+        UNION ALL
+        SELECT user_2_id, user_1_id FROM friendship_layout_new
+        """,
+    )
+    await execute(session, "DROP TABLE friendship_layout_new")
+    return canonical_time, doubled_time
+
+
+async def get_samples():
+    """(viewer_id, friend_id, friend's training_id) of random users."""
+    async with async_session() as session:
+        result = await session.execute(
+            text(
+                """
+                SELECT viewer.id, friend.id, training.id
+                FROM (
+                    SELECT id FROM friendship_layout_user
+                    ORDER BY random() LIMIT :samples
+                ) AS viewer
+                JOIN LATERAL (
+                    SELECT user_2_id AS id FROM friendship_doubled
+                    WHERE user_1_id = viewer.id LIMIT 1
+                ) AS friend ON true
+                JOIN LATERAL (
+                    SELECT id FROM training WHERE user_id = friend.id LIMIT 1
+                ) AS training ON true
+                """
+            ),
+            {"samples": SAMPLES},
+        )
+        return result.all()
+
+
+async def get_sizes() -> dict[str, tuple[int, int, int]]:
+    """Rows, table bytes and indexes bytes of both layouts."""
+    sizes = {}
+    async with async_session() as session:
+        for name in ("friendship", "friendship_doubled"):
+            sql = text(
+                f"SELECT (SELECT count(*) FROM {name}), "
+                "pg_relation_size(:name), pg_indexes_size(:name)"
+            )
+            sizes[name] = tuple((await session.execute(sql, {"name": name})).one())
+    return sizes
+
+
+async def measure(samples) -> dict[str, float]:
+    timings = {"friends ids": [], "training by id": [], "trainings page": []}
+    for viewer_id, friend_id, training_id in samples:
+        async with FriendshipRepository() as repository:
+            start = time.perf_counter()
+            friends_ids = await repository.get_user_friends_ids(viewer_id)
+            timings["friends ids"].append(time.perf_counter() - start)
+        assert friend_id in friends_ids
+        async with TrainingRepository() as repository:
+            start = time.perf_counter()
+            training = await repository.get_training_by_id(viewer_id, training_id)
+            timings["training by id"].append(time.perf_counter() - start)
+            assert training is not None
+            start = time.perf_counter()
+            await repository.get_user_trainings_page(
+                viewer_id, friend_id, limit=PAGE_SIZE + 1
+            )
+            timings["trainings page"].append(time.perf_counter() - start)
+    return {name: statistics.median(values) for name, values in timings.items()}
+
+
+async def clean_up():
+    async with async_session() as session:
+        for table_name in (
+            "friendship_doubled",
+            "friendship_layout_new",
+            "friendship_layout_user",
+        ):
+            await execute(session, f"DROP TABLE IF EXISTS {table_name}")
+        users = """SELECT id FROM "user" WHERE email LIKE '%@' || :domain"""
+        await execute(
+            session,
+            f"DELETE FROM friendship WHERE user_1_id IN ({users}) "
+            f"OR user_2_id IN ({users})",
+            domain=EMAIL_DOMAIN,
+        )
+        for table_name in ("training", "profile"):
+            await execute(
+                session,
+                f"DELETE FROM {table_name} WHERE user_id IN ({users})",
+                domain=EMAIL_DOMAIN,
+            )
+        await execute(
+            session,
+            """DELETE FROM "user" WHERE email LIKE '%@' || :domain""",
+            domain=EMAIL_DOMAIN,
+        )
+
+
+async def main(friendships_count: int, users_count: int):
+    try:
+        await seed(friendships_count, users_count)
+        sizes = await get_sizes()
+        samples = await get_samples()
+        canonical = await measure(samples)
+        with patch.object(
+            FriendshipRepository,
+            "get_user_friends_ids_query",
+            staticmethod(get_doubled_friends_ids_query),
+        ):
+            doubled_timings = await measure(samples)
+        async with async_session() as session:
+            insert_times = await insert_friendships(
+                session, NEW_FRIENDSHIPS_COUNT, users_count
+            )
+    finally:
+        await clean_up()
+        await dispose_engine()
+
+    print(f"users={users_count} samples={len(samples)}")
+    print(f"{'layout':<19} {'rows':>10} {'table MB':>9} {'indexes MB':>10}")
+    for name, (rows, table_size, indexes_size) in sizes.items():
+        print(
+            f"{name:<19} {rows:>10} {table_size / 2**20:>9.1f} "
+            f"{indexes_size / 2**20:>10.1f}"
+        )
+    print(f"\n{'median ms':<19} {'friendship':>10} {'friendship_doubled':>18}")
+    for name in canonical:
+        print(
+            f"{name:<19} {canonical[name] * 1000:>10.3f} "
+            f"{doubled_timings[name] * 1000:>18.3f}"
+        )
+    print(
+        f"{f'insert {NEW_FRIENDSHIPS_COUNT}':<19} {insert_times[0] * 1000:>10.1f} "
+        f"{insert_times[1] * 1000:>18.1f}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 100_000,
+        )
+    )
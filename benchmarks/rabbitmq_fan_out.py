@@ -0,0 +1,105 @@
+"""Fan-out of one training to N friends: connection per message vs shared publisher.
+
+The broker is replaced by an in-process stand-in that only simulates network
+latency, so the numbers show the cost of the publishing pattern, not RabbitMQ.
+
+Usage: python -m benchmarks.rabbitmq_fan_out [friends_count]
+"""
+import asyncio
+import json
+import sys
+import time
+from unittest.mock import patch
+
+import aio_pika
+
+from app.rabbitmq import RabbitMQPublisher
+
+CONNECTION_HANDSHAKE_IN_SECONDS = 0.005
+CHANNEL_OPEN_IN_SECONDS = 0.001
+PUBLISH_IN_SECONDS = 0.0002
+
+
+class StandInExchange:
+    async def publish(self, message, routing_key):
+        await asyncio.sleep(PUBLISH_IN_SECONDS)
+
+
+class StandInChannel:
+    default_exchange = StandInExchange()
+
+    async def declare_exchange(self, name, type, durable):
+        await asyncio.sleep(CHANNEL_OPEN_IN_SECONDS)
+        return self.default_exchange
+
+    async def get_exchange(self, name, ensure):
+        return self.default_exchange
+
+    async def close(self):
+        pass
+
+
+class StandInConnection:
+    async def channel(self):
+        await asyncio.sleep(CHANNEL_OPEN_IN_SECONDS)
+        return StandInChannel()
+
+    async def close(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args, **kwargs):
+        await self.close()
+
+
+async def connect_robust(url):
+    await asyncio.sleep(CONNECTION_HANDSHAKE_IN_SECONDS)
+    return StandInConnection()
+
+
+async def publish_with_new_connection(message, routing_key):
+    connection = await aio_pika.connect_robust("amqp://stand-in/")
+
+    async with connection:
+        channel = await connection.channel()
+
+        await channel.default_exchange.publish(
+            aio_pika.Message(body=json.dumps(message).encode()),
+            routing_key=routing_key,
+        )
+
+
+async def fan_out_with_new_connections(friends_count: int):
+    for friend_id in range(friends_count):
+        await publish_with_new_connection({}, routing_key=f"new-training-{friend_id}")
+
+
+async def fan_out_with_shared_publisher(friends_count: int):
+    publisher = RabbitMQPublisher(
+        url="amqp://stand-in/", exchange_name="trainings", channel_pool_size=10
+    )
+    await asyncio.gather(
+        *(
+            publisher.publish({}, routing_key=f"new-training-{friend_id}")
+            for friend_id in range(friends_count)
+        )
+    )
+    await publisher.close()
+
+
+async def main(friends_count: int):
+    with patch("aio_pika.connect_robust", connect_robust):
+        for name, fan_out in (
+            ("Connection per message", fan_out_with_new_connections),
+            ("Shared publisher", fan_out_with_shared_publisher),
+        ):
+            start = time.perf_counter()
+            await fan_out(friends_count)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{name:<24} {friends_count} friends: {elapsed:.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
@@ -0,0 +1,124 @@
+"""Delivery of one new training to N subscribers: re-query vs embedded event.
+
+Seeds an author with N friends, then hands the same training to N subscribers
+the way the subscription resolver used to (one visibility query each) and the
+way it does now (decode the event, cached friendship check). The seeded rows
+are deleted at the end.
+
+Usage: python -m benchmarks.training_feed_fan_out [subscribers] [events]
+"""
+import asyncio
+import sys
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import delete, or_
+
+from app import models
+from app.database import async_session, dispose_engine
+from app.domain.events import dump_new_training_event, load_new_training_event
+from app.domain.repositories.training_repository import TrainingRepository
+from app.domain.services.friendship_service import friendship_cache
+from app.domain.services.training_service import TrainingService
+from app.enums import TrainingVisibilityEnum
+
+
+async def seed(subscribers_count: int):
+    author = models.User(email=f"{uuid4()}@benchmark.com", hashed_password="-")
+    author.profile = models.Profile(
+        training_visibility=TrainingVisibilityEnum.only_friends
+    )
+    friends = [
+        models.User(email=f"{uuid4()}@benchmark.com", hashed_password="-")
+        for _ in range(subscribers_count)
+    ]
+    training = models.Training(
+        user=author, name="Benchmark", start_time=datetime.utcnow()
+    )
+    async with async_session() as session:
+        session.add_all([author, training, *friends])
+        await session.flush()
+        session.add_all(
+            [
+                models.Friendship(
+                    user_1_id=min(friend.id, author.id),
+                    user_2_id=max(friend.id, author.id),
+                )
+                for friend in friends
+            ]
+        )
+        await session.commit()
+    return author.id, training.id, [friend.id for friend in friends]
+
+
+async def clean_up(user_ids):
+    async with async_session() as session:
+        await session.execute(
+            delete(models.Friendship).where(
+                or_(
+                    models.Friendship.user_1_id.in_(user_ids),
+                    models.Friendship.user_2_id.in_(user_ids),
+                )
+            )
+        )
+        for model in (models.Training, models.Profile):
+            await session.execute(delete(model).where(model.user_id.in_(user_ids)))
+        await session.execute(delete(models.User).where(models.User.id.in_(user_ids)))
+        await session.commit()
+
+
+async def deliver_by_query(friend_ids, training_id, event):
+    await asyncio.gather(
+        *(
+            TrainingService.get_training(
+                request_user_id=friend_id, training_id=training_id
+            )
+            for friend_id in friend_ids
+        )
+    )
+
+
+async def deliver_by_event(friend_ids, training_id, event):
+    async def deliver(friend_id):
+        training = load_new_training_event(event)
+        await TrainingService.can_user_see_training(
+            request_user_id=friend_id, training=training
+        )
+
+    await asyncio.gather(*(deliver(friend_id) for friend_id in friend_ids))
+
+
+async def main(subscribers_count: int, events_count: int):
+    author_id, training_id, friend_ids = await seed(subscribers_count)
+    try:
+        async with TrainingRepository() as repository:
+            training = await repository.get_training_with_visibility(training_id)
+        event = dump_new_training_event(training)
+        friendship_cache.clear()
+        for name, deliver in (
+            ("Query per message", deliver_by_query),
+            ("Embedded event", deliver_by_event),
+        ):
+            timings = []
+            for _ in range(events_count):
+                start = time.perf_counter()
+                await deliver(friend_ids, training_id, event)
+                timings.append((time.perf_counter() - start) * 1000)
+            print(
+                f"{name:<18} {subscribers_count} subscribers: "
+                f"first={timings[0]:.1f}ms "
+                f"next={sum(timings[1:]) / max(len(timings) - 1, 1):.1f}ms"
+            )
+    finally:
+        await clean_up([author_id, *friend_ids])
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 5,
+        )
+    )
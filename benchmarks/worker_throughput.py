@@ -0,0 +1,77 @@
+"""Celery task throughput: async_to_sync per task vs one worker event loop.
+
+Runs handle_new_training's coroutine the way the task used to (async_to_sync,
+a fresh loop per call, so no pooled connection can be reused) and the way it
+does now (run_async on the worker's loop with the pooled engine). The broker is
+the in-process stand-in of benchmarks.rabbitmq_fan_out, the database is real.
+The fan-out subtasks the task dispatches are not sent.
+
+Usage: python -m benchmarks.worker_throughput [tasks] [friends]
+"""
+import asyncio
+import sys
+import time
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.database import async_session, database_url, engine
+from app.event_loop import run_async, worker_event_loop
+from app.tasks import async_handle_new_training
+from benchmarks.rabbitmq_fan_out import connect_robust
+from benchmarks.training_feed_fan_out import clean_up, seed
+
+
+def measure(name: str, run_task, tasks_count: int, user_id: str, training_id: str):
+    start = time.perf_counter()
+    for _ in range(tasks_count):
+        run_task(user_id, training_id)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<16} {tasks_count / elapsed:.1f} tasks/s")
+
+
+def run_with_async_to_sync(user_id: str, training_id: str):
+    async_to_sync(async_handle_new_training)(user_id, training_id)
+
+
+def run_on_worker_event_loop(user_id: str, training_id: str):
+    run_async(async_handle_new_training(user_id, training_id))
+
+
+def main(tasks_count: int, friends_count: int):
+    # The pooled engine can not be shared between the loops async_to_sync
+    # creates, the old path therefore ran without a pool.
+    async_session.configure(bind=create_async_engine(database_url, poolclass=NullPool))
+    author_id, training_id, friend_ids = asyncio.run(seed(friends_count))
+    try:
+        with (
+            patch("aio_pika.connect_robust", connect_robust),
+            patch("app.tasks.group"),
+        ):
+            measure(
+                "async_to_sync",
+                run_with_async_to_sync,
+                tasks_count,
+                str(author_id),
+                str(training_id),
+            )
+            async_session.configure(bind=engine)
+            measure(
+                "Worker loop",
+                run_on_worker_event_loop,
+                tasks_count,
+                str(author_id),
+                str(training_id),
+            )
+            worker_event_loop.shutdown()
+    finally:
+        asyncio.run(clean_up([author_id, *friend_ids]))
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+    )
@@ -0,0 +1,5 @@
+import os
+
+# pytest-asyncio runs every test in its own event loop, asyncpg connections kept in
+# a pool would outlive the loop they were created in.
+os.environ.setdefault("DATABASE_POOL_ENABLED", "false")
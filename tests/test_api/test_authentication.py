@@ -0,0 +1,56 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+from app.jwt_tokens import create_access_token, get_user_id_from_token
+
+
+@patch(
+    "app.graphql.context.get_user_id_from_token",
+    autospec=True,
+    side_effect=get_user_id_from_token,
+)
+@patch("app.graphql.queries.trainings.TrainingService", autospec=True)
+def test_token_is_verified_once_per_request(
+    mocked_training_service, mocked_get_user_id_from_token, client
+):
+    request_user_id = uuid4()
+    token = create_access_token(request_user_id)
+    mocked_training_service.get_training.return_value = None
+    mocked_training_service.get_user_trainings.return_value = []
+    query = f"""
+    {{
+        training(id: "{uuid4()}"){{
+            name
+        }}
+        trainings(userId: "{uuid4()}"){{
+            name
+        }}
+    }}
+    """
+
+    response = client.post(
+        "/graphql",
+        json={"query": query},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.json() == {"data": {"training": None, "trainings": []}}
+    mocked_get_user_id_from_token.assert_called_once_with(token)
+
+
+def test_wrong_authorization_scheme_is_not_authenticated(client):
+    query = f"""
+    {{
+        trainings(userId: "{uuid4()}"){{
+            name
+        }}
+    }}
+    """
+
+    response = client.post(
+        "/graphql",
+        json={"query": query},
+        headers={"Authorization": f"Basic {create_access_token(uuid4())}"},
+    )
+
+    assert response.json()["errors"][0]["message"] == "User is not authenticated"
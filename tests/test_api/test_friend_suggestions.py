@@ -0,0 +1,80 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+from app.domain import entities
+from app.jwt_tokens import create_access_token
+
+
+def get_query(first: int) -> str:
+    return f"""
+    {{
+        friendSuggestions(first: {first}) {{
+            mutualFriendsCount
+            user {{
+                id
+                email
+            }}
+        }}
+    }}
+    """
+
+
+def test_friend_suggestions_requires_authorization(client):
+    response = client.post("/graphql", json={"query": get_query(first=2)})
+
+    assert response.status_code == 200
+    response_json = response.json()
+    assert response_json["data"] is None
+    assert response_json["errors"][0]["message"] == "User is not authenticated"
+
+
+@patch("app.graphql.data_loaders.users.UserService", autospec=True)
+@patch("app.graphql.queries.friend_suggestions.FriendSuggestionService", autospec=True)
+def test_friend_suggestions(
+    mocked_friend_suggestion_service, mocked_user_service, client
+):
+    user_id = uuid4()
+    users = [entities.User(id=uuid4(), email=f"{i}@test.com") for i in range(2)]
+    mocked_friend_suggestion_service.get_friend_suggestions.return_value = [
+        entities.FriendSuggestion(user_id=users[0].id, mutual_friends_count=3),
+        entities.FriendSuggestion(user_id=users[1].id, mutual_friends_count=1),
+    ]
+    mocked_user_service.get_users_by_ids.return_value = users
+
+    response = client.post(
+        "/graphql",
+        json={"query": get_query(first=2)},
+        headers={"Authorization": f"Bearer {create_access_token(user_id)}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["friendSuggestions"] == [
+        {
+            "mutualFriendsCount": mutual_friends_count,
+            "user": {"id": str(user.id), "email": user.email},
+        }
+        for user, mutual_friends_count in zip(users, (3, 1))
+    ]
+    mocked_friend_suggestion_service.get_friend_suggestions.assert_awaited_once_with(
+        user_id=user_id, limit=2
+    )
+    mocked_user_service.get_users_by_ids.assert_awaited_once()
+
+
+@patch("app.graphql.queries.friend_suggestions.FriendSuggestionService", autospec=True)
+def test_friend_suggestions_rejects_invalid_first(
+    mocked_friend_suggestion_service, client
+):
+    for first in (0, 51):
+        response = client.post(
+            "/graphql",
+            json={"query": get_query(first=first)},
+            headers={"Authorization": f"Bearer {create_access_token(uuid4())}"},
+        )
+
+        assert response.status_code == 200
+        assert (
+            response.json()["errors"][0]["message"]
+            == "Page size must be between 1 and 50"
+        )
+    mocked_friend_suggestion_service.get_friend_suggestions.assert_not_called()
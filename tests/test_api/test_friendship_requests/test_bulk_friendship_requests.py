@@ -0,0 +1,124 @@
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.graphql.validators import MAX_BATCH_SIZE
+from app.jwt_tokens import create_access_token
+
+
+@pytest.mark.parametrize(
+    "mutation, service_method",
+    (
+        ("acceptFriendshipRequests", "accept_friendship_requests"),
+        ("rejectFriendshipRequests", "reject_friendship_requests"),
+        ("cancelFriendshipRequests", "cancel_friendship_requests"),
+    ),
+)
+@patch(
+    "app.graphql.mutations.friendship_requests.FriendshipRequestService", autospec=True
+)
+class TestBulkFriendshipRequestMutations:
+    @staticmethod
+    def get_query(mutation: str, friendship_request_ids: list[UUID]):
+        ids = ", ".join(f'"{id}"' for id in friendship_request_ids)
+        return f"""
+        mutation {{
+            {mutation}(
+                input: {{
+                    friendshipRequestIds: [{ids}]
+                }}
+            ) {{
+                __typename
+                ... on Error {{
+                    message
+                }}
+                ... on FriendshipRequestResults {{
+                    results {{
+                        friendshipRequestId
+                        result {{
+                            __typename
+                            ... on Error {{
+                                message
+                            }}
+                            ... on OK {{
+                                message
+                            }}
+                        }}
+                    }}
+                }}
+            }}
+        }}
+        """
+
+    def test_requires_authorization(
+        self, mocked_friendship_request_service, mutation, service_method, client
+    ):
+        response = client.post(
+            "/graphql",
+            json={"query": self.get_query(mutation, [uuid4()])},
+        )
+
+        assert response.status_code == 200
+        response_json = response.json()
+        assert response_json["data"] is None
+        assert response_json["errors"][0]["message"] == "User is not authenticated"
+
+    @pytest.mark.parametrize("size", (0, MAX_BATCH_SIZE + 1))
+    def test_rejects_invalid_batch_size(
+        self, mocked_friendship_request_service, mutation, service_method, size, client
+    ):
+        response = client.post(
+            "/graphql",
+            json={"query": self.get_query(mutation, [uuid4() for _ in range(size)])},
+            headers={"Authorization": f"Bearer {create_access_token(user_id=uuid4())}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"][mutation] == {
+            "__typename": "Error",
+            "message": f"Batch size must be between 1 and {MAX_BATCH_SIZE}",
+        }
+        getattr(mocked_friendship_request_service, service_method).assert_not_called()
+
+    def test_returns_result_per_id(
+        self, mocked_friendship_request_service, mutation, service_method, client
+    ):
+        applied_id, not_applied_id = uuid4(), uuid4()
+        user_id = uuid4()
+        getattr(mocked_friendship_request_service, service_method).return_value = {
+            applied_id
+        }
+
+        response = client.post(
+            "/graphql",
+            json={
+                "query": self.get_query(
+                    mutation, [applied_id, not_applied_id, applied_id]
+                )
+            },
+            headers={"Authorization": f"Bearer {create_access_token(user_id=user_id)}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"][mutation] == {
+            "__typename": "FriendshipRequestResults",
+            "results": [
+                {
+                    "friendshipRequestId": str(applied_id),
+                    "result": {"__typename": "OK", "message": "OK"},
+                },
+                {
+                    "friendshipRequestId": str(not_applied_id),
+                    "result": {
+                        "__typename": "Error",
+                        "message": "Pending request does not exist",
+                    },
+                },
+            ],
+        }
+        getattr(
+            mocked_friendship_request_service, service_method
+        ).assert_awaited_once_with(
+            user_id=user_id, friendship_request_ids=[applied_id, not_applied_id]
+        )
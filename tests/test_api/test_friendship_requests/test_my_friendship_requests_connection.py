@@ -0,0 +1,149 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from app import enums, helpers
+from app.domain.entities import FriendshipRequest
+from app.graphql.queries.friendship_requests import (
+    decode_friendship_request_cursor,
+    encode_friendship_request_cursor,
+)
+from app.jwt_tokens import create_access_token
+
+
+@pytest.mark.parametrize(
+    "field, action",
+    (
+        ("mySentFriendshipRequestsConnection", "sent"),
+        ("myReceivedFriendshipRequestsConnection", "received"),
+    ),
+)
+@patch(
+    "app.graphql.queries.friendship_requests.FriendshipRequestService",
+    autospec=True,
+)
+class TestMyFriendshipRequestsConnection:
+    @staticmethod
+    def get_query(field: str, first: int, after: str | None = None, total=True):
+        after_argument = f', after: "{after}"' if after else ""
+        return f"""
+        {{
+            {field}(first: {first}{after_argument}) {{
+                edges {{
+                    cursor
+                    node {{
+                        id
+                    }}
+                }}
+                pageInfo {{
+                    hasNextPage
+                    endCursor
+                }}
+                {"totalCount" if total else ""}
+            }}
+        }}
+        """
+
+    @staticmethod
+    def create_friendship_requests(count: int) -> list[FriendshipRequest]:
+        return [
+            FriendshipRequest(
+                id=uuid4(),
+                sender_id=uuid4(),
+                receiver_id=uuid4(),
+                status=enums.FriendshipRequestStatusEnum.pending,
+                timestamp=helpers.get_utc_now(),
+            )
+            for _ in range(count)
+        ]
+
+    def test_requires_authorization(
+        self, mocked_friendship_request_service, field, action, client
+    ):
+        response = client.post(
+            "/graphql", json={"query": self.get_query(field, first=2)}
+        )
+
+        assert response.status_code == 200
+        response_json = response.json()
+        assert response_json["data"] is None
+        assert response_json["errors"][0]["message"] == "User is not authenticated"
+
+    def test_returns_page_and_total_count(
+        self, mocked_friendship_request_service, field, action, client
+    ):
+        user_id = uuid4()
+        friendship_requests = self.create_friendship_requests(3)
+        after = encode_friendship_request_cursor(friendship_requests[0])
+        getattr(
+            mocked_friendship_request_service,
+            f"get_pending_requests_{action}_by_user_page",
+        ).return_value = friendship_requests
+        getattr(
+            mocked_friendship_request_service,
+            f"count_pending_requests_{action}_by_user",
+        ).return_value = 42
+
+        response = client.post(
+            "/graphql",
+            json={"query": self.get_query(field, first=2, after=after)},
+            headers={"Authorization": f"Bearer {create_access_token(user_id)}"},
+        )
+
+        assert response.status_code == 200
+        cursors = [
+            encode_friendship_request_cursor(friendship_request)
+            for friendship_request in friendship_requests[:2]
+        ]
+        assert response.json()["data"][field] == {
+            "edges": [
+                {"cursor": cursor, "node": {"id": str(friendship_request.id)}}
+                for cursor, friendship_request in zip(cursors, friendship_requests)
+            ],
+            "pageInfo": {"hasNextPage": True, "endCursor": cursors[-1]},
+            "totalCount": 42,
+        }
+        getattr(
+            mocked_friendship_request_service,
+            f"get_pending_requests_{action}_by_user_page",
+        ).assert_awaited_once_with(
+            user_id=user_id, limit=3, after=decode_friendship_request_cursor(after)
+        )
+        getattr(
+            mocked_friendship_request_service,
+            f"count_pending_requests_{action}_by_user",
+        ).assert_awaited_once_with(user_id=user_id)
+
+    def test_counts_only_when_selected(
+        self, mocked_friendship_request_service, field, action, client
+    ):
+        getattr(
+            mocked_friendship_request_service,
+            f"get_pending_requests_{action}_by_user_page",
+        ).return_value = []
+
+        response = client.post(
+            "/graphql",
+            json={"query": self.get_query(field, first=2, total=False)},
+            headers={"Authorization": f"Bearer {create_access_token(uuid4())}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"][field]["edges"] == []
+        getattr(
+            mocked_friendship_request_service,
+            f"count_pending_requests_{action}_by_user",
+        ).assert_not_called()
+
+    def test_rejects_invalid_cursor(
+        self, mocked_friendship_request_service, field, action, client
+    ):
+        response = client.post(
+            "/graphql",
+            json={"query": self.get_query(field, first=2, after="invalid")},
+            headers={"Authorization": f"Bearer {create_access_token(uuid4())}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["errors"][0]["message"] == "Invalid cursor"
@@ -0,0 +1,83 @@
+from datetime import datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+from app.domain import entities
+from app.jwt_tokens import create_access_token
+
+
+def get_friends_feed_query(first, after=None):
+    after_argument = f', after: "{after}"' if after else ""
+    return f"""
+    {{
+        friendsFeed(first: {first}{after_argument}){{
+            edges {{
+                node {{
+                    id
+                }}
+            }}
+            pageInfo {{
+                hasNextPage
+                endCursor
+            }}
+        }}
+    }}
+    """
+
+
+def test_query_friends_feed_requires_authorization(client):
+    response = client.post("/graphql", json={"query": get_friends_feed_query(2)})
+
+    assert response.json()["data"] is None
+    assert response.json()["errors"][0]["message"] == "User is not authenticated"
+
+
+@patch("app.graphql.queries.trainings.TrainingService", autospec=True)
+def test_query_friends_feed(mocked_training_service, client):
+    user_id = uuid4()
+    trainings = [
+        entities.Training(
+            id=uuid4(),
+            name=f"Training {i}",
+            start_time=datetime(2020, 10, 10 - i, 10),
+            end_time=None,
+            user_id=uuid4(),
+        )
+        for i in range(3)
+    ]
+    mocked_training_service.get_friends_feed_page.return_value = trainings
+    headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+    response = client.post(
+        "/graphql", json={"query": get_friends_feed_query(first=2)}, headers=headers
+    )
+
+    assert response.status_code == 200
+    connection = response.json()["data"]["friendsFeed"]
+    assert [edge["node"]["id"] for edge in connection["edges"]] == [
+        str(training.id) for training in trainings[:2]
+    ]
+    assert connection["pageInfo"]["hasNextPage"] is True
+    mocked_training_service.get_friends_feed_page.assert_awaited_once_with(
+        user_id=user_id, limit=3, after=None
+    )
+
+    mocked_training_service.get_friends_feed_page.reset_mock()
+    mocked_training_service.get_friends_feed_page.return_value = trainings[2:]
+
+    response = client.post(
+        "/graphql",
+        json={
+            "query": get_friends_feed_query(
+                first=2, after=connection["pageInfo"]["endCursor"]
+            )
+        },
+        headers=headers,
+    )
+
+    assert response.json()["data"]["friendsFeed"]["pageInfo"]["hasNextPage"] is False
+    mocked_training_service.get_friends_feed_page.assert_awaited_once_with(
+        user_id=user_id,
+        limit=3,
+        after=(trainings[1].start_time, trainings[1].id),
+    )
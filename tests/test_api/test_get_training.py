@@ -123,3 +123,42 @@ def test_query_existing_training(
     mocked_user_service.get_users_by_ids.assert_awaited_once_with(
         list(users_by_id.keys())
     )
+
+
+@patch("app.graphql.queries.trainings.TrainingService", autospec=True)
+@patch("app.graphql.data_loaders.reactions.ReactionService", autospec=True)
+def test_query_training_does_not_share_data_loaders_between_requests(
+    mocked_reaction_service, mocked_training_service, client
+):
+    user_id = uuid4()
+    training_id = uuid4()
+    mocked_training_service.get_training.return_value = entities.Training(
+        id=training_id,
+        name="name",
+        start_time=datetime.fromisoformat("2020-10-10T10:00:00"),
+        end_time=None,
+        user_id=user_id,
+    )
+    mocked_reaction_service.get_reaction_count_by_training_ids.side_effect = [[1], [2]]
+    query = f"""
+    {{
+        training(id: "{training_id}"){{
+            reactionsCount
+        }}
+    }}
+    """
+
+    responses = [
+        client.post(
+            "/graphql",
+            json={"query": query},
+            headers={"Authorization": f"Bearer {create_access_token(user_id)}"},
+        )
+        for _ in range(2)
+    ]
+
+    assert [response.json()["data"]["training"] for response in responses] == [
+        {"reactionsCount": 1},
+        {"reactionsCount": 2},
+    ]
+    assert mocked_reaction_service.get_reaction_count_by_training_ids.await_count == 2
@@ -143,3 +143,99 @@ def test_query_user_trainings(
     mocked_user_service.get_users_by_ids.assert_awaited_once_with(
         list(users_by_id.keys())
     )
+
+
+def get_trainings_connection_query(user_id, first, after=None):
+    after_argument = f', after: "{after}"' if after else ""
+    return f"""
+    {{
+        trainingsConnection(userId: "{user_id}", first: {first}{after_argument}){{
+            edges {{
+                cursor
+                node {{
+                    id
+                }}
+            }}
+            pageInfo {{
+                hasNextPage
+                endCursor
+            }}
+        }}
+    }}
+    """
+
+
+@patch("app.graphql.queries.trainings.TrainingService", autospec=True)
+def test_query_trainings_connection(mocked_training_service, client):
+    request_user_id = uuid4()
+    user_id = uuid4()
+    trainings = [
+        entities.Training(
+            id=uuid4(),
+            name=f"Training {i}",
+            start_time=datetime(2020, 10, 10 - i, 10),
+            end_time=None,
+            user_id=user_id,
+        )
+        for i in range(3)
+    ]
+    mocked_training_service.get_user_trainings_page.return_value = trainings
+    headers = {"Authorization": f"Bearer {create_access_token(request_user_id)}"}
+
+    response = client.post(
+        "/graphql",
+        json={"query": get_trainings_connection_query(user_id, first=2)},
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    connection = response.json()["data"]["trainingsConnection"]
+    assert [edge["node"]["id"] for edge in connection["edges"]] == [
+        str(training.id) for training in trainings[:2]
+    ]
+    assert connection["pageInfo"] == {
+        "hasNextPage": True,
+        "endCursor": connection["edges"][-1]["cursor"],
+    }
+    mocked_training_service.get_user_trainings_page.assert_awaited_once_with(
+        request_user_id=request_user_id, user_id=user_id, limit=3, after=None
+    )
+
+    mocked_training_service.get_user_trainings_page.reset_mock()
+    mocked_training_service.get_user_trainings_page.return_value = trainings[2:]
+
+    response = client.post(
+        "/graphql",
+        json={
+            "query": get_trainings_connection_query(
+                user_id, first=2, after=connection["pageInfo"]["endCursor"]
+            )
+        },
+        headers=headers,
+    )
+
+    assert (
+        response.json()["data"]["trainingsConnection"]["pageInfo"]["hasNextPage"]
+        is False
+    )
+    mocked_training_service.get_user_trainings_page.assert_awaited_once_with(
+        request_user_id=request_user_id,
+        user_id=user_id,
+        limit=3,
+        after=(trainings[1].start_time, trainings[1].id),
+    )
+
+
+@patch("app.graphql.queries.trainings.TrainingService", autospec=True)
+def test_query_trainings_connection_invalid_arguments(mocked_training_service, client):
+    headers = {"Authorization": f"Bearer {create_access_token(uuid4())}"}
+
+    for query, message in (
+        (get_trainings_connection_query(uuid4(), first=0), "Page size must be"),
+        (get_trainings_connection_query(uuid4(), first=2, after="x"), "Invalid cursor"),
+    ):
+        response = client.post("/graphql", json={"query": query}, headers=headers)
+
+        assert response.json()["data"] is None
+        assert response.json()["errors"][0]["message"].startswith(message)
+    mocked_training_service.get_user_trainings_page.assert_not_awaited()
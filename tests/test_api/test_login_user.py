@@ -3,7 +3,7 @@ from unittest.mock import patch
 from app.domain.services.exceptions import LoginFailed
 
 
-@patch("app.graphql.mutations.users.UserService")
+@patch("app.graphql.mutations.users.UserService", autospec=True)
 class TestLoginUser:
     email = "email"
     password = "password"
@@ -0,0 +1,104 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+from app.domain.services.exceptions import TrainingDoesNotExist
+from app.enums import ReactionTypeEnum
+from app.jwt_tokens import create_access_token
+
+
+@patch("app.graphql.mutations.reactions.ReactionService", autospec=True)
+class TestReact:
+    training_id = uuid4()
+
+    def get_query(self):
+        return f"""
+        mutation {{
+            react(
+                input: {{
+                    trainingId: "{self.training_id}"
+                    reactionType: like
+                }}
+            ) {{
+                __typename
+                ... on OK {{
+                    message
+                }}
+                ... on Error {{
+                    message
+                }}
+            }}
+        }}
+        """
+
+    def test_requires_authorization(self, mocked_reaction_service, client):
+        response = client.post("/graphql", json={"query": self.get_query()})
+
+        assert response.status_code == 200
+        response_json = response.json()
+        assert response_json["data"] is None
+        assert response_json["errors"][0]["message"] == "User is not authenticated"
+        mocked_reaction_service.react.assert_not_awaited()
+
+    def test_calls_reaction_service_react(self, mocked_reaction_service, client):
+        user_id = uuid4()
+
+        response = client.post(
+            "/graphql",
+            json={"query": self.get_query()},
+            headers={"Authorization": f"Bearer {create_access_token(user_id)}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"]["react"] == {
+            "__typename": "OK",
+            "message": "OK",
+        }
+        mocked_reaction_service.react.assert_awaited_once_with(
+            user_id=user_id,
+            training_id=self.training_id,
+            reaction_type=ReactionTypeEnum.like,
+        )
+
+    def test_training_does_not_exist(self, mocked_reaction_service, client):
+        mocked_reaction_service.react.side_effect = TrainingDoesNotExist()
+
+        response = client.post(
+            "/graphql",
+            json={"query": self.get_query()},
+            headers={"Authorization": f"Bearer {create_access_token(uuid4())}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"]["react"] == {
+            "__typename": "Error",
+            "message": TrainingDoesNotExist.message,
+        }
+
+
+@patch("app.graphql.mutations.reactions.ReactionService", autospec=True)
+class TestUnreact:
+    training_id = uuid4()
+
+    def get_query(self):
+        return f"""
+        mutation {{
+            unreact(input: {{ trainingId: "{self.training_id}" }}) {{
+                __typename
+            }}
+        }}
+        """
+
+    def test_calls_reaction_service_unreact(self, mocked_reaction_service, client):
+        user_id = uuid4()
+
+        response = client.post(
+            "/graphql",
+            json={"query": self.get_query()},
+            headers={"Authorization": f"Bearer {create_access_token(user_id)}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"]["unreact"] == {"__typename": "OK"}
+        mocked_reaction_service.unreact.assert_awaited_once_with(
+            user_id=user_id, training_id=self.training_id
+        )
@@ -0,0 +1,70 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+
+from app.database import engine
+from app.jwt_tokens import create_access_token
+
+QUERY = f"""
+{{
+    trainings(userId: "{uuid4()}"){{
+        name
+    }}
+}}
+"""
+
+
+async def select_one_three_times(**kwargs):
+    async with engine.connect() as connection:
+        for _ in range(3):
+            await connection.execute(text("SELECT 1"))
+    return []
+
+
+@pytest.mark.parametrize(
+    "is_header_enabled,headers,are_extensions_returned",
+    (
+        (True, {"X-Debug-SQL": "1"}, True),
+        (True, {}, False),
+        (False, {"X-Debug-SQL": "1"}, False),
+    ),
+)
+@patch("app.graphql.extensions.config")
+@patch("app.graphql.queries.trainings.TrainingService", autospec=True)
+def test_sql_queries_extension(
+    mocked_training_service,
+    mocked_config,
+    is_header_enabled,
+    headers,
+    are_extensions_returned,
+    client,
+):
+    mocked_config.SQL_DEBUG_HEADER = "X-Debug-SQL"
+    mocked_config.SQL_DEBUG_HEADER_ENABLED = is_header_enabled
+    mocked_config.SQL_REPEATED_STATEMENT_THRESHOLD = 3
+    mocked_training_service.get_user_trainings.side_effect = select_one_three_times
+
+    response = client.post(
+        "/graphql",
+        json={"query": QUERY},
+        headers={
+            "Authorization": f"Bearer {create_access_token(uuid4())}",
+            **headers,
+        },
+    )
+
+    assert response.status_code == 200
+    response_json = response.json()
+    assert response_json["data"] == {"trainings": []}
+    if not are_extensions_returned:
+        assert "extensions" not in response_json
+        return
+    sql = response_json["extensions"]["sql"]
+    assert sql["count"] == 3
+    assert [statement["statement"] for statement in sql["statements"]] == [
+        "SELECT 1"
+    ] * 3
+    assert sql["durationMs"] > 0
+    assert sql["repeatedStatements"] == [{"statement": "SELECT 1", "count": 3}]
@@ -0,0 +1,23 @@
+from unittest.mock import call, patch
+from uuid import uuid4
+
+from app.backfill_timelines import backfill_timelines
+
+
+@patch("app.backfill_timelines.TimelineRepository", autospec=True)
+async def test_backfill_timelines_goes_through_all_batches(mocked_repository):
+    user_ids = [uuid4(), uuid4()]
+    mocked_repository_instance = mocked_repository.return_value.__aenter__.return_value
+    mocked_repository_instance.backfill_timelines.side_effect = [
+        (user_ids[0], 5),
+        (user_ids[1], 3),
+        (None, 0),
+    ]
+
+    assert await backfill_timelines(batch_size=10) == 8
+    assert mocked_repository_instance.backfill_timelines.await_args_list == [
+        call(after=None, limit=10),
+        call(after=user_ids[0], limit=10),
+        call(after=user_ids[1], limit=10),
+    ]
+    assert mocked_repository.call_count == 3
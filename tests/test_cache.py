@@ -0,0 +1,67 @@
+from freezegun import freeze_time
+
+from app.cache import LRUCache
+
+
+def test_get_returns_set_value():
+    cache = LRUCache(max_size=2, ttl_in_seconds=60)
+    cache.set("key", False)
+
+    assert cache.get("key") is False
+    assert cache.get("missing") is None
+    assert cache.get("missing", default=True) is True
+
+
+def test_set_evicts_least_recently_used_key():
+    cache = LRUCache(max_size=2, ttl_in_seconds=60)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.get("first")
+
+    cache.set("third", 3)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+    assert len(cache) == 2
+
+
+def test_get_does_not_return_expired_value():
+    with freeze_time("2022-01-01 10:00:00") as frozen_time:
+        cache = LRUCache(max_size=2, ttl_in_seconds=60)
+        cache.set("key", 1)
+        frozen_time.tick(59)
+        assert cache.get("key") == 1
+
+        frozen_time.tick(1)
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+
+def test_set_with_own_ttl():
+    with freeze_time("2022-01-01 10:00:00") as frozen_time:
+        cache = LRUCache(max_size=2, ttl_in_seconds=60)
+        cache.set("short", 1, ttl_in_seconds=10)
+        cache.set("default", 2)
+
+        frozen_time.tick(10)
+
+        assert cache.get("short") is None
+        assert cache.get("default") == 2
+
+
+def test_invalidate_and_clear():
+    cache = LRUCache(max_size=2, ttl_in_seconds=60)
+    cache.set("first", 1)
+    cache.set("second", 2)
+
+    cache.invalidate("first")
+    cache.invalidate("missing")
+
+    assert cache.get("first") is None
+    assert cache.get("second") == 2
+
+    cache.clear()
+
+    assert len(cache) == 0
@@ -0,0 +1,53 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.domain import entities
+from app.domain.events import (
+    dump_new_friendship_event,
+    dump_new_training_event,
+    load_new_friendship_event,
+    load_new_training_event,
+)
+from app.enums import TrainingVisibilityEnum
+
+
+@pytest.mark.parametrize("end_time", (datetime(2022, 1, 1, 11), None))
+def test_new_training_event_round_trip(end_time):
+    training = entities.TrainingWithVisibility(
+        id=uuid4(),
+        user_id=uuid4(),
+        name="name",
+        start_time=datetime(2022, 1, 1, 10),
+        end_time=end_time,
+        visibility=TrainingVisibilityEnum.only_friends,
+    )
+
+    event = dump_new_training_event(training)
+
+    assert event["version"] == 1
+    assert load_new_training_event(event) == training
+
+
+@pytest.mark.parametrize(
+    "event", ({"training_id": str(uuid4())}, {"version": 2, "training": {}})
+)
+def test_load_new_training_event_skips_other_versions(event):
+    assert load_new_training_event(event) is None
+
+
+def test_new_friendship_event_round_trip():
+    user_1_id, user_2_id = uuid4(), uuid4()
+
+    event = dump_new_friendship_event(user_1_id, user_2_id)
+
+    assert event["version"] == 1
+    assert load_new_friendship_event(event) == (user_1_id, user_2_id)
+
+
+@pytest.mark.parametrize(
+    "event", ({"user_1_id": str(uuid4())}, {"version": 2, "friendship": {}})
+)
+def test_load_new_friendship_event_skips_other_versions(event):
+    assert load_new_friendship_event(event) is None
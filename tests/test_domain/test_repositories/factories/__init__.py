@@ -4,3 +4,4 @@ from tests.test_domain.test_repositories.factories.trainings import *  # noqa
 from tests.test_domain.test_repositories.factories.users import *  # noqa
 from tests.test_domain.test_repositories.factories.profiles import *  # noqa
 from tests.test_domain.test_repositories.factories.friendship_requests import *  # noqa
+from tests.test_domain.test_repositories.factories.friend_suggestions import *  # noqa
@@ -0,0 +1,15 @@
+from factory import LazyFunction
+from factory.alchemy import SQLAlchemyModelFactory
+
+from app import models
+from tests.test_domain.test_repositories.factories.users import UserFactory
+
+
+class FriendSuggestionFactory(SQLAlchemyModelFactory):
+    class Meta:
+        model = models.FriendSuggestion
+        sqlalchemy_session_persistence = "commit"
+
+    user_id = LazyFunction(lambda: UserFactory().id)
+    suggested_user_id = LazyFunction(lambda: UserFactory().id)
+    mutual_friends_count = 1
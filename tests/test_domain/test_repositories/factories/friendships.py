@@ -12,3 +12,10 @@ class FriendshipFactory(SQLAlchemyModelFactory):
 
     user_1 = SubFactory(UserFactory)
     user_2 = SubFactory(UserFactory)
+
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        # Friendships are stored once, with the lower user id first.
+        if kwargs["user_2"].id < kwargs["user_1"].id:
+            kwargs["user_1"], kwargs["user_2"] = kwargs["user_2"], kwargs["user_1"]
+        return super()._create(model_class, *args, **kwargs)
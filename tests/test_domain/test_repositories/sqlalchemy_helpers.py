@@ -1,4 +1,6 @@
 from sqlalchemy import event
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 
 class QueryCounter:
@@ -15,3 +17,19 @@ class QueryCounter:
 
     def callback(self, *args, **kwargs):
         self.count += 1
+
+
+class Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def compile_explain(element, compiler, **kwargs):
+    return f"EXPLAIN {compiler.process(element.statement, **kwargs)}"
+
+
+def get_query_plan(session, statement) -> str:
+    return "\n".join(session.execute(Explain(statement)).scalars())
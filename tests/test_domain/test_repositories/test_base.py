@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import select
+
+from app import models
+from app.domain.repositories.base import UnitOfWork
+from app.domain.repositories.friendship_repository import FriendshipRepository
+from app.domain.repositories.user_repository import UserRepository
+
+
+async def test_unit_of_work_shares_session_between_repositories(db_session):
+    async with (
+        UnitOfWork() as unit_of_work,
+        UserRepository(unit_of_work) as user_repository,
+        FriendshipRepository(unit_of_work) as friendship_repository,
+    ):
+        assert user_repository.session is friendship_repository.session
+        assert user_repository.session is unit_of_work.session
+
+
+async def test_unit_of_work_commits_once_on_exit(db_session):
+    async with (
+        UnitOfWork() as unit_of_work,
+        UserRepository(unit_of_work) as user_repository,
+    ):
+        await user_repository.create_user(email="1@example.com", hashed_password="")
+        await user_repository.create_user(email="2@example.com", hashed_password="")
+        assert db_session.execute(select(models.User)).all() == []
+
+    assert len(db_session.execute(select(models.User)).all()) == 2
+
+
+async def test_unit_of_work_rolls_back_on_exception(db_session):
+    with pytest.raises(ValueError):
+        async with (
+            UnitOfWork() as unit_of_work,
+            UserRepository(unit_of_work) as user_repository,
+        ):
+            await user_repository.create_user(email="1@example.com", hashed_password="")
+            raise ValueError
+
+    assert db_session.execute(select(models.User)).all() == []
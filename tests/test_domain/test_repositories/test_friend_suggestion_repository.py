@@ -0,0 +1,91 @@
+from sqlalchemy import select
+
+from app import enums, models
+from app.database import engine
+from app.domain import entities
+from app.domain.repositories.friend_suggestion_repository import (
+    FriendSuggestionRepository,
+)
+from tests.test_domain.test_repositories.factories import (
+    FriendshipFactory,
+    FriendshipRequestFactory,
+    FriendSuggestionFactory,
+    UserFactory,
+)
+from tests.test_domain.test_repositories.sqlalchemy_helpers import QueryCounter
+
+
+async def test_replace_friend_suggestions(db_session):
+    user_1, user_2, user_3, user_4 = UserFactory.create_batch(size=4)
+    FriendSuggestionFactory(user_id=user_1.id, suggested_user_id=user_2.id)
+    kept_suggestion = FriendSuggestionFactory(
+        user_id=user_2.id, suggested_user_id=user_4.id
+    )
+
+    async with FriendSuggestionRepository() as repository:
+        await repository.replace_friend_suggestions(
+            {user_1.id: [(user_3.id, 2), (user_4.id, 1)], user_3.id: []}
+        )
+
+    suggestions = db_session.execute(
+        select(
+            models.FriendSuggestion.user_id,
+            models.FriendSuggestion.suggested_user_id,
+            models.FriendSuggestion.mutual_friends_count,
+        )
+    ).all()
+    assert sorted(suggestions) == sorted(
+        [
+            (user_1.id, user_3.id, 2),
+            (user_1.id, user_4.id, 1),
+            (kept_suggestion.user_id, kept_suggestion.suggested_user_id, 1),
+        ]
+    )
+
+
+async def test_get_friend_suggestions(user):
+    suggested_users = UserFactory.create_batch(size=3)
+    for suggested_user, mutual_friends_count in zip(suggested_users, (1, 3, 2)):
+        FriendSuggestionFactory(
+            user_id=user.id,
+            suggested_user_id=suggested_user.id,
+            mutual_friends_count=mutual_friends_count,
+        )
+    FriendSuggestionFactory(suggested_user_id=suggested_users[0].id)
+
+    async with FriendSuggestionRepository() as repository:
+        with QueryCounter(engine.sync_engine) as query_counter:
+            suggestions = await repository.get_friend_suggestions(user.id, limit=2)
+        assert query_counter.count == 1
+
+    assert suggestions == [
+        entities.FriendSuggestion(
+            user_id=suggested_users[1].id, mutual_friends_count=3
+        ),
+        entities.FriendSuggestion(
+            user_id=suggested_users[2].id, mutual_friends_count=2
+        ),
+    ]
+
+
+async def test_get_friend_suggestions_skips_friends_and_pending_requests(user):
+    friend, sender, receiver, rejected, suggested_user = UserFactory.create_batch(
+        size=5
+    )
+    FriendshipFactory(user_1=user, user_2=friend)
+    FriendshipRequestFactory(sender=sender, receiver=user)
+    FriendshipRequestFactory(sender=user, receiver=receiver)
+    FriendshipRequestFactory(
+        sender=user,
+        receiver=rejected,
+        status=enums.FriendshipRequestStatusEnum.rejected,
+    )
+    for other_user in (friend, sender, receiver, rejected, suggested_user):
+        FriendSuggestionFactory(user_id=user.id, suggested_user_id=other_user.id)
+
+    async with FriendSuggestionRepository() as repository:
+        suggestions = await repository.get_friend_suggestions(user.id, limit=10)
+
+    assert sorted(suggestion.user_id for suggestion in suggestions) == sorted(
+        [rejected.id, suggested_user.id]
+    )
@@ -1,8 +1,5 @@
 from uuid import uuid4
 
-from sqlalchemy import select
-
-from app import models
 from app.database import engine
 from app.domain.repositories.friendship_repository import FriendshipRepository
 from tests.test_domain.test_repositories.factories import FriendshipFactory, UserFactory
@@ -17,19 +14,62 @@ async def test_get_user_friends_ids_no_friends(user):
 
 
 async def test_get_user_friends_ids_friends(user):
-    friendship_1 = FriendshipFactory(user_1=user)
-    friendship_2 = FriendshipFactory(user_1=user)
+    friend_1, friend_2 = UserFactory.create_batch(size=2)
+    FriendshipFactory(user_1=user, user_2=friend_1)
+    FriendshipFactory(user_1=friend_2, user_2=user)
     FriendshipFactory()
 
     async with FriendshipRepository() as repository:
         with QueryCounter(engine.sync_engine) as query_counter:
             assert await repository.get_user_friends_ids(user.id) == {
-                friendship_1.user_2.id,
-                friendship_2.user_2.id,
+                friend_1.id,
+                friend_2.id,
             }
         assert query_counter.count == 1
 
 
+async def test_count_user_friends(user):
+    FriendshipFactory(user_1=user)
+    FriendshipFactory(user_2=user)
+    FriendshipFactory()
+
+    async with FriendshipRepository() as repository:
+        assert await repository.count_user_friends(user.id) == 2
+        assert await repository.count_user_friends(uuid4()) == 0
+
+
+async def test_get_friendships_page(db_session):
+    friendships = sorted(
+        (friendship.user_1_id, friendship.user_2_id)
+        for friendship in FriendshipFactory.create_batch(size=3)
+    )
+
+    async with FriendshipRepository() as repository:
+        first_page = await repository.get_friendships_page(after=None, limit=2)
+        second_page = await repository.get_friendships_page(
+            after=first_page[-1], limit=2
+        )
+
+    assert first_page + second_page == friendships
+
+
+async def test_get_friendships_around_user(user):
+    friend_1, friend_2, friend_of_friend, other_user = UserFactory.create_batch(size=4)
+    friendships = [
+        FriendshipFactory(user_1=user, user_2=friend_1),
+        FriendshipFactory(user_1=user, user_2=friend_2),
+        # Read once although both users are friends of the user.
+        FriendshipFactory(user_1=friend_1, user_2=friend_2),
+        FriendshipFactory(user_1=friend_1, user_2=friend_of_friend),
+    ]
+    FriendshipFactory(user_1=friend_of_friend, user_2=other_user)
+
+    async with FriendshipRepository() as repository:
+        assert sorted(await repository.get_friendships_around_user(user.id)) == sorted(
+            (friendship.user_1_id, friendship.user_2_id) for friendship in friendships
+        )
+
+
 async def test_are_users_friends_returns_true_when_users_are_friends(db_session):
     friendship = FriendshipFactory()
 
@@ -40,6 +80,12 @@ async def test_are_users_friends_returns_true_when_users_are_friends(db_session)
             )
             is True
         )
+        assert (
+            await repository.are_users_friends(
+                user_1_id=friendship.user_2_id, user_2_id=friendship.user_1_id
+            )
+            is True
+        )
 
 
 async def test_are_users_friends_returns_false_when_users_are_not_friends(db_session):
@@ -64,17 +110,3 @@ async def test_are_users_friends_returns_false_when_users_are_not_friends(db_ses
             )
             is False
         )
-
-
-async def test_create_friendship(db_session):
-    user_1, user_2 = UserFactory.create_batch(size=2)
-
-    async with FriendshipRepository() as repository:
-        await repository.create_friendship(user_1_id=user_1.id, user_2_id=user_2.id)
-
-    sql = select(models.Friendship)
-    friendships_from_db = db_session.execute(sql).scalars().all()
-    assert len(friendships_from_db) == 1
-    friendship_from_db = friendships_from_db[0]
-    assert friendship_from_db.user_1_id == user_1.id
-    assert friendship_from_db.user_2_id == user_2.id
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import timedelta
 from uuid import uuid4
 
@@ -6,86 +7,34 @@ from freezegun import freeze_time
 from sqlalchemy import select
 
 from app import enums, models, helpers
+from app.database import engine
 from app.domain import entities
+from app.domain.repositories.friendship_repository import get_canonical_pair
 from app.domain.repositories.friendship_request_repository import (
     FriendshipRequestRepository,
 )
 from app.helpers import get_utc_now
 from tests.test_domain.test_repositories.factories import (
+    FriendshipFactory,
     FriendshipRequestFactory,
     UserFactory,
 )
-
-
-async def test_does_pending_request_exist_not_exists(db_session):
-    friendship_request = FriendshipRequestFactory(
-        status=enums.FriendshipRequestStatusEnum.accepted
-    )
-    FriendshipRequestFactory(
-        sender=friendship_request.sender,
-        receiver=friendship_request.receiver,
-        status=enums.FriendshipRequestStatusEnum.rejected,
-    )
-    FriendshipRequestFactory(
-        sender=friendship_request.sender,
-        receiver=friendship_request.receiver,
-        status=enums.FriendshipRequestStatusEnum.cancelled,
-    )
-    FriendshipRequestFactory(
-        sender=friendship_request.sender,
-        status=enums.FriendshipRequestStatusEnum.pending,
-    )
-    FriendshipRequestFactory(
-        receiver=friendship_request.receiver,
-        status=enums.FriendshipRequestStatusEnum.pending,
-    )
-
-    async with FriendshipRequestRepository() as friendship_request_repository:
-        assert (
-            await friendship_request_repository.does_pending_request_exist(
-                user_1_id=friendship_request.sender.id,
-                user_2_id=friendship_request.receiver.id,
-            )
-            is False
-        )
-        assert (
-            await friendship_request_repository.does_pending_request_exist(
-                user_1_id=friendship_request.receiver.id,
-                user_2_id=friendship_request.sender.id,
-            )
-            is False
-        )
-
-
-async def test_does_pending_request_exist_exists(db_session):
-    friendship_request = FriendshipRequestFactory(
-        status=enums.FriendshipRequestStatusEnum.pending
-    )
-
-    async with FriendshipRequestRepository() as friendship_request_repository:
-        assert (
-            await friendship_request_repository.does_pending_request_exist(
-                user_1_id=friendship_request.sender.id,
-                user_2_id=friendship_request.receiver.id,
-            )
-            is True
-        )
-        assert (
-            await friendship_request_repository.does_pending_request_exist(
-                user_1_id=friendship_request.receiver.id,
-                user_2_id=friendship_request.sender.id,
-            )
-            is True
-        )
+from tests.test_domain.test_repositories.sqlalchemy_helpers import QueryCounter
 
 
 @freeze_time("2020-10-11 10:00:00")
 async def test_create_pending_request(db_session):
     sender, receiver = UserFactory.create_batch(size=2)
     async with FriendshipRequestRepository() as friendship_request_repository:
-        friendship_request = await friendship_request_repository.create_pending_request(
+        (
+            friendship_request,
+            does_receiver_exist,
+            are_users_friends,
+        ) = await friendship_request_repository.create_pending_request(
             sender_id=sender.id, receiver_id=receiver.id
         )
+    assert does_receiver_exist is True
+    assert are_users_friends is False
 
     sql = select(models.FriendshipRequest)
     friendship_requests_from_db = db_session.execute(sql).scalars().all()
@@ -114,6 +63,89 @@ async def test_create_pending_request(db_session):
     )
 
 
+async def test_create_pending_request_receiver_does_not_exist(db_session):
+    sender = UserFactory()
+
+    async with FriendshipRequestRepository() as repository:
+        assert await repository.create_pending_request(
+            sender_id=sender.id, receiver_id=uuid4()
+        ) == (None, False, False)
+
+
+async def test_create_pending_request_users_are_friends(db_session):
+    friendship = FriendshipFactory()
+
+    async with FriendshipRequestRepository() as repository:
+        assert await repository.create_pending_request(
+            sender_id=friendship.user_1_id, receiver_id=friendship.user_2_id
+        ) == (None, True, True)
+
+    assert db_session.execute(select(models.FriendshipRequest)).first() is None
+
+
+@pytest.mark.parametrize("is_sent_by_receiver", (False, True))
+async def test_create_pending_request_already_pending(is_sent_by_receiver, db_session):
+    pending_request = FriendshipRequestFactory(
+        status=enums.FriendshipRequestStatusEnum.pending
+    )
+    sender, receiver = pending_request.sender, pending_request.receiver
+    if is_sent_by_receiver:
+        sender, receiver = receiver, sender
+
+    async with FriendshipRequestRepository() as repository:
+        with QueryCounter(engine.sync_engine) as query_counter:
+            assert await repository.create_pending_request(
+                sender_id=sender.id, receiver_id=receiver.id
+            ) == (None, True, False)
+        assert query_counter.count == 1
+
+    assert db_session.execute(select(models.FriendshipRequest.id)).scalars().all() == [
+        pending_request.id
+    ]
+
+
+async def test_create_pending_request_after_closed_requests(db_session):
+    sender, receiver = UserFactory.create_batch(size=2)
+    for status in (
+        enums.FriendshipRequestStatusEnum.accepted,
+        enums.FriendshipRequestStatusEnum.rejected,
+        enums.FriendshipRequestStatusEnum.cancelled,
+    ):
+        FriendshipRequestFactory(sender=sender, receiver=receiver, status=status)
+
+    async with FriendshipRequestRepository() as repository:
+        friendship_request, *_ = await repository.create_pending_request(
+            sender_id=sender.id, receiver_id=receiver.id
+        )
+
+    assert friendship_request.status == enums.FriendshipRequestStatusEnum.pending
+
+
+async def test_concurrent_requests_between_users_create_one(db_session):
+    user_1, user_2 = UserFactory.create_batch(size=2)
+
+    async def send(sender_id, receiver_id):
+        async with FriendshipRequestRepository() as repository:
+            friendship_request, *_ = await repository.create_pending_request(
+                sender_id=sender_id, receiver_id=receiver_id
+            )
+            return friendship_request
+
+    results = await asyncio.gather(
+        *(
+            send(sender_id, receiver_id)
+            for _ in range(5)
+            for sender_id, receiver_id in (
+                (user_1.id, user_2.id),
+                (user_2.id, user_1.id),
+            )
+        )
+    )
+
+    assert len([result for result in results if result]) == 1
+    assert len(db_session.execute(select(models.FriendshipRequest)).all()) == 1
+
+
 async def test_get_pending_requests_sent_by_user(db_session):
     sender = UserFactory()
     now = helpers.get_utc_now()
@@ -213,24 +245,318 @@ async def test_get_pending_requests_received_by_user_no_results():
         )
 
 
+async def test_accept_pending_request(db_session):
+    friendship_request = FriendshipRequestFactory(
+        status=enums.FriendshipRequestStatusEnum.pending
+    )
+
+    async with FriendshipRequestRepository() as repository:
+        with QueryCounter(engine.sync_engine) as query_counter:
+            sender_id = await repository.accept_pending_request(
+                friendship_request_id=friendship_request.id,
+                receiver_id=friendship_request.receiver_id,
+            )
+        assert query_counter.count == 1
+
+    db_session.refresh(friendship_request)
+    assert friendship_request.status == enums.FriendshipRequestStatusEnum.accepted
+    assert sender_id == friendship_request.sender_id
+    assert set(
+        db_session.execute(
+            select(models.Friendship.user_1_id, models.Friendship.user_2_id)
+        ).all()
+    ) == {
+        get_canonical_pair(friendship_request.sender_id, friendship_request.receiver_id)
+    }
+
+
 @pytest.mark.parametrize(
     "status",
     (
         enums.FriendshipRequestStatusEnum.accepted,
         enums.FriendshipRequestStatusEnum.rejected,
         enums.FriendshipRequestStatusEnum.cancelled,
-        enums.FriendshipRequestStatusEnum.pending,
     ),
 )
-async def test_update_status(status, db_session):
+async def test_accept_pending_request_not_pending(status, db_session):
+    friendship_request = FriendshipRequestFactory(status=status)
+
+    async with FriendshipRequestRepository() as repository:
+        assert (
+            await repository.accept_pending_request(
+                friendship_request_id=friendship_request.id,
+                receiver_id=friendship_request.receiver_id,
+            )
+            is None
+        )
+
+    db_session.refresh(friendship_request)
+    assert friendship_request.status == status
+    assert db_session.execute(select(models.Friendship)).first() is None
+
+
+async def test_accept_pending_request_sent_by_user(db_session):
+    friendship_request = FriendshipRequestFactory(
+        status=enums.FriendshipRequestStatusEnum.pending
+    )
+
+    async with FriendshipRequestRepository() as repository:
+        assert (
+            await repository.accept_pending_request(
+                friendship_request_id=friendship_request.id,
+                receiver_id=friendship_request.sender_id,
+            )
+            is None
+        )
+
+    assert db_session.execute(select(models.Friendship)).first() is None
+
+
+@pytest.mark.parametrize(
+    "method, status, owner",
+    (
+        (
+            "reject_pending_request",
+            enums.FriendshipRequestStatusEnum.rejected,
+            "receiver_id",
+        ),
+        (
+            "cancel_pending_request",
+            enums.FriendshipRequestStatusEnum.cancelled,
+            "sender_id",
+        ),
+    ),
+)
+async def test_reject_and_cancel_pending_request(method, status, owner, db_session):
     friendship_request = FriendshipRequestFactory(
         status=enums.FriendshipRequestStatusEnum.pending
     )
+    other_owner = "sender_id" if owner == "receiver_id" else "receiver_id"
 
     async with FriendshipRequestRepository() as repository:
-        await repository.update_status(
-            friendship_request_id=friendship_request.id, status=status
+        assert not await getattr(repository, method)(
+            friendship_request_id=friendship_request.id,
+            **{owner: getattr(friendship_request, other_owner)},
+        )
+        assert await getattr(repository, method)(
+            friendship_request_id=friendship_request.id,
+            **{owner: getattr(friendship_request, owner)},
+        )
+        # Not pending anymore.
+        assert not await getattr(repository, method)(
+            friendship_request_id=friendship_request.id,
+            **{owner: getattr(friendship_request, owner)},
         )
 
     db_session.refresh(friendship_request)
     assert friendship_request.status == status
+
+
+async def test_concurrent_accepts_and_cancels_apply_once(db_session):
+    friendship_requests = [
+        FriendshipRequestFactory(status=enums.FriendshipRequestStatusEnum.pending)
+        for _ in range(5)
+    ]
+
+    async def accept(friendship_request):
+        async with FriendshipRequestRepository() as repository:
+            return await repository.accept_pending_request(
+                friendship_request_id=friendship_request.id,
+                receiver_id=friendship_request.receiver_id,
+            )
+
+    async def cancel(friendship_request):
+        async with FriendshipRequestRepository() as repository:
+            return await repository.cancel_pending_request(
+                friendship_request_id=friendship_request.id,
+                sender_id=friendship_request.sender_id,
+            )
+
+    results = await asyncio.gather(
+        *(
+            operation(friendship_request)
+            for friendship_request in friendship_requests
+            for _ in range(4)
+            for operation in (accept, cancel)
+        )
+    )
+
+    for index, friendship_request in enumerate(friendship_requests):
+        applied = [bool(result) for result in results[index * 8 : (index + 1) * 8]]
+        assert applied.count(True) == 1
+        db_session.refresh(friendship_request)
+        friendships = db_session.execute(
+            select(models.Friendship).where(
+                models.Friendship.user_1_id.in_(
+                    [friendship_request.sender_id, friendship_request.receiver_id]
+                ),
+                models.Friendship.user_2_id.in_(
+                    [friendship_request.sender_id, friendship_request.receiver_id]
+                ),
+            )
+        ).all()
+        if friendship_request.status == enums.FriendshipRequestStatusEnum.accepted:
+            assert len(friendships) == 1
+        else:
+            assert friendship_request.status == (
+                enums.FriendshipRequestStatusEnum.cancelled
+            )
+            assert friendships == []
+
+
+async def test_accept_pending_requests(db_session):
+    receiver = UserFactory()
+    pending_requests = FriendshipRequestFactory.create_batch(
+        size=3, receiver=receiver, status=enums.FriendshipRequestStatusEnum.pending
+    )
+    rejected_request = FriendshipRequestFactory(
+        receiver=receiver, status=enums.FriendshipRequestStatusEnum.rejected
+    )
+    sent_request = FriendshipRequestFactory(
+        sender=receiver, status=enums.FriendshipRequestStatusEnum.pending
+    )
+
+    async with FriendshipRequestRepository() as repository:
+        with QueryCounter(engine.sync_engine) as query_counter:
+            accepted = await repository.accept_pending_requests(
+                friendship_request_ids=[
+                    *(request.id for request in pending_requests),
+                    rejected_request.id,
+                    sent_request.id,
+                    uuid4(),
+                ],
+                receiver_id=receiver.id,
+            )
+        assert query_counter.count == 1
+
+    assert accepted == {request.id: request.sender_id for request in pending_requests}
+    friendships = db_session.execute(
+        select(models.Friendship.user_1_id, models.Friendship.user_2_id)
+    ).all()
+    assert sorted(friendships) == sorted(
+        get_canonical_pair(request.sender_id, receiver.id)
+        for request in pending_requests
+    )
+    db_session.refresh(sent_request)
+    assert sent_request.status == enums.FriendshipRequestStatusEnum.pending
+
+
+async def test_accept_pending_requests_between_friends(db_session):
+    receiver = UserFactory()
+    friend_request, stranger_request = FriendshipRequestFactory.create_batch(
+        size=2, receiver=receiver, status=enums.FriendshipRequestStatusEnum.pending
+    )
+    FriendshipFactory(user_1=friend_request.sender, user_2=receiver)
+
+    async with FriendshipRequestRepository() as repository:
+        accepted = await repository.accept_pending_requests(
+            friendship_request_ids=[friend_request.id, stranger_request.id],
+            receiver_id=receiver.id,
+        )
+
+    assert accepted == {
+        friend_request.id: friend_request.sender_id,
+        stranger_request.id: stranger_request.sender_id,
+    }
+    friendships = db_session.execute(
+        select(models.Friendship.user_1_id, models.Friendship.user_2_id)
+    ).all()
+    assert sorted(friendships) == sorted(
+        get_canonical_pair(request.sender_id, receiver.id)
+        for request in (friend_request, stranger_request)
+    )
+    db_session.refresh(friend_request)
+    assert friend_request.status == enums.FriendshipRequestStatusEnum.accepted
+
+
+@pytest.mark.parametrize(
+    "method, status, owner",
+    (
+        (
+            "reject_pending_requests",
+            enums.FriendshipRequestStatusEnum.rejected,
+            "receiver",
+        ),
+        (
+            "cancel_pending_requests",
+            enums.FriendshipRequestStatusEnum.cancelled,
+            "sender",
+        ),
+    ),
+)
+async def test_reject_and_cancel_pending_requests(method, status, owner, db_session):
+    user = UserFactory()
+    owned_requests = FriendshipRequestFactory.create_batch(
+        size=3, status=enums.FriendshipRequestStatusEnum.pending, **{owner: user}
+    )
+    accepted_request = FriendshipRequestFactory(
+        status=enums.FriendshipRequestStatusEnum.accepted, **{owner: user}
+    )
+    other_request = FriendshipRequestFactory(
+        status=enums.FriendshipRequestStatusEnum.pending
+    )
+
+    async with FriendshipRequestRepository() as repository:
+        with QueryCounter(engine.sync_engine) as query_counter:
+            applied_ids = await getattr(repository, method)(
+                [
+                    *(request.id for request in owned_requests),
+                    accepted_request.id,
+                    other_request.id,
+                ],
+                user.id,
+            )
+        assert query_counter.count == 1
+
+    assert applied_ids == {request.id for request in owned_requests}
+    for request in owned_requests:
+        db_session.refresh(request)
+        assert request.status == status
+    db_session.refresh(other_request)
+    assert other_request.status == enums.FriendshipRequestStatusEnum.pending
+
+
+@pytest.mark.parametrize("owner", ("receiver", "sender"))
+async def test_get_pending_requests_by_user_pages(owner, db_session):
+    user = UserFactory()
+    other_owner = "sender" if owner == "receiver" else "receiver"
+    owner_action = "received" if owner == "receiver" else "sent"
+    timestamp = get_utc_now()
+    friendship_requests = [
+        FriendshipRequestFactory(
+            status=enums.FriendshipRequestStatusEnum.pending,
+            timestamp=timestamp + timedelta(minutes=minutes),
+            **{owner: user},
+        )
+        for minutes in (2, 0, 1, 1)
+    ]
+    FriendshipRequestFactory(
+        status=enums.FriendshipRequestStatusEnum.accepted, **{owner: user}
+    )
+    FriendshipRequestFactory(
+        status=enums.FriendshipRequestStatusEnum.pending, **{other_owner: user}
+    )
+    oldest_first = [
+        entities.FriendshipRequest.from_model(friendship_request)
+        for friendship_request in sorted(
+            friendship_requests, key=lambda request: (request.timestamp, request.id)
+        )
+    ]
+
+    async with FriendshipRequestRepository() as repository:
+        get_page = getattr(
+            repository, f"get_pending_requests_{owner_action}_by_user_page"
+        )
+        first_page = await get_page(user_id=user.id, limit=3)
+        second_page = await get_page(
+            user_id=user.id,
+            limit=3,
+            after=(first_page[-1].timestamp, first_page[-1].id),
+        )
+        count = await getattr(
+            repository, f"count_pending_requests_{owner_action}_by_user"
+        )(user_id=user.id)
+
+    assert first_page == oldest_first[:3]
+    assert second_page == oldest_first[3:]
+    assert count == 4
@@ -0,0 +1,50 @@
+from app.database import engine
+from app.domain import entities
+from app.domain.repositories.outbox_repository import OutboxRepository
+from tests.test_domain.test_repositories.sqlalchemy_helpers import QueryCounter
+
+
+async def test_lock_and_delete_messages(db_session):
+    async with OutboxRepository() as repository:
+        for number in range(3):
+            await repository.add_message(task="task", kwargs={"number": number})
+
+    async with OutboxRepository() as repository:
+        with QueryCounter(engine.sync_engine) as query_counter:
+            messages = await repository.lock_messages(limit=2)
+        assert query_counter.count == 1
+        assert [(message.task, message.kwargs) for message in messages] == [
+            ("task", {"number": 0}),
+            ("task", {"number": 1}),
+        ]
+
+        # A concurrent relay skips the locked messages instead of waiting.
+        async with OutboxRepository() as other_repository:
+            other_messages = await other_repository.lock_messages(limit=2)
+        assert [message.kwargs for message in other_messages] == [{"number": 2}]
+
+        await repository.delete_messages([message.id for message in messages])
+
+    async with OutboxRepository() as repository:
+        assert await repository.lock_messages(limit=10) == [
+            entities.OutboxMessage(
+                id=other_messages[0].id, task="task", kwargs={"number": 2}
+            )
+        ]
+
+
+async def test_add_messages(db_session):
+    async with OutboxRepository() as repository:
+        with QueryCounter(engine.sync_engine) as query_counter:
+            await repository.add_messages(
+                task="task", kwargs_list=[{"number": 0}, {"number": 1}]
+            )
+            await repository.add_messages(task="task", kwargs_list=[])
+        assert query_counter.count == 1
+
+    async with OutboxRepository() as repository:
+        messages = await repository.lock_messages(limit=10)
+    assert [(message.task, message.kwargs) for message in messages] == [
+        ("task", {"number": 0}),
+        ("task", {"number": 1}),
+    ]
@@ -0,0 +1,279 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, text
+
+from app import models
+from app.domain.repositories.friendship_repository import FriendshipRepository
+from app.domain.repositories.friendship_request_repository import (
+    FriendshipRequestRepository,
+)
+from app.domain.repositories.reaction_repository import ReactionRepository
+from app.domain.repositories.timeline_repository import TimelineRepository
+from app.domain.repositories.training_repository import TrainingRepository
+from tests.test_domain.test_repositories.sqlalchemy_helpers import get_query_plan
+
+USERS_COUNT = 1000
+TRAININGS_PER_USER = 20
+FRIENDSHIP_REQUESTS_PER_USER = 20
+
+
+@pytest.fixture
+def seeded_db_session(db_session):
+    db_session.execute(
+        text(
+            """
+            INSERT INTO "user" (id, email, hashed_password)
+            SELECT gen_random_uuid(), 'user_' || i || '@test.com', 'password'
+            FROM generate_series(1, :users_count) AS i
+            """
+        ),
+        {"users_count": USERS_COUNT},
+    )
+    db_session.execute(
+        text(
+            """
+            INSERT INTO profile (id, user_id, training_visibility)
+            SELECT gen_random_uuid(), id, 'public' FROM "user"
+            """
+        )
+    )
+    db_session.execute(
+        text(
+            """
+            INSERT INTO training (id, start_time, name, user_id)
+            SELECT gen_random_uuid(), now() - i * interval '1 day', 'Training', u.id
+            FROM "user" AS u, generate_series(1, :trainings_per_user) AS i
+            """
+        ),
+        {"trainings_per_user": TRAININGS_PER_USER},
+    )
+    db_session.execute(
+        text(
+            """
+            INSERT INTO reaction (id, user_id, training_id, reaction_type, created_at)
+            SELECT gen_random_uuid(), user_id, id, 'like', now() FROM training
+            """
+        )
+    )
+    db_session.execute(
+        text(
+            """
+            WITH numbered_users AS (
+                SELECT id, row_number() OVER (ORDER BY id) AS n FROM "user"
+            )
+            INSERT INTO friendship_request
+                (id, sender_id, receiver_id, status, timestamp)
+            SELECT
+                gen_random_uuid(),
+                sender.id,
+                receiver.id,
+                CASE WHEN i = 1 THEN 'pending' ELSE 'accepted' END
+                    ::friendshiprequeststatusenum,
+                now()
+            FROM numbered_users AS sender
+            CROSS JOIN generate_series(1, :requests_per_user) AS i
+            JOIN numbered_users AS receiver
+                ON receiver.n = (sender.n + i) % :users_count + 1
+            """
+        ),
+        {
+            "requests_per_user": FRIENDSHIP_REQUESTS_PER_USER,
+            "users_count": USERS_COUNT,
+        },
+    )
+    db_session.execute(
+        text(
+            """
+            INSERT INTO friendship (user_1_id, user_2_id)
+            SELECT least(sender_id, receiver_id), greatest(sender_id, receiver_id)
+            FROM friendship_request
+            WHERE status = 'accepted'
+            """
+        )
+    )
+    db_session.commit()
+    db_session.execute(text("ANALYZE"))
+    yield db_session
+
+
+def get_any_user_id(session):
+    return session.execute(select(models.User.id).limit(1)).scalar()
+
+
+def get_any_training_ids(session, count):
+    return session.execute(select(models.Training.id).limit(count)).scalars().all()
+
+
+def test_get_user_trainings_uses_index(seeded_db_session):
+    user_id = get_any_user_id(seeded_db_session)
+
+    plan = get_query_plan(
+        seeded_db_session,
+        TrainingRepository().get_user_trainings_query(
+            request_user_id=user_id, user_id=user_id
+        ),
+    )
+
+    assert "Seq Scan on training" not in plan
+
+
+def test_get_user_trainings_page_uses_index(seeded_db_session):
+    training = seeded_db_session.execute(select(models.Training).limit(1)).scalar()
+
+    plan = get_query_plan(
+        seeded_db_session,
+        TrainingRepository()
+        .get_user_trainings_query(
+            request_user_id=training.user_id,
+            user_id=training.user_id,
+            after=(training.start_time, training.id),
+        )
+        .limit(21),
+    )
+
+    assert "Seq Scan on training" not in plan
+    assert "ix_training_user_id_start_time_id" in plan
+
+
+def test_get_user_friends_ids_uses_indexes(seeded_db_session):
+    plan = get_query_plan(
+        seeded_db_session,
+        FriendshipRepository.get_user_friends_ids_query(
+            get_any_user_id(seeded_db_session)
+        ),
+    )
+
+    assert "Seq Scan on friendship" not in plan
+    assert "friendship_pkey" in plan
+    assert "ix_friendship_user_2_id" in plan
+
+
+def test_get_friendships_around_user_uses_indexes(seeded_db_session):
+    # The seeded table is small enough for a sequential scan to be cheaper,
+    # they are turned off to check that the indexes can serve the query.
+    seeded_db_session.execute(text("SET LOCAL enable_seqscan = off"))
+
+    plan = get_query_plan(
+        seeded_db_session,
+        FriendshipRepository.get_friendships_around_user_query(
+            get_any_user_id(seeded_db_session)
+        ),
+    )
+
+    assert "Seq Scan on friendship" not in plan
+    assert "Index Cond: (user_1_id = friends_ids." in plan
+    assert "Index Cond: (user_2_id = friends_ids" in plan
+
+
+def test_get_friends_trainings_uses_indexes(seeded_db_session):
+    plan = get_query_plan(
+        seeded_db_session,
+        TimelineRepository.get_friends_trainings_query(
+            viewers_ids=[get_any_user_id(seeded_db_session)]
+        ),
+    )
+
+    assert "Seq Scan on friendship" not in plan
+    assert "Seq Scan on training" not in plan
+
+
+def test_get_timeline_page_uses_indexes(seeded_db_session):
+    seeded_db_session.execute(
+        text(
+            """
+            INSERT INTO timeline (viewer_id, start_time, training_id)
+            SELECT receiver_id, training.start_time, training.id
+            FROM friendship_request
+            JOIN training ON training.user_id = friendship_request.sender_id
+            """
+        )
+    )
+    seeded_db_session.execute(
+        text(
+            """
+            INSERT INTO high_fan_out_author (user_id)
+            SELECT sender_id FROM friendship_request LIMIT 10
+            """
+        )
+    )
+    seeded_db_session.commit()
+    seeded_db_session.execute(text("ANALYZE"))
+    training = seeded_db_session.execute(select(models.Training).limit(1)).scalar()
+
+    plan = get_query_plan(
+        seeded_db_session,
+        TimelineRepository().get_timeline_query(
+            viewer_id=get_any_user_id(seeded_db_session),
+            limit=21,
+            after=(training.start_time, training.id),
+        ),
+    )
+
+    assert "timeline_pkey" in plan
+    assert "ix_training_user_id_start_time_id" in plan
+    assert "Seq Scan on timeline" not in plan
+    assert "Seq Scan on training" not in plan
+
+
+def test_get_reaction_count_by_training_ids_uses_index(seeded_db_session):
+    training_ids = get_any_training_ids(seeded_db_session, count=10)
+
+    plan = get_query_plan(
+        seeded_db_session,
+        ReactionRepository.get_reaction_count_by_training_ids_query(training_ids),
+    )
+
+    assert "Seq Scan on training" not in plan
+    assert "reaction" not in plan
+
+
+def test_get_reactions_by_training_ids_uses_index(seeded_db_session):
+    training_ids = get_any_training_ids(seeded_db_session, count=10)
+
+    plan = get_query_plan(
+        seeded_db_session,
+        ReactionRepository.get_reactions_by_training_ids_query(training_ids),
+    )
+
+    assert "Seq Scan on reaction" not in plan
+
+
+@pytest.mark.parametrize(
+    "get_query",
+    (
+        FriendshipRequestRepository.get_pending_requests_received_by_user_query,
+        FriendshipRequestRepository.get_pending_requests_sent_by_user_query,
+    ),
+)
+@pytest.mark.parametrize("after", (None, (datetime(2020, 10, 11), uuid4())))
+def test_get_pending_requests_uses_partial_index(seeded_db_session, get_query, after):
+    user_id = get_any_user_id(seeded_db_session)
+
+    plan = get_query_plan(
+        seeded_db_session,
+        get_query(FriendshipRequestRepository(), user_id, after=after).limit(21),
+    )
+
+    assert "Seq Scan on friendship_request" not in plan
+    assert "Sort" not in plan
+    assert "ix_friendship_request_pending_" in plan
+
+
+@pytest.mark.parametrize(
+    "get_query",
+    (
+        FriendshipRequestRepository.count_pending_requests_received_by_user_query,
+        FriendshipRequestRepository.count_pending_requests_sent_by_user_query,
+    ),
+)
+def test_count_pending_requests_uses_partial_index(seeded_db_session, get_query):
+    user_id = get_any_user_id(seeded_db_session)
+
+    plan = get_query_plan(
+        seeded_db_session, get_query(FriendshipRequestRepository(), user_id)
+    )
+
+    assert "Seq Scan on friendship_request" not in plan
+    assert "ix_friendship_request_pending_" in plan
@@ -0,0 +1,34 @@
+from uuid import uuid4
+
+from app.database import record_queries
+from app.domain.repositories.training_repository import TrainingRepository
+
+
+async def test_record_queries_records_executed_statements(user):
+    async with TrainingRepository() as repository:
+        await repository.get_training_by_id(
+            request_user_id=user.id, training_id=uuid4()
+        )
+        with record_queries() as recorder:
+            for _ in range(3):
+                await repository.get_training_by_id(
+                    request_user_id=user.id, training_id=uuid4()
+                )
+            await repository.get_user_trainings(
+                request_user_id=user.id, user_id=user.id
+            )
+        await repository.get_training_by_id(
+            request_user_id=user.id, training_id=uuid4()
+        )
+
+    assert recorder.count == 4
+    assert all(duration > 0 for _, duration in recorder.statements)
+    assert recorder.total_duration == sum(
+        duration for _, duration in recorder.statements
+    )
+    [(repeated_statement, count)] = recorder.get_repeated_statements(
+        min_count=2
+    ).items()
+    assert repeated_statement == recorder.statements[0][0]
+    assert count == 3
+    assert recorder.get_repeated_statements(min_count=4) == {}
@@ -1,12 +1,21 @@
 from datetime import datetime, timedelta
 from uuid import uuid4
 
+import asyncio
+
+from sqlalchemy import delete, insert, select, update
+
+from app import models
 from app.database import engine
 from app.domain import entities
 from app.domain.repositories.reaction_repository import ReactionRepository
+from app.domain.services.exceptions import TrainingDoesNotExist
+from app.domain.services.reaction_write_buffer import ReactionWriteBuffer
+from app.enums import ReactionTypeEnum
 from tests.test_domain.test_repositories.factories import (
     TrainingFactory,
     ReactionFactory,
+    UserFactory,
 )
 from tests.test_domain.test_repositories.sqlalchemy_helpers import QueryCounter
 
@@ -71,3 +80,172 @@ async def test_get_reactions_by_training_ids(db_session):
                 [],
             ]
         assert query_counter.count == 1
+
+
+def get_reaction_counts(db_session, training):
+    db_session.refresh(training)
+    return training.likes_count, training.dislikes_count
+
+
+def test_reaction_counts_follow_inserts_updates_and_deletes(db_session):
+    training_1 = TrainingFactory()
+    training_2 = TrainingFactory()
+    ReactionFactory.create_batch(3, training=training_1)
+    dislike = ReactionFactory(
+        training=training_1, reaction_type=ReactionTypeEnum.dislike
+    )
+    db_session.execute(
+        insert(models.Reaction),
+        [
+            {
+                "id": uuid4(),
+                "user_id": training_2.user_id,
+                "training_id": training.id,
+                "reaction_type": ReactionTypeEnum.like,
+                "created_at": datetime.utcnow(),
+            }
+            for training in (training_1, training_2)
+        ],
+    )
+    db_session.commit()
+
+    assert get_reaction_counts(db_session, training_1) == (4, 1)
+    assert get_reaction_counts(db_session, training_2) == (1, 0)
+
+    db_session.execute(
+        update(models.Reaction)
+        .where(models.Reaction.id == dislike.id)
+        .values(reaction_type=ReactionTypeEnum.like, training_id=training_2.id)
+    )
+    db_session.commit()
+
+    assert get_reaction_counts(db_session, training_1) == (4, 0)
+    assert get_reaction_counts(db_session, training_2) == (2, 0)
+
+    db_session.execute(
+        delete(models.Reaction).where(models.Reaction.training_id == training_1.id)
+    )
+    db_session.commit()
+
+    assert get_reaction_counts(db_session, training_1) == (0, 0)
+    assert get_reaction_counts(db_session, training_2) == (2, 0)
+
+
+async def test_reconcile_reaction_counts(db_session):
+    trainings = sorted(TrainingFactory.create_batch(3), key=lambda t: t.id)
+    ReactionFactory.create_batch(2, training=trainings[0])
+    ReactionFactory(training=trainings[2], reaction_type=ReactionTypeEnum.dislike)
+    db_session.execute(
+        update(models.Training)
+        .where(models.Training.id.in_([trainings[0].id, trainings[1].id]))
+        .values(likes_count=7, dislikes_count=1)
+    )
+    db_session.commit()
+
+    async with ReactionRepository() as repository:
+        assert await repository.reconcile_reaction_counts(after=None, limit=2) == (
+            trainings[1].id,
+            2,
+        )
+    async with ReactionRepository() as repository:
+        assert await repository.reconcile_reaction_counts(
+            after=trainings[1].id, limit=2
+        ) == (trainings[2].id, 0)
+    async with ReactionRepository() as repository:
+        assert await repository.reconcile_reaction_counts(
+            after=trainings[2].id, limit=2
+        ) == (None, 0)
+
+    assert get_reaction_counts(db_session, trainings[0]) == (2, 0)
+    assert get_reaction_counts(db_session, trainings[1]) == (0, 0)
+    assert get_reaction_counts(db_session, trainings[2]) == (0, 1)
+
+
+def get_reactions(db_session, training):
+    db_session.expire_all()
+    return {
+        (reaction.user_id, reaction.reaction_type)
+        for reaction in db_session.execute(
+            select(models.Reaction).where(models.Reaction.training_id == training.id)
+        ).scalars()
+    }
+
+
+async def test_upsert_and_delete_reactions(db_session):
+    training = TrainingFactory()
+    kept_reaction = ReactionFactory(training=training)
+    changed_reaction = ReactionFactory(training=training)
+    deleted_reaction = ReactionFactory(training=training)
+    new_user = UserFactory()
+    created_at = datetime.fromisoformat("2020-10-11T10:00:00")
+
+    async with ReactionRepository() as repository:
+        with QueryCounter(engine.sync_engine) as query_counter:
+            await repository.upsert_reactions(
+                [
+                    (
+                        kept_reaction.user_id,
+                        training.id,
+                        ReactionTypeEnum.like,
+                        created_at,
+                    ),
+                    (
+                        changed_reaction.user_id,
+                        training.id,
+                        ReactionTypeEnum.dislike,
+                        created_at,
+                    ),
+                    (new_user.id, training.id, ReactionTypeEnum.dislike, created_at),
+                ]
+            )
+            await repository.delete_reactions(
+                [(deleted_reaction.user_id, training.id), (new_user.id, uuid4())]
+            )
+        assert query_counter.count == 2
+
+    assert get_reactions(db_session, training) == {
+        (kept_reaction.user_id, ReactionTypeEnum.like),
+        (changed_reaction.user_id, ReactionTypeEnum.dislike),
+        (new_user.id, ReactionTypeEnum.dislike),
+    }
+    db_session.refresh(kept_reaction)
+    assert kept_reaction.created_at == ReactionFactory.created_at
+    assert get_reaction_counts(db_session, training) == (1, 2)
+
+
+async def test_reaction_write_buffer_applies_last_write_per_user(db_session):
+    training = TrainingFactory()
+    users = UserFactory.create_batch(20)
+    buffer = ReactionWriteBuffer(flush_interval_in_seconds=0.01, max_batch_size=8)
+
+    await asyncio.gather(
+        *(buffer.react(user.id, training.id, ReactionTypeEnum.like) for user in users),
+        *(
+            buffer.react(user.id, training.id, ReactionTypeEnum.dislike)
+            for user in users[:5]
+        ),
+        *(buffer.unreact(user.id, training.id) for user in users[5:10]),
+    )
+    await buffer.close()
+
+    assert get_reactions(db_session, training) == {
+        *((user.id, ReactionTypeEnum.dislike) for user in users[:5]),
+        *((user.id, ReactionTypeEnum.like) for user in users[10:]),
+    }
+    assert get_reaction_counts(db_session, training) == (10, 5)
+
+
+async def test_reaction_write_buffer_write_for_missing_training(db_session):
+    training = TrainingFactory()
+    user_1, user_2 = UserFactory.create_batch(2)
+    buffer = ReactionWriteBuffer(flush_interval_in_seconds=0.01, max_batch_size=8)
+
+    results = await asyncio.gather(
+        buffer.react(user_1.id, training.id, ReactionTypeEnum.like),
+        buffer.react(user_2.id, uuid4(), ReactionTypeEnum.like),
+        return_exceptions=True,
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], TrainingDoesNotExist)
+    assert get_reactions(db_session, training) == {(user_1.id, ReactionTypeEnum.like)}
@@ -0,0 +1,185 @@
+from datetime import datetime
+
+from app.database import engine
+from app.domain import entities
+from app.domain.repositories.timeline_repository import TimelineRepository
+from app.enums import TrainingVisibilityEnum
+from tests.test_domain.test_repositories.factories import (
+    FriendshipFactory,
+    TrainingFactory,
+    UserFactory,
+)
+from tests.test_domain.test_repositories.sqlalchemy_helpers import QueryCounter
+
+
+async def test_add_training_to_timelines(user, training):
+    friends = [UserFactory() for _ in range(2)]
+    stranger = UserFactory()
+
+    async with TimelineRepository() as repository:
+        with QueryCounter(engine.sync_engine) as query_counter:
+            assert await repository.add_training_to_timelines(
+                training_id=training.id, viewers_ids=[friends[0].id]
+            ) == {friends[0].id}
+        assert query_counter.count == 1
+        # A retried chunk only gets back the viewers it did not serve yet.
+        assert await repository.add_training_to_timelines(
+            training_id=training.id, viewers_ids=[friend.id for friend in friends]
+        ) == {friends[1].id}
+
+    async with TimelineRepository() as repository:
+        for friend in friends:
+            assert await repository.get_timeline_page(
+                viewer_id=friend.id, limit=10
+            ) == [entities.Training.from_model(training)]
+        assert await repository.get_timeline_page(viewer_id=stranger.id, limit=10) == []
+
+
+async def test_get_timeline_page(user):
+    friends = [UserFactory() for _ in range(2)]
+    for friend in friends:
+        FriendshipFactory(user_1=user, user_2=friend)
+    trainings = [
+        TrainingFactory(user=friend, start_time=datetime(2020, 10, day, 10))
+        for day, friend in zip((12, 10, 11), friends + friends[:1])
+    ]
+    async with TimelineRepository() as repository:
+        for training in trainings:
+            await repository.add_training_to_timelines(
+                training_id=training.id, viewers_ids=[user.id]
+            )
+    newest_first = [
+        entities.Training.from_model(training)
+        for training in sorted(trainings, key=lambda t: t.start_time, reverse=True)
+    ]
+
+    async with TimelineRepository() as repository:
+        with QueryCounter(engine.sync_engine) as query_counter:
+            first_page = await repository.get_timeline_page(viewer_id=user.id, limit=2)
+        assert query_counter.count == 1
+        second_page = await repository.get_timeline_page(
+            viewer_id=user.id,
+            limit=2,
+            after=(first_page[-1].start_time, first_page[-1].id),
+        )
+
+    assert first_page + second_page == newest_first
+
+
+async def test_add_friends_trainings_to_timelines(db_session):
+    user_1, user_2, user_3 = UserFactory(), UserFactory(), UserFactory()
+    FriendshipFactory(user_1=user_1, user_2=user_2)
+    FriendshipFactory(user_1=user_3, user_2=user_1)
+    training_1 = TrainingFactory(user=user_1)
+    training_2 = TrainingFactory(user=user_2)
+
+    async with TimelineRepository() as repository:
+        assert (
+            await repository.add_friends_trainings_to_timelines(
+                user_1_id=user_1.id, user_2_id=user_2.id
+            )
+            == 2
+        )
+        assert await repository.get_timeline_page(viewer_id=user_1.id, limit=10) == [
+            entities.Training.from_model(training_2)
+        ]
+        assert await repository.get_timeline_page(viewer_id=user_2.id, limit=10) == [
+            entities.Training.from_model(training_1)
+        ]
+        # Only the new friendship is backfilled.
+        assert await repository.get_timeline_page(viewer_id=user_3.id, limit=10) == []
+
+
+async def test_backfill_timelines(db_session):
+    users = [UserFactory() for _ in range(3)]
+    for user in users:
+        for friend in users:
+            if friend.id > user.id:
+                FriendshipFactory(user_1=user, user_2=friend)
+        TrainingFactory(user=user)
+        TrainingFactory(user=user, visibility=TrainingVisibilityEnum.private)
+
+    results = []
+    last_user_id = None
+    async with TimelineRepository() as repository:
+        while True:
+            last_user_id, written_count = await repository.backfill_timelines(
+                after=last_user_id, limit=2
+            )
+            results.append((last_user_id, written_count))
+            if last_user_id is None:
+                break
+        user_ids = sorted(user.id for user in users)
+        assert results == [(user_ids[1], 4), (user_ids[2], 2), (None, 0)]
+        for user in users:
+            assert (
+                len(await repository.get_timeline_page(viewer_id=user.id, limit=10))
+                == 2
+            )
+        assert await repository.backfill_timelines(after=None, limit=10) == (
+            user_ids[2],
+            0,
+        )
+
+
+async def test_get_timeline_page_merges_high_fan_out_friends_trainings(user):
+    friend, high_fan_out_friend, high_fan_out_stranger = (
+        UserFactory(),
+        UserFactory(),
+        UserFactory(),
+    )
+    FriendshipFactory(user_1=user, user_2=friend)
+    FriendshipFactory(user_1=user, user_2=high_fan_out_friend)
+    # Fanned out before its author became a high fan-out one.
+    fanned_out_training = TrainingFactory(
+        user=high_fan_out_friend, start_time=datetime(2020, 10, 9, 10)
+    )
+    friend_training = TrainingFactory(user=friend, start_time=datetime(2020, 10, 11))
+    async with TimelineRepository() as repository:
+        for training in (fanned_out_training, friend_training):
+            await repository.add_training_to_timelines(
+                training_id=training.id, viewers_ids=[user.id]
+            )
+        await repository.mark_high_fan_out_author(user_id=high_fan_out_friend.id)
+        await repository.mark_high_fan_out_author(user_id=high_fan_out_friend.id)
+        await repository.mark_high_fan_out_author(user_id=high_fan_out_stranger.id)
+    high_fan_out_trainings = [
+        TrainingFactory(user=high_fan_out_friend, start_time=datetime(2020, 10, day))
+        for day in (10, 12)
+    ]
+    TrainingFactory(
+        user=high_fan_out_friend,
+        start_time=datetime(2020, 10, 13),
+        visibility=TrainingVisibilityEnum.private,
+    )
+    TrainingFactory(user=high_fan_out_stranger, start_time=datetime(2020, 10, 14))
+
+    async with TimelineRepository() as repository:
+        assert await repository.get_high_fan_out_friends_ids(user.id) == {
+            high_fan_out_friend.id
+        }
+        # Not written to the timelines once the author is a high fan-out one.
+        assert (
+            await repository.add_friends_trainings_to_timelines(
+                user_1_id=user.id, user_2_id=high_fan_out_friend.id
+            )
+            == 0
+        )
+        with QueryCounter(engine.sync_engine) as query_counter:
+            first_page = await repository.get_timeline_page(viewer_id=user.id, limit=2)
+        assert query_counter.count == 1
+        second_page = await repository.get_timeline_page(
+            viewer_id=user.id,
+            limit=3,
+            after=(first_page[-1].start_time, first_page[-1].id),
+        )
+
+    assert first_page + second_page == [
+        entities.Training.from_model(training)
+        for training in (
+            high_fan_out_trainings[1],
+            friend_training,
+            high_fan_out_trainings[0],
+            fanned_out_training,
+        )
+    ]
@@ -49,6 +49,47 @@ async def test_get_training_by_id_existing_returns_training(user, training):
         assert query_counter.count == 1
 
 
+@pytest.mark.parametrize(
+    "training_visibility,profile_training_visibility,expected_visibility",
+    (
+        (
+            None,
+            TrainingVisibilityEnum.only_friends,
+            TrainingVisibilityEnum.only_friends,
+        ),
+        (
+            TrainingVisibilityEnum.private,
+            TrainingVisibilityEnum.public,
+            TrainingVisibilityEnum.private,
+        ),
+    ),
+)
+async def test_get_training_with_visibility(
+    db_session, training_visibility, profile_training_visibility, expected_visibility
+):
+    training = TrainingFactory(
+        visibility=training_visibility,
+        user__profile__training_visibility=profile_training_visibility,
+    )
+    async with TrainingRepository() as repository:
+        with QueryCounter(engine.sync_engine) as query_counter:
+            assert await repository.get_training_with_visibility(
+                training_id=training.id
+            ) == entities.TrainingWithVisibility(
+                id=training.id,
+                start_time=training.start_time,
+                end_time=training.end_time,
+                name=training.name,
+                user_id=training.user_id,
+                visibility=expected_visibility,
+            )
+            assert (
+                await repository.get_training_with_visibility(training_id=uuid4())
+                is None
+            )
+        assert query_counter.count == 2
+
+
 @pytest.mark.parametrize(
     "training_visibility,profile_training_visibility,expected_count",
     (
@@ -243,3 +284,40 @@ async def test_get_training_by_id_existing(training):
                 user_id=training.user_id,
             )
         assert query_counter.count == 1
+
+
+async def test_get_user_trainings_page_seeks_past_cursor(user):
+    TrainingFactory()
+    same_start_time = datetime.fromisoformat("2020-10-10T10:00:00")
+    trainings = [
+        TrainingFactory(user=user, start_time=same_start_time),
+        TrainingFactory(user=user, start_time=same_start_time),
+        TrainingFactory(
+            user=user, start_time=datetime.fromisoformat("2020-10-11T10:00:00")
+        ),
+        TrainingFactory(
+            user=user, start_time=datetime.fromisoformat("2020-10-09T10:00:00")
+        ),
+    ]
+    ordered_trainings = sorted(
+        trainings, key=lambda training: (training.start_time, training.id), reverse=True
+    )
+
+    pages = []
+    after = None
+    async with TrainingRepository() as repository:
+        for _ in range(3):
+            with QueryCounter(engine.sync_engine) as query_counter:
+                page = await repository.get_user_trainings_page(
+                    request_user_id=user.id, user_id=user.id, limit=2, after=after
+                )
+            assert query_counter.count == 1
+            pages.append([training.id for training in page])
+            if page:
+                after = (page[-1].start_time, page[-1].id)
+
+    assert pages == [
+        [training.id for training in ordered_trainings[:2]],
+        [training.id for training in ordered_trainings[2:]],
+        [],
+    ]
@@ -0,0 +1,85 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+from app.domain.services.friend_suggestion_service import FriendSuggestionService
+from app.friendship_graph import FriendshipGraph
+
+
+@patch("app.domain.services.friend_suggestion_service.FRIEND_SUGGESTIONS_BATCH_SIZE", 2)
+@patch(
+    "app.domain.services.friend_suggestion_service.FriendSuggestionRepository",
+    autospec=True,
+)
+@patch(
+    "app.domain.services.friend_suggestion_service.load_friendship_graph",
+    autospec=True,
+)
+async def test_compute_friend_suggestions_stores_every_batch(
+    mocked_load_friendship_graph, mocked_friend_suggestion_repository
+):
+    user_1_id, user_2_id, user_3_id = uuid4(), uuid4(), uuid4()
+    graph = FriendshipGraph()
+    graph.extend([(user_1_id, user_2_id), (user_2_id, user_3_id)])
+    graph.sort()
+    mocked_load_friendship_graph.return_value = graph
+    mocked_friend_suggestion_repository_instance = (
+        mocked_friend_suggestion_repository.return_value.__aenter__.return_value
+    )
+
+    assert await FriendSuggestionService.compute_friend_suggestions() == 3
+
+    stored = [
+        call.args[0]
+        for call in (
+            mocked_friend_suggestion_repository_instance.replace_friend_suggestions.await_args_list  # noqa
+        )
+    ]
+    assert stored == [
+        {user_1_id: [(user_3_id, 1)], user_2_id: []},
+        {user_3_id: [(user_1_id, 1)]},
+    ]
+
+
+@patch(
+    "app.domain.services.friend_suggestion_service.FriendSuggestionRepository",
+    autospec=True,
+)
+@patch(
+    "app.domain.services.friend_suggestion_service.FriendshipRepository",
+    autospec=True,
+)
+async def test_refresh_friend_suggestions(
+    mocked_friendship_repository, mocked_friend_suggestion_repository
+):
+    user_id, friend_id, friend_of_friend_id = uuid4(), uuid4(), uuid4()
+    mocked_friendship_repository.return_value.__aenter__.return_value.get_friendships_around_user.return_value = [  # noqa
+        (user_id, friend_id),
+        (friend_id, friend_of_friend_id),
+    ]
+
+    await FriendSuggestionService.refresh_friend_suggestions(user_id)
+
+    mocked_friend_suggestion_repository.return_value.__aenter__.return_value.replace_friend_suggestions.assert_awaited_once_with(  # noqa
+        {user_id: [(friend_of_friend_id, 1)]}
+    )
+
+
+@patch(
+    "app.domain.services.friend_suggestion_service.FriendSuggestionRepository",
+    autospec=True,
+)
+@patch(
+    "app.domain.services.friend_suggestion_service.FriendshipRepository",
+    autospec=True,
+)
+async def test_refresh_friend_suggestions_of_user_without_friends(
+    mocked_friendship_repository, mocked_friend_suggestion_repository
+):
+    mocked_friendship_repository_instance = (
+        mocked_friendship_repository.return_value.__aenter__.return_value
+    )
+    mocked_friendship_repository_instance.get_friendships_around_user.return_value = []
+
+    await FriendSuggestionService.refresh_friend_suggestions(uuid4())
+
+    mocked_friend_suggestion_repository.return_value.__aenter__.return_value.replace_friend_suggestions.assert_not_awaited()  # noqa
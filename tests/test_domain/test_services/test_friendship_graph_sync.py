@@ -0,0 +1,43 @@
+import asyncio
+from unittest.mock import call, patch
+from uuid import uuid4
+
+from app.domain.events import dump_new_friendship_event
+from app.domain.services.friendship_graph_sync import FriendshipGraphSync
+from app.friendship_graph import FriendshipGraph
+
+
+@patch("app.domain.services.friendship_graph_sync.FriendshipRepository", autospec=True)
+async def test_load_reads_every_page(mocked_friendship_repository):
+    friendships = [(uuid4(), uuid4()) for _ in range(3)]
+    mocked_friendship_repository_instance = (
+        mocked_friendship_repository.return_value.__aenter__.return_value
+    )
+    mocked_friendship_repository_instance.get_friendships_page.side_effect = [
+        friendships[:2],
+        friendships[2:],
+    ]
+    sync = FriendshipGraphSync(load_batch_size=2, reload_interval_in_seconds=60)
+
+    graph = await sync.load()
+
+    assert graph.friendships_count == 3
+    for user_1_id, user_2_id in friendships:
+        assert graph.are_friends(user_2_id, user_1_id)
+    mocked_friendship_repository_instance.get_friendships_page.assert_has_awaits(
+        [call(after=None, limit=2), call(after=friendships[1], limit=2)]
+    )
+
+
+async def test_apply_events_until_reload():
+    user_1_id, user_2_id = uuid4(), uuid4()
+    sync = FriendshipGraphSync(load_batch_size=2, reload_interval_in_seconds=0.05)
+    sync.graph = FriendshipGraph()
+    events = asyncio.Queue()
+    events.put_nowait({"version": 2})
+    events.put_nowait(dump_new_friendship_event(user_1_id, user_2_id))
+
+    await asyncio.wait_for(sync._apply_events(events), timeout=1)
+
+    assert sync.graph.are_friends(user_1_id, user_2_id)
+    assert events.empty()
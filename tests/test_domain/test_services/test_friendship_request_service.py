@@ -1,5 +1,5 @@
 from datetime import datetime
-from unittest.mock import patch, call, Mock
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -13,126 +13,51 @@ from app.domain.services.exceptions import (
     PendingFriendshipRequestDoesNotExist,
 )
 from app.domain.services.friendship_request_service import FriendshipRequestService
+from app.domain.services.friendship_service import friendship_cache
 from app.enums import FriendshipRequestStatusEnum
 
 
-@patch("app.domain.services.friendship_request_service.UserRepository", autospec=True)
-@patch(
-    "app.domain.services.friendship_request_service.FriendshipRepository", autospec=True
-)
 @patch(
     "app.domain.services.friendship_request_service.FriendshipRequestRepository",
     autospec=True,
 )
 class TestCreateFriendshipRequest:
-    async def test_raises_exception_when_receiver_does_not_exist(
-        self,
-        mocked_friendship_request_repository,
-        mocked_friendship_repository,
-        mocked_user_repository,
-    ):
-        mocked_user_repository_instance = (
-            mocked_user_repository.return_value.__aenter__.return_value
-        )
-        mocked_user_repository_instance.does_user_with_id_exist.return_value = False
-        receiver_id = uuid4()
-
-        with pytest.raises(ReceiverDoesNotExist):
-            await FriendshipRequestService.create_friendship_request(
-                sender_id=uuid4(), receiver_id=receiver_id
-            )
-
-        mocked_user_repository_instance.does_user_with_id_exist.assert_awaited_once_with(  # noqa
-            user_id=receiver_id
-        )
-
-    async def test_raises_exception_when_users_are_already_friends(
-        self,
-        mocked_friendship_request_repository,
-        mocked_friendship_repository,
-        mocked_user_repository,
-    ):
-        mocked_user_repository_instance = (
-            mocked_user_repository.return_value.__aenter__.return_value
-        )
-        mocked_friendship_repository_instance = (
-            mocked_friendship_repository.return_value.__aenter__.return_value
-        )
-        mocked_user_repository_instance.does_user_with_id_exist.return_value = True
-        mocked_friendship_repository_instance.are_users_friends.return_value = True
-        receiver_id = uuid4()
-        sender_id = uuid4()
-
-        with pytest.raises(UsersAreAlreadyFriends):
-            await FriendshipRequestService.create_friendship_request(
-                sender_id=sender_id, receiver_id=receiver_id
-            )
-
-        mocked_user_repository_instance.does_user_with_id_exist.assert_awaited_once_with(  # noqa
-            user_id=receiver_id
-        )
-        mocked_friendship_repository_instance.are_users_friends.assert_awaited_once_with(  # noqa
-            user_1_id=sender_id, user_2_id=receiver_id
-        )
-
-    async def test_raises_exception_when_pending_request_already_exist(
+    @pytest.mark.parametrize(
+        "does_receiver_exist, are_users_friends, exception",
+        (
+            (False, False, ReceiverDoesNotExist),
+            (True, True, UsersAreAlreadyFriends),
+            (True, False, FriendshipRequestAlreadyCreated),
+        ),
+    )
+    async def test_raises_exception_when_request_not_created(
         self,
         mocked_friendship_request_repository,
-        mocked_friendship_repository,
-        mocked_user_repository,
+        does_receiver_exist,
+        are_users_friends,
+        exception,
     ):
-        mocked_user_repository_instance = (
-            mocked_user_repository.return_value.__aenter__.return_value
-        )
-        mocked_friendship_repository_instance = (
-            mocked_friendship_repository.return_value.__aenter__.return_value
-        )
         mocked_friendship_request_repository_instance = (
             mocked_friendship_request_repository.return_value.__aenter__.return_value
         )
-        mocked_user_repository_instance.does_user_with_id_exist.return_value = True
-        mocked_friendship_repository_instance.are_users_friends.return_value = False
-        mocked_friendship_request_repository_instance.does_pending_request_exist.return_value = (  # noqa
-            True
+        mocked_friendship_request_repository_instance.create_pending_request.return_value = (  # noqa
+            None,
+            does_receiver_exist,
+            are_users_friends,
         )
-        receiver_id = uuid4()
         sender_id = uuid4()
+        receiver_id = uuid4()
 
-        with pytest.raises(FriendshipRequestAlreadyCreated):
+        with pytest.raises(exception):
             await FriendshipRequestService.create_friendship_request(
                 sender_id=sender_id, receiver_id=receiver_id
             )
 
-        mocked_user_repository_instance.does_user_with_id_exist.assert_awaited_once_with(  # noqa
-            user_id=receiver_id
-        )
-        mocked_friendship_repository_instance.are_users_friends.assert_awaited_once_with(  # noqa
-            user_1_id=sender_id, user_2_id=receiver_id
-        )
-        mocked_friendship_request_repository_instance.does_pending_request_exist.assert_awaited_once_with(  # noqa
-            user_1_id=sender_id, user_2_id=receiver_id
+        mocked_friendship_request_repository_instance.create_pending_request.assert_awaited_once_with(  # noqa
+            sender_id=sender_id, receiver_id=receiver_id
         )
 
-    async def test_successful(
-        self,
-        mocked_friendship_request_repository,
-        mocked_friendship_repository,
-        mocked_user_repository,
-    ):
-        mocked_user_repository_instance = (
-            mocked_user_repository.return_value.__aenter__.return_value
-        )
-        mocked_friendship_repository_instance = (
-            mocked_friendship_repository.return_value.__aenter__.return_value
-        )
-        mocked_friendship_request_repository_instance = (
-            mocked_friendship_request_repository.return_value.__aenter__.return_value
-        )
-        mocked_user_repository_instance.does_user_with_id_exist.return_value = True
-        mocked_friendship_repository_instance.are_users_friends.return_value = False
-        mocked_friendship_request_repository_instance.does_pending_request_exist.return_value = (  # noqa
-            False
-        )
+    async def test_successful(self, mocked_friendship_request_repository):
         friendship_request = FriendshipRequest(
             id=uuid4(),
             sender_id=uuid4(),
@@ -140,30 +65,25 @@ class TestCreateFriendshipRequest:
             status=FriendshipRequestStatusEnum.pending,
             timestamp=datetime.utcnow(),
         )
+        mocked_friendship_request_repository_instance = (
+            mocked_friendship_request_repository.return_value.__aenter__.return_value
+        )
         mocked_friendship_request_repository_instance.create_pending_request.return_value = (  # noqa
-            friendship_request
+            friendship_request,
+            True,
+            False,
         )
-        receiver_id = uuid4()
-        sender_id = uuid4()
 
         assert (
             await FriendshipRequestService.create_friendship_request(
-                sender_id=sender_id, receiver_id=receiver_id
+                sender_id=friendship_request.sender_id,
+                receiver_id=friendship_request.receiver_id,
             )
             == friendship_request
         )
-
-        mocked_user_repository_instance.does_user_with_id_exist.assert_awaited_once_with(  # noqa
-            user_id=receiver_id
-        )
-        mocked_friendship_repository_instance.are_users_friends.assert_awaited_once_with(  # noqa
-            user_1_id=sender_id, user_2_id=receiver_id
-        )
-        mocked_friendship_request_repository_instance.does_pending_request_exist.assert_awaited_once_with(  # noqa
-            user_1_id=sender_id, user_2_id=receiver_id
-        )
         mocked_friendship_request_repository_instance.create_pending_request.assert_awaited_once_with(  # noqa
-            sender_id=sender_id, receiver_id=receiver_id
+            sender_id=friendship_request.sender_id,
+            receiver_id=friendship_request.receiver_id,
         )
 
 
@@ -247,437 +167,249 @@ async def test_get_pending_requests_received_by_user(
     )
 
 
+@patch("app.domain.services.friendship_request_service.UnitOfWork", autospec=True)
 @patch(
     "app.domain.services.friendship_request_service.FriendshipRequestRepository",
     autospec=True,
 )
-class TestGetPendingRequest:
-    @pytest.mark.parametrize(
-        "friendship_request",
-        (
-            None,
-            FriendshipRequest(
-                id=uuid4(),
-                sender_id=uuid4(),
-                receiver_id=uuid4(),
-                status=enums.FriendshipRequestStatusEnum.accepted,
-                timestamp=helpers.get_utc_now(),
-            ),
-            FriendshipRequest(
-                id=uuid4(),
-                sender_id=uuid4(),
-                receiver_id=uuid4(),
-                status=enums.FriendshipRequestStatusEnum.rejected,
-                timestamp=helpers.get_utc_now(),
-            ),
-            FriendshipRequest(
-                id=uuid4(),
-                sender_id=uuid4(),
-                receiver_id=uuid4(),
-                status=enums.FriendshipRequestStatusEnum.cancelled,
-                timestamp=helpers.get_utc_now(),
-            ),
-        ),
-    )
-    async def test_raises_exception_when_request_not_found(
-        self, mocked_friendship_request_repository, friendship_request
-    ):
-        mocked_friendship_request_repository_instance = (
-            mocked_friendship_request_repository.return_value.__aenter__.return_value
-        )
-        mocked_friendship_request_repository_instance.get_request_by_id.return_value = (
-            friendship_request
-        )
-        friendship_request_id = uuid4()
-
-        with pytest.raises(PendingFriendshipRequestDoesNotExist):
-            await FriendshipRequestService._get_pending_request(
-                friendship_request_repository=mocked_friendship_request_repository_instance,  # noqa
-                friendship_request_id=friendship_request_id,
-            )
-        mocked_friendship_request_repository_instance.get_request_by_id.assert_awaited_once_with(  # noqa
-            friendship_request_id=friendship_request_id
-        )
-
-    async def test_successful(self, mocked_friendship_request_repository):
-        friendship_request = FriendshipRequest(
-            id=uuid4(),
-            sender_id=uuid4(),
-            receiver_id=uuid4(),
-            status=enums.FriendshipRequestStatusEnum.pending,
-            timestamp=helpers.get_utc_now(),
-        )
-        mocked_friendship_request_repository_instance = (
-            mocked_friendship_request_repository.return_value.__aenter__.return_value
-        )
-        mocked_friendship_request_repository_instance.get_request_by_id.return_value = (
-            friendship_request
-        )
-
-        assert (
-            await FriendshipRequestService._get_pending_request(
-                friendship_request_repository=mocked_friendship_request_repository_instance,  # noqa
-                friendship_request_id=friendship_request.id,
-            )
-            == friendship_request
-        )
-        mocked_friendship_request_repository_instance.get_request_by_id.assert_awaited_once_with(  # noqa
-            friendship_request_id=friendship_request.id
-        )
-
-
-@patch(
-    "app.domain.services.friendship_request_service.FriendshipRequestService."
-    "_get_pending_request",
-    autospec=True,
-)
-class TestGetPendingRequestSentByUser:
-    sender_id = uuid4()
-    mocked_friendship_request_repository = Mock()
-    friendship_request_id = uuid4()
-
-    @pytest.mark.parametrize(
-        "get_pending_request_side_effect",
-        (
-            PendingFriendshipRequestDoesNotExist,
-            FriendshipRequest(
-                id=uuid4(),
-                sender_id=uuid4(),
-                receiver_id=uuid4(),
-                status=enums.FriendshipRequestStatusEnum.pending,
-                timestamp=helpers.get_utc_now(),
-            ),
-        ),
-    )
-    async def test_raises_exception_when_request_not_found(
-        self, mocked_get_pending_request, get_pending_request_side_effect
-    ):
-        mocked_get_pending_request.side_effect = [get_pending_request_side_effect]
-
-        with pytest.raises(PendingFriendshipRequestDoesNotExist):
-            await FriendshipRequestService._get_pending_request_sent_by_user(
-                friendship_request_repository=self.mocked_friendship_request_repository,
-                friendship_request_id=self.friendship_request_id,
-                user_id=self.sender_id,
-            )
-        mocked_get_pending_request.assert_awaited_once_with(
-            friendship_request_repository=self.mocked_friendship_request_repository,
-            friendship_request_id=self.friendship_request_id,
-        )
-
-    async def test_successful(self, mocked_get_pending_request):
-        friendship_request = FriendshipRequest(
-            id=uuid4(),
-            sender_id=self.sender_id,
-            receiver_id=uuid4(),
-            status=enums.FriendshipRequestStatusEnum.pending,
-            timestamp=helpers.get_utc_now(),
-        )
-        mocked_get_pending_request.return_value = friendship_request
-
-        assert (
-            await FriendshipRequestService._get_pending_request_sent_by_user(
-                friendship_request_repository=self.mocked_friendship_request_repository,
-                friendship_request_id=self.friendship_request_id,
-                user_id=self.sender_id,
-            )
-            == friendship_request
-        )
-        mocked_get_pending_request.assert_awaited_once_with(
-            friendship_request_repository=self.mocked_friendship_request_repository,
-            friendship_request_id=self.friendship_request_id,
-        )
-
-
-@patch(
-    "app.domain.services.friendship_request_service.FriendshipRequestService."
-    "_get_pending_request",
-    autospec=True,
-)
-class TestGetPendingRequestReceivedByUser:
-    receiver_id = uuid4()
-    mocked_friendship_request_repository = Mock()
-    friendship_request_id = uuid4()
-
-    @pytest.mark.parametrize(
-        "get_pending_request_side_effect",
-        (
-            PendingFriendshipRequestDoesNotExist,
-            FriendshipRequest(
-                id=uuid4(),
-                sender_id=uuid4(),
-                receiver_id=uuid4(),
-                status=enums.FriendshipRequestStatusEnum.pending,
-                timestamp=helpers.get_utc_now(),
-            ),
-        ),
-    )
-    async def test_raises_exception_when_request_not_found(
-        self, mocked_get_pending_request, get_pending_request_side_effect
-    ):
-        mocked_get_pending_request.side_effect = [get_pending_request_side_effect]
-
-        with pytest.raises(PendingFriendshipRequestDoesNotExist):
-            await FriendshipRequestService._get_pending_request_sent_by_user(
-                friendship_request_repository=self.mocked_friendship_request_repository,
-                friendship_request_id=self.friendship_request_id,
-                user_id=self.receiver_id,
-            )
-        mocked_get_pending_request.assert_awaited_once_with(
-            friendship_request_repository=self.mocked_friendship_request_repository,
-            friendship_request_id=self.friendship_request_id,
-        )
-
-    async def test_successful(self, mocked_get_pending_request):
-        friendship_request = FriendshipRequest(
-            id=uuid4(),
-            sender_id=uuid4(),
-            receiver_id=self.receiver_id,
-            status=enums.FriendshipRequestStatusEnum.pending,
-            timestamp=helpers.get_utc_now(),
-        )
-        mocked_get_pending_request.return_value = friendship_request
-
-        assert (
-            await FriendshipRequestService._get_pending_request_received_by_user(
-                friendship_request_repository=self.mocked_friendship_request_repository,
-                friendship_request_id=self.friendship_request_id,
-                user_id=self.receiver_id,
-            )
-            == friendship_request
-        )
-        mocked_get_pending_request.assert_awaited_once_with(
-            friendship_request_repository=self.mocked_friendship_request_repository,
-            friendship_request_id=self.friendship_request_id,
-        )
-
-
-@patch(
-    "app.domain.services.friendship_request_service.FriendshipRequestRepository",
-    autospec=True,
-)
-@patch(
-    "app.domain.services.friendship_request_service.FriendshipRepository", autospec=True
-)
-@patch.object(
-    FriendshipRequestService,
-    "_get_pending_request_received_by_user",
-    autospec=True,
-)
+@patch("app.domain.services.friendship_request_service.OutboxRepository", autospec=True)
 class TestAcceptFriendshipRequest:
     async def test_successful(
         self,
-        mocked_get_pending_request_received_by_user,
-        mocked_friendship_repository,
+        mocked_outbox_repository,
         mocked_friendship_request_repository,
+        mocked_unit_of_work,
     ):
-        friendship_request = FriendshipRequest(
-            id=uuid4(),
-            sender_id=uuid4(),
-            receiver_id=uuid4(),
-            status=enums.FriendshipRequestStatusEnum.pending,
-            timestamp=helpers.get_utc_now(),
-        )
+        sender_id = uuid4()
+        receiver_id = uuid4()
+        friendship_request_id = uuid4()
         mocked_friendship_request_repository_instance = (
             mocked_friendship_request_repository.return_value.__aenter__.return_value
         )
-        mocked_get_pending_request_received_by_user.return_value = friendship_request
-        mocked_friendship_repository_instance = (
-            mocked_friendship_repository.return_value.__aenter__.return_value
+        mocked_friendship_request_repository_instance.accept_pending_request.return_value = (  # noqa
+            sender_id
         )
+        friendship_cache.set((receiver_id, sender_id), False)
 
         await FriendshipRequestService.accept_friendship_request(
-            user_id=friendship_request.receiver_id,
-            friendship_request_id=friendship_request.id,
+            user_id=receiver_id, friendship_request_id=friendship_request_id
         )
 
-        mocked_get_pending_request_received_by_user.assert_awaited_once_with(
-            friendship_request_repository=mocked_friendship_request_repository_instance,
-            friendship_request_id=friendship_request.id,
-            user_id=friendship_request.receiver_id,
+        mocked_friendship_request_repository_instance.accept_pending_request.assert_awaited_once_with(  # noqa
+            friendship_request_id=friendship_request_id, receiver_id=receiver_id
         )
-        mocked_friendship_request_repository_instance.update_status.assert_awaited_once_with(  # noqa
-            friendship_request_id=friendship_request.id,
-            status=enums.FriendshipRequestStatusEnum.accepted,
+        mocked_unit_of_work_instance = (
+            mocked_unit_of_work.return_value.__aenter__.return_value
         )
-        mocked_friendship_repository_instance.create_friendship.assert_has_awaits(
-            [
-                call(
-                    user_1_id=friendship_request.sender_id,
-                    user_2_id=friendship_request.receiver_id,
-                ),
-                call(
-                    user_1_id=friendship_request.receiver_id,
-                    user_2_id=friendship_request.sender_id,
-                ),
-            ]
+        mocked_friendship_request_repository.assert_called_once_with(
+            mocked_unit_of_work_instance
         )
+        mocked_outbox_repository.assert_called_once_with(mocked_unit_of_work_instance)
+        mocked_outbox_repository.return_value.__aenter__.return_value.add_message.assert_awaited_once_with(  # noqa
+            task="app.tasks.handle_new_friendship",
+            kwargs={"user_1_id": str(sender_id), "user_2_id": str(receiver_id)},
+        )
+        assert friendship_cache.get((receiver_id, sender_id)) is None
 
     async def test_failure(
         self,
-        mocked_get_pending_request_received_by_user,
-        mocked_friendship_repository,
+        mocked_outbox_repository,
         mocked_friendship_request_repository,
+        mocked_unit_of_work,
     ):
         mocked_friendship_request_repository_instance = (
             mocked_friendship_request_repository.return_value.__aenter__.return_value
         )
-        mocked_get_pending_request_received_by_user.side_effect = (
-            PendingFriendshipRequestDoesNotExist
-        )
-        mocked_friendship_repository_instance = (
-            mocked_friendship_repository.return_value.__aenter__.return_value
+        mocked_friendship_request_repository_instance.accept_pending_request.return_value = (  # noqa
+            None
         )
-        user_id = uuid4()
-        friendship_request_id = uuid4()
 
         with pytest.raises(PendingFriendshipRequestDoesNotExist):
             await FriendshipRequestService.accept_friendship_request(
-                user_id=user_id, friendship_request_id=friendship_request_id
+                user_id=uuid4(), friendship_request_id=uuid4()
             )
 
-        mocked_get_pending_request_received_by_user.assert_awaited_once_with(
-            friendship_request_repository=mocked_friendship_request_repository_instance,
-            friendship_request_id=friendship_request_id,
-            user_id=user_id,
-        )
-        mocked_friendship_request_repository_instance.update_status.assert_not_awaited()
-        mocked_friendship_repository_instance.create_friendship.assert_not_awaited()
+        mocked_outbox_repository.return_value.__aenter__.return_value.add_message.assert_not_awaited()  # noqa
 
 
 @patch(
     "app.domain.services.friendship_request_service.FriendshipRequestRepository",
     autospec=True,
 )
-@patch.object(
-    FriendshipRequestService,
-    "_get_pending_request_received_by_user",
-    autospec=True,
-)
 class TestRejectFriendshipRequest:
-    async def test_successful(
-        self,
-        mocked_get_pending_request_received_by_user,
-        mocked_friendship_request_repository,
-    ):
-        friendship_request = FriendshipRequest(
-            id=uuid4(),
-            sender_id=uuid4(),
-            receiver_id=uuid4(),
-            status=enums.FriendshipRequestStatusEnum.pending,
-            timestamp=helpers.get_utc_now(),
-        )
+    async def test_successful(self, mocked_friendship_request_repository):
+        user_id = uuid4()
+        friendship_request_id = uuid4()
         mocked_friendship_request_repository_instance = (
             mocked_friendship_request_repository.return_value.__aenter__.return_value
         )
-        mocked_get_pending_request_received_by_user.return_value = friendship_request
+        mocked_friendship_request_repository_instance.reject_pending_request.return_value = (  # noqa
+            True
+        )
 
         await FriendshipRequestService.reject_friendship_request(
-            user_id=friendship_request.receiver_id,
-            friendship_request_id=friendship_request.id,
+            user_id=user_id, friendship_request_id=friendship_request_id
         )
 
-        mocked_get_pending_request_received_by_user.assert_awaited_once_with(
-            friendship_request_repository=mocked_friendship_request_repository_instance,
-            friendship_request_id=friendship_request.id,
-            user_id=friendship_request.receiver_id,
-        )
-        mocked_friendship_request_repository_instance.update_status.assert_awaited_once_with(  # noqa
-            friendship_request_id=friendship_request.id,
-            status=enums.FriendshipRequestStatusEnum.rejected,
+        mocked_friendship_request_repository_instance.reject_pending_request.assert_awaited_once_with(  # noqa
+            friendship_request_id=friendship_request_id, receiver_id=user_id
         )
 
-    async def test_failure(
-        self,
-        mocked_get_pending_request_received_by_user,
-        mocked_friendship_request_repository,
-    ):
+    async def test_failure(self, mocked_friendship_request_repository):
         mocked_friendship_request_repository_instance = (
             mocked_friendship_request_repository.return_value.__aenter__.return_value
         )
-        mocked_get_pending_request_received_by_user.side_effect = (
-            PendingFriendshipRequestDoesNotExist
+        mocked_friendship_request_repository_instance.reject_pending_request.return_value = (  # noqa
+            False
         )
-        user_id = uuid4()
-        friendship_request_id = uuid4()
 
         with pytest.raises(PendingFriendshipRequestDoesNotExist):
             await FriendshipRequestService.reject_friendship_request(
-                user_id=user_id, friendship_request_id=friendship_request_id
+                user_id=uuid4(), friendship_request_id=uuid4()
             )
 
-        mocked_get_pending_request_received_by_user.assert_awaited_once_with(
-            friendship_request_repository=mocked_friendship_request_repository_instance,
-            friendship_request_id=friendship_request_id,
-            user_id=user_id,
-        )
-        mocked_friendship_request_repository_instance.update_status.assert_not_awaited()
-
 
 @patch(
     "app.domain.services.friendship_request_service.FriendshipRequestRepository",
     autospec=True,
 )
-@patch.object(
-    FriendshipRequestService,
-    "_get_pending_request_sent_by_user",
-    autospec=True,
-)
 class TestCancelFriendshipRequest:
-    async def test_successful(
-        self,
-        mocked_get_pending_request_sent_by_user,
-        mocked_friendship_request_repository,
-    ):
-        friendship_request = FriendshipRequest(
-            id=uuid4(),
-            sender_id=uuid4(),
-            receiver_id=uuid4(),
-            status=enums.FriendshipRequestStatusEnum.pending,
-            timestamp=helpers.get_utc_now(),
-        )
+    async def test_successful(self, mocked_friendship_request_repository):
+        user_id = uuid4()
+        friendship_request_id = uuid4()
         mocked_friendship_request_repository_instance = (
             mocked_friendship_request_repository.return_value.__aenter__.return_value
         )
-        mocked_get_pending_request_sent_by_user.return_value = friendship_request
+        mocked_friendship_request_repository_instance.cancel_pending_request.return_value = (  # noqa
+            True
+        )
 
         await FriendshipRequestService.cancel_friendship_request(
-            user_id=friendship_request.receiver_id,
-            friendship_request_id=friendship_request.id,
+            user_id=user_id, friendship_request_id=friendship_request_id
         )
 
-        mocked_get_pending_request_sent_by_user.assert_awaited_once_with(
-            friendship_request_repository=mocked_friendship_request_repository_instance,
-            friendship_request_id=friendship_request.id,
-            user_id=friendship_request.receiver_id,
-        )
-        mocked_friendship_request_repository_instance.update_status.assert_awaited_once_with(  # noqa
-            friendship_request_id=friendship_request.id,
-            status=enums.FriendshipRequestStatusEnum.cancelled,
+        mocked_friendship_request_repository_instance.cancel_pending_request.assert_awaited_once_with(  # noqa
+            friendship_request_id=friendship_request_id, sender_id=user_id
         )
 
-    async def test_failure(
-        self,
-        mocked_get_pending_request_sent_by_user,
-        mocked_friendship_request_repository,
-    ):
+    async def test_failure(self, mocked_friendship_request_repository):
         mocked_friendship_request_repository_instance = (
             mocked_friendship_request_repository.return_value.__aenter__.return_value
         )
-        mocked_get_pending_request_sent_by_user.side_effect = (
-            PendingFriendshipRequestDoesNotExist
+        mocked_friendship_request_repository_instance.cancel_pending_request.return_value = (  # noqa
+            False
         )
-        user_id = uuid4()
-        friendship_request_id = uuid4()
 
         with pytest.raises(PendingFriendshipRequestDoesNotExist):
             await FriendshipRequestService.cancel_friendship_request(
-                user_id=user_id, friendship_request_id=friendship_request_id
+                user_id=uuid4(), friendship_request_id=uuid4()
             )
 
-        mocked_get_pending_request_sent_by_user.assert_awaited_once_with(
-            friendship_request_repository=mocked_friendship_request_repository_instance,
-            friendship_request_id=friendship_request_id,
-            user_id=user_id,
-        )
-        mocked_friendship_request_repository_instance.update_status.assert_not_awaited()
+
+@patch("app.domain.services.friendship_request_service.UnitOfWork", autospec=True)
+@patch(
+    "app.domain.services.friendship_request_service.FriendshipRequestRepository",
+    autospec=True,
+)
+@patch("app.domain.services.friendship_request_service.OutboxRepository", autospec=True)
+async def test_accept_friendship_requests(
+    mocked_outbox_repository, mocked_friendship_request_repository, mocked_unit_of_work
+):
+    receiver_id = uuid4()
+    senders_ids = {uuid4(): uuid4(), uuid4(): uuid4()}
+    friendship_request_ids = [*senders_ids, uuid4()]
+    mocked_friendship_request_repository_instance = (
+        mocked_friendship_request_repository.return_value.__aenter__.return_value
+    )
+    mocked_friendship_request_repository_instance.accept_pending_requests.return_value = (  # noqa
+        senders_ids
+    )
+    for sender_id in senders_ids.values():
+        friendship_cache.set((receiver_id, sender_id), False)
+
+    assert await FriendshipRequestService.accept_friendship_requests(
+        user_id=receiver_id, friendship_request_ids=friendship_request_ids
+    ) == set(senders_ids)
+
+    mocked_friendship_request_repository_instance.accept_pending_requests.assert_awaited_once_with(  # noqa
+        friendship_request_ids=friendship_request_ids, receiver_id=receiver_id
+    )
+    mocked_outbox_repository.return_value.__aenter__.return_value.add_messages.assert_awaited_once_with(  # noqa
+        task="app.tasks.handle_new_friendship",
+        kwargs_list=[
+            {"user_1_id": str(sender_id), "user_2_id": str(receiver_id)}
+            for sender_id in senders_ids.values()
+        ],
+    )
+    for sender_id in senders_ids.values():
+        assert friendship_cache.get((receiver_id, sender_id)) is None
+
+
+@pytest.mark.parametrize(
+    "service_method, repository_method, owner",
+    (
+        ("reject_friendship_requests", "reject_pending_requests", "receiver_id"),
+        ("cancel_friendship_requests", "cancel_pending_requests", "sender_id"),
+    ),
+)
+@patch(
+    "app.domain.services.friendship_request_service.FriendshipRequestRepository",
+    autospec=True,
+)
+async def test_reject_and_cancel_friendship_requests(
+    mocked_friendship_request_repository, service_method, repository_method, owner
+):
+    user_id = uuid4()
+    friendship_request_ids = [uuid4(), uuid4()]
+    mocked_repository_method = getattr(
+        mocked_friendship_request_repository.return_value.__aenter__.return_value,
+        repository_method,
+    )
+    mocked_repository_method.return_value = {friendship_request_ids[0]}
+
+    assert await getattr(FriendshipRequestService, service_method)(
+        user_id=user_id, friendship_request_ids=friendship_request_ids
+    ) == {friendship_request_ids[0]}
+    mocked_repository_method.assert_awaited_once_with(
+        friendship_request_ids=friendship_request_ids, **{owner: user_id}
+    )
+
+
+@pytest.mark.parametrize("action", ("sent", "received"))
+@patch(
+    "app.domain.services.friendship_request_service.FriendshipRequestRepository",
+    autospec=True,
+)
+async def test_get_pending_requests_by_user_page_and_count(
+    mocked_friendship_request_repository, action
+):
+    user_id = uuid4()
+    after = (datetime.utcnow(), uuid4())
+    mocked_friendship_request_repository_instance = (
+        mocked_friendship_request_repository.return_value.__aenter__.return_value
+    )
+    mocked_get_page = getattr(
+        mocked_friendship_request_repository_instance,
+        f"get_pending_requests_{action}_by_user_page",
+    )
+    mocked_count = getattr(
+        mocked_friendship_request_repository_instance,
+        f"count_pending_requests_{action}_by_user",
+    )
+    mocked_get_page.return_value = []
+    mocked_count.return_value = 3
+
+    assert (
+        await getattr(
+            FriendshipRequestService, f"get_pending_requests_{action}_by_user_page"
+        )(user_id=user_id, limit=21, after=after)
+        == []
+    )
+    assert (
+        await getattr(
+            FriendshipRequestService, f"count_pending_requests_{action}_by_user"
+        )(user_id=user_id)
+        == 3
+    )
+    mocked_get_page.assert_awaited_once_with(user_id=user_id, limit=21, after=after)
+    mocked_count.assert_awaited_once_with(user_id=user_id)
@@ -0,0 +1,76 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+from app.domain.services.friendship_service import FriendshipService, friendship_cache
+from app.friendship_graph import FriendshipGraph
+
+
+@patch("app.domain.services.friendship_service.FriendshipRepository", autospec=True)
+async def test_are_users_friends_caches_result(mocked_friendship_repository):
+    user_1_id = uuid4()
+    user_2_id = uuid4()
+    mocked_friendship_repository_instance = (
+        mocked_friendship_repository.return_value.__aenter__.return_value
+    )
+    mocked_friendship_repository_instance.are_users_friends.return_value = False
+
+    for _ in range(2):
+        assert (
+            await FriendshipService.are_users_friends(
+                user_1_id=user_1_id, user_2_id=user_2_id
+            )
+            is False
+        )
+
+    mocked_friendship_repository_instance.are_users_friends.assert_awaited_once_with(
+        user_1_id=user_1_id, user_2_id=user_2_id
+    )
+
+
+@patch("app.domain.services.friendship_service.FriendshipRepository", autospec=True)
+async def test_invalidate_friendship_invalidates_both_directions(
+    mocked_friendship_repository,
+):
+    user_1_id = uuid4()
+    user_2_id = uuid4()
+    friendship_cache.set((user_1_id, user_2_id), False)
+    friendship_cache.set((user_2_id, user_1_id), False)
+    mocked_friendship_repository_instance = (
+        mocked_friendship_repository.return_value.__aenter__.return_value
+    )
+    mocked_friendship_repository_instance.are_users_friends.return_value = True
+
+    FriendshipService.invalidate_friendship(user_1_id=user_1_id, user_2_id=user_2_id)
+
+    assert (
+        await FriendshipService.are_users_friends(
+            user_1_id=user_2_id, user_2_id=user_1_id
+        )
+        is True
+    )
+    assert friendship_cache.get((user_1_id, user_2_id)) is None
+
+
+@patch("app.domain.services.friendship_service.friendship_graph_sync")
+@patch("app.domain.services.friendship_service.FriendshipRepository", autospec=True)
+async def test_are_users_friends_uses_loaded_graph(
+    mocked_friendship_repository, mocked_friendship_graph_sync
+):
+    user_1_id, user_2_id = uuid4(), uuid4()
+    mocked_friendship_graph_sync.graph = FriendshipGraph()
+
+    FriendshipService.add_friendship(user_1_id=user_1_id, user_2_id=user_2_id)
+
+    assert (
+        await FriendshipService.are_users_friends(
+            user_1_id=user_2_id, user_2_id=user_1_id
+        )
+        is True
+    )
+    assert (
+        await FriendshipService.are_users_friends(
+            user_1_id=user_1_id, user_2_id=uuid4()
+        )
+        is False
+    )
+    mocked_friendship_repository.assert_not_called()
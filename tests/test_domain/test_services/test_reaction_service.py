@@ -1,9 +1,14 @@
+from datetime import datetime
 from unittest.mock import patch
 from uuid import uuid4
 
+import pytest
+
 from app.domain import entities
+from app.domain.services.exceptions import TrainingDoesNotExist
 from app.domain.services.reaction_service import ReactionService
-from app.enums import ReactionTypeEnum
+from app.domain.services.training_service import TrainingService
+from app.enums import ReactionTypeEnum, TrainingVisibilityEnum
 
 
 @patch("app.domain.services.reaction_service.ReactionRepository", autospec=True)
@@ -55,3 +60,55 @@ async def test_get_reactions_by_training_ids(mocked_repository):
     mocked_repository_instance.get_reactions_by_training_ids.assert_awaited_once_with(
         training_ids
     )
+
+
+@pytest.mark.parametrize("reaction_type", (ReactionTypeEnum.like, None))
+@patch("app.domain.services.reaction_service.reaction_write_buffer", autospec=True)
+@patch.object(TrainingService, "get_visible_training", autospec=True)
+async def test_react_and_unreact(
+    mocked_get_visible_training, mocked_reaction_write_buffer, reaction_type
+):
+    user_id = uuid4()
+    training_id = uuid4()
+    mocked_get_visible_training.return_value = entities.TrainingWithVisibility(
+        id=training_id,
+        start_time=datetime.utcnow(),
+        end_time=None,
+        name="name",
+        user_id=uuid4(),
+        visibility=TrainingVisibilityEnum.public,
+    )
+
+    if reaction_type:
+        await ReactionService.react(
+            user_id=user_id, training_id=training_id, reaction_type=reaction_type
+        )
+        mocked_reaction_write_buffer.react.assert_awaited_once_with(
+            user_id=user_id, training_id=training_id, reaction_type=reaction_type
+        )
+    else:
+        await ReactionService.unreact(user_id=user_id, training_id=training_id)
+        mocked_reaction_write_buffer.unreact.assert_awaited_once_with(
+            user_id=user_id, training_id=training_id
+        )
+    mocked_get_visible_training.assert_awaited_once_with(
+        request_user_id=user_id, training_id=training_id
+    )
+
+
+@patch("app.domain.services.reaction_service.reaction_write_buffer", autospec=True)
+@patch.object(TrainingService, "get_visible_training", autospec=True)
+async def test_react_to_not_visible_training(
+    mocked_get_visible_training, mocked_reaction_write_buffer
+):
+    mocked_get_visible_training.return_value = None
+
+    with pytest.raises(TrainingDoesNotExist):
+        await ReactionService.react(
+            user_id=uuid4(), training_id=uuid4(), reaction_type=ReactionTypeEnum.like
+        )
+    with pytest.raises(TrainingDoesNotExist):
+        await ReactionService.unreact(user_id=uuid4(), training_id=uuid4())
+
+    mocked_reaction_write_buffer.react.assert_not_awaited()
+    mocked_reaction_write_buffer.unreact.assert_not_awaited()
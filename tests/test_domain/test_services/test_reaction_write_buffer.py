@@ -0,0 +1,144 @@
+import asyncio
+from unittest.mock import ANY, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.domain.services.exceptions import TrainingDoesNotExist
+from app.domain.services.reaction_write_buffer import (
+    FOREIGN_KEY_VIOLATION,
+    ReactionWriteBuffer,
+)
+from app.enums import ReactionTypeEnum
+
+
+@pytest.fixture
+def mocked_repository():
+    with patch(
+        "app.domain.services.reaction_write_buffer.ReactionRepository", autospec=True
+    ) as mocked_repository:
+        yield mocked_repository
+
+
+def get_repository_instance(mocked_repository):
+    return mocked_repository.return_value.__aenter__.return_value
+
+
+async def test_writes_are_coalesced_into_one_batch(mocked_repository):
+    buffer = ReactionWriteBuffer(flush_interval_in_seconds=0.01, max_batch_size=10)
+    user_1_id, user_2_id, training_id = uuid4(), uuid4(), uuid4()
+
+    await asyncio.gather(
+        buffer.react(user_1_id, training_id, ReactionTypeEnum.like),
+        buffer.react(user_2_id, training_id, ReactionTypeEnum.like),
+        buffer.react(user_1_id, training_id, ReactionTypeEnum.dislike),
+        buffer.unreact(user_2_id, training_id),
+    )
+
+    mocked_repository.assert_called_once_with()
+    repository = get_repository_instance(mocked_repository)
+    repository.upsert_reactions.assert_awaited_once_with(
+        [(user_1_id, training_id, ReactionTypeEnum.dislike, ANY)]
+    )
+    repository.delete_reactions.assert_awaited_once_with([(user_2_id, training_id)])
+
+
+async def test_full_batch_is_flushed_without_waiting(mocked_repository):
+    buffer = ReactionWriteBuffer(flush_interval_in_seconds=60, max_batch_size=2)
+    training_id = uuid4()
+
+    await asyncio.wait_for(
+        asyncio.gather(
+            buffer.react(uuid4(), training_id, ReactionTypeEnum.like),
+            buffer.react(uuid4(), training_id, ReactionTypeEnum.like),
+        ),
+        timeout=1,
+    )
+
+    get_repository_instance(mocked_repository).upsert_reactions.assert_awaited_once()
+
+
+async def test_batches_are_committed_in_order(mocked_repository):
+    buffer = ReactionWriteBuffer(flush_interval_in_seconds=60, max_batch_size=1)
+    user_id, training_id = uuid4(), uuid4()
+    applied = []
+
+    async def upsert_reactions(reactions):
+        # The first batch is the slowest, the second must still wait for it.
+        await asyncio.sleep(0.02)
+        applied.append("react")
+
+    async def delete_reactions(user_and_training_ids):
+        applied.append("unreact")
+
+    repository = get_repository_instance(mocked_repository)
+    repository.upsert_reactions.side_effect = upsert_reactions
+    repository.delete_reactions.side_effect = delete_reactions
+
+    await asyncio.gather(
+        buffer.react(user_id, training_id, ReactionTypeEnum.like),
+        buffer.unreact(user_id, training_id),
+    )
+
+    assert applied == ["react", "unreact"]
+
+
+async def test_close_flushes_pending_writes(mocked_repository):
+    buffer = ReactionWriteBuffer(flush_interval_in_seconds=60, max_batch_size=10)
+    user_id, training_id = uuid4(), uuid4()
+    write = asyncio.create_task(
+        buffer.react(user_id, training_id, ReactionTypeEnum.like)
+    )
+    await asyncio.sleep(0)
+
+    await buffer.close()
+
+    assert write.done()
+    get_repository_instance(
+        mocked_repository
+    ).upsert_reactions.assert_awaited_once_with(
+        [(user_id, training_id, ReactionTypeEnum.like, ANY)]
+    )
+
+
+class MockedDatabaseError(Exception):
+    def __init__(self, pgcode):
+        super().__init__()
+        self.pgcode = pgcode
+
+
+async def test_failing_write_does_not_fail_the_batch(mocked_repository):
+    buffer = ReactionWriteBuffer(flush_interval_in_seconds=0.01, max_batch_size=10)
+    valid_training_id, missing_training_id = uuid4(), uuid4()
+    error = IntegrityError("INSERT", {}, MockedDatabaseError(pgcode="23505"))
+
+    async def upsert_reactions(reactions):
+        if any(training_id == missing_training_id for _, training_id, *_ in reactions):
+            raise error
+
+    get_repository_instance(
+        mocked_repository
+    ).upsert_reactions.side_effect = upsert_reactions
+
+    results = await asyncio.gather(
+        buffer.react(uuid4(), valid_training_id, ReactionTypeEnum.like),
+        buffer.react(uuid4(), missing_training_id, ReactionTypeEnum.like),
+        return_exceptions=True,
+    )
+
+    assert results == [None, error]
+
+
+async def test_write_for_deleted_training_fails_with_training_does_not_exist(
+    mocked_repository,
+):
+    buffer = ReactionWriteBuffer(flush_interval_in_seconds=0.01, max_batch_size=10)
+    get_repository_instance(
+        mocked_repository
+    ).upsert_reactions.side_effect = IntegrityError(
+        "INSERT", {}, MockedDatabaseError(pgcode=FOREIGN_KEY_VIOLATION)
+    )
+
+    with pytest.raises(TrainingDoesNotExist):
+        await buffer.react(uuid4(), uuid4(), ReactionTypeEnum.like)
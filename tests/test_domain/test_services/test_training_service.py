@@ -2,13 +2,20 @@ from datetime import datetime
 from unittest.mock import patch
 from uuid import uuid4
 
+import pytest
+
 from app.domain import entities
-from app.domain.services.training_service import TrainingService
+from app.domain.services.friendship_service import FriendshipService
+from app.domain.services.training_service import TrainingService, training_cache
+from app.enums import TrainingVisibilityEnum
 
 
+@patch("app.domain.services.training_service.UnitOfWork", autospec=True)
 @patch("app.domain.services.training_service.TrainingRepository", autospec=True)
-@patch("app.domain.services.training_service.tasks.handle_new_training")
-async def test_create_training(mocked_handle_new_training, mocked_training_repository):
+@patch("app.domain.services.training_service.OutboxRepository", autospec=True)
+async def test_create_training(
+    mocked_outbox_repository, mocked_training_repository, mocked_unit_of_work
+):
     start_time = datetime.utcnow()
     end_time = datetime.utcnow()
     name = "name"
@@ -30,8 +37,14 @@ async def test_create_training(mocked_handle_new_training, mocked_training_repos
     mocked_training_repository_instance.create_training.assert_awaited_once_with(
         user_id=user_id, name=name, start_time=start_time, end_time=end_time
     )
-    mocked_handle_new_training.delay.assert_called_once_with(
-        user_id=str(user_id), training_id=str(training.id)
+    mocked_unit_of_work_instance = (
+        mocked_unit_of_work.return_value.__aenter__.return_value
+    )
+    mocked_training_repository.assert_called_once_with(mocked_unit_of_work_instance)
+    mocked_outbox_repository.assert_called_once_with(mocked_unit_of_work_instance)
+    mocked_outbox_repository.return_value.__aenter__.return_value.add_message.assert_awaited_once_with(  # noqa
+        task="app.tasks.handle_new_training",
+        kwargs={"user_id": str(user_id), "training_id": str(training.id)},
     )
 
 
@@ -95,3 +108,162 @@ async def test_get_user_trainings(mocked_training_repository):
     mocked_training_repository_instance.get_user_trainings.assert_awaited_once_with(
         request_user_id=request_user_id, user_id=user_id
     )
+
+
+@patch("app.domain.services.training_service.TrainingRepository", autospec=True)
+async def test_get_user_trainings_page(mocked_training_repository):
+    request_user_id = uuid4()
+    user_id = uuid4()
+    after = (datetime.utcnow(), uuid4())
+    trainings = [
+        entities.Training(
+            id=uuid4(),
+            start_time=datetime.utcnow(),
+            end_time=datetime.utcnow(),
+            name="name",
+            user_id=user_id,
+        ),
+    ]
+    mocked_training_repository_instance = (
+        mocked_training_repository.return_value.__aenter__.return_value
+    )
+    mocked_training_repository_instance.get_user_trainings_page.return_value = trainings
+
+    assert (
+        await TrainingService.get_user_trainings_page(
+            request_user_id=request_user_id, user_id=user_id, limit=3, after=after
+        )
+        == trainings
+    )
+    mocked_training_repository_instance.get_user_trainings_page.assert_awaited_once_with(  # noqa
+        request_user_id=request_user_id, user_id=user_id, limit=3, after=after
+    )
+
+
+@pytest.mark.parametrize(
+    "visibility,is_author,are_users_friends,expected",
+    (
+        (TrainingVisibilityEnum.private, True, False, True),
+        (TrainingVisibilityEnum.private, False, True, False),
+        (TrainingVisibilityEnum.public, False, False, True),
+        (TrainingVisibilityEnum.only_friends, False, False, False),
+        (TrainingVisibilityEnum.only_friends, False, True, True),
+    ),
+)
+@patch.object(FriendshipService, "are_users_friends", autospec=True)
+async def test_can_user_see_training(
+    mocked_are_users_friends, visibility, is_author, are_users_friends, expected
+):
+    request_user_id = uuid4()
+    training = entities.TrainingWithVisibility(
+        id=uuid4(),
+        start_time=datetime.utcnow(),
+        end_time=None,
+        name="name",
+        user_id=request_user_id if is_author else uuid4(),
+        visibility=visibility,
+    )
+    mocked_are_users_friends.return_value = are_users_friends
+
+    assert (
+        await TrainingService.can_user_see_training(
+            request_user_id=request_user_id, training=training
+        )
+        is expected
+    )
+
+
+@pytest.mark.parametrize("can_user_see_training", (True, False))
+@patch.object(TrainingService, "can_user_see_training", autospec=True)
+@patch("app.domain.services.training_service.TrainingRepository", autospec=True)
+async def test_get_visible_training_caches_training(
+    mocked_training_repository, mocked_can_user_see_training, can_user_see_training
+):
+    request_user_id = uuid4()
+    training = entities.TrainingWithVisibility(
+        id=uuid4(),
+        start_time=datetime.utcnow(),
+        end_time=None,
+        name="name",
+        user_id=uuid4(),
+        visibility=TrainingVisibilityEnum.only_friends,
+    )
+    mocked_training_repository_instance = (
+        mocked_training_repository.return_value.__aenter__.return_value
+    )
+    mocked_training_repository_instance.get_training_with_visibility.return_value = (
+        training
+    )
+    mocked_can_user_see_training.return_value = can_user_see_training
+
+    for _ in range(2):
+        assert await TrainingService.get_visible_training(
+            request_user_id=request_user_id, training_id=training.id
+        ) == (training if can_user_see_training else None)
+
+    mocked_training_repository_instance.get_training_with_visibility.assert_awaited_once_with(  # noqa
+        training_id=training.id
+    )
+    assert mocked_can_user_see_training.await_count == 2
+    assert training_cache.get(training.id) == training
+
+
+@patch("app.domain.services.training_service.TrainingRepository", autospec=True)
+async def test_get_visible_training_does_not_exist(mocked_training_repository):
+    mocked_training_repository_instance = (
+        mocked_training_repository.return_value.__aenter__.return_value
+    )
+    mocked_training_repository_instance.get_training_with_visibility.return_value = None
+
+    assert (
+        await TrainingService.get_visible_training(
+            request_user_id=uuid4(), training_id=uuid4()
+        )
+        is None
+    )
+
+
+@patch("app.domain.services.training_service.TimelineRepository", autospec=True)
+async def test_get_friends_feed_page(mocked_timeline_repository):
+    user_id = uuid4()
+    after = (datetime.utcnow(), uuid4())
+    trainings = [
+        entities.Training(
+            id=uuid4(),
+            start_time=datetime.utcnow(),
+            end_time=None,
+            name="name",
+            user_id=uuid4(),
+        )
+    ]
+    mocked_timeline_repository_instance = (
+        mocked_timeline_repository.return_value.__aenter__.return_value
+    )
+    mocked_timeline_repository_instance.get_timeline_page.return_value = trainings
+
+    assert (
+        await TrainingService.get_friends_feed_page(
+            user_id=user_id, limit=10, after=after
+        )
+        == trainings
+    )
+    mocked_timeline_repository_instance.get_timeline_page.assert_awaited_once_with(
+        viewer_id=user_id, limit=10, after=after
+    )
+
+
+@patch("app.domain.services.training_service.TimelineRepository", autospec=True)
+async def test_get_high_fan_out_friends_ids(mocked_timeline_repository):
+    user_id = uuid4()
+    friends_ids = {uuid4()}
+    mocked_timeline_repository_instance = (
+        mocked_timeline_repository.return_value.__aenter__.return_value
+    )
+    mocked_timeline_repository_instance.get_high_fan_out_friends_ids.return_value = (
+        friends_ids
+    )
+
+    assert await TrainingService.get_high_fan_out_friends_ids(user_id) == friends_ids
+    mocked_timeline_repository_instance.get_high_fan_out_friends_ids.assert_awaited_once_with(  # noqa
+        user_id=user_id
+    )
@@ -25,7 +25,7 @@ async def test_get_users_by_ids(mocked_user_repository):
 
 
 @patch("app.domain.services.user_service.UserRepository")
-@patch("app.domain.services.user_service.get_password_hash")
+@patch("app.domain.services.user_service.async_get_password_hash")
 async def test_create_user(mocked_get_password_hash, mocked_user_repository):
     email = "test@test.com"
     password = "password"
@@ -41,6 +41,7 @@ async def test_create_user(mocked_get_password_hash, mocked_user_repository):
     mocked_user_repository_instance.create_user.assert_awaited_once_with(
         email=email, hashed_password=hashed_password
     )
+    mocked_get_password_hash.assert_awaited_once_with(password)
 
 
 @patch("app.domain.services.user_service.UserRepository")
@@ -57,7 +58,7 @@ async def test_create_user_no_user(mocked_user_repository):
 
 
 @patch("app.domain.services.user_service.UserRepository")
-@patch("app.domain.services.user_service.verify_password")
+@patch("app.domain.services.user_service.async_verify_password")
 async def test_create_user_not_matching_password(
     mocked_verify_password, mocked_user_repository
 ):
@@ -76,11 +77,11 @@ async def test_create_user_not_matching_password(
     with pytest.raises(LoginFailed):
         assert await UserService.get_user_jwt(email=email, password=password)
     mocked_user_repository_instance.get_user_by_email.assert_awaited_once_with(email)
-    mocked_verify_password.assert_called_once_with(password, hashed_password)
+    mocked_verify_password.assert_awaited_once_with(password, hashed_password)
 
 
 @patch("app.domain.services.user_service.UserRepository")
-@patch("app.domain.services.user_service.verify_password")
+@patch("app.domain.services.user_service.async_verify_password")
 @patch("app.domain.services.user_service.create_access_token")
 async def test_create_user_matching_password(
     mocked_create_access_token, mocked_verify_password, mocked_user_repository
@@ -101,5 +102,5 @@ async def test_create_user_matching_password(
 
     assert await UserService.get_user_jwt(email=email, password=password) == jwt
     mocked_user_repository_instance.get_user_by_email.assert_awaited_once_with(email)
-    mocked_verify_password.assert_called_once_with(password, hashed_password)
+    mocked_verify_password.assert_awaited_once_with(password, hashed_password)
     mocked_create_access_token.assert_called_once_with(user.id)
@@ -0,0 +1,38 @@
+import asyncio
+
+from app.event_loop import WorkerEventLoop
+
+
+async def get_running_loop():
+    return asyncio.get_running_loop()
+
+
+def test_run_reuses_event_loop():
+    worker_event_loop = WorkerEventLoop()
+    try:
+        assert worker_event_loop.run(get_running_loop()) is worker_event_loop.run(
+            get_running_loop()
+        )
+    finally:
+        worker_event_loop.shutdown()
+
+
+def test_shutdown_runs_callbacks_and_closes_loop():
+    worker_event_loop = WorkerEventLoop()
+    calls = []
+
+    async def callback():
+        calls.append(asyncio.get_running_loop())
+
+    worker_event_loop.on_shutdown(callback)
+    loop = worker_event_loop.run(get_running_loop())
+
+    worker_event_loop.shutdown()
+
+    assert calls == [loop]
+    assert loop.is_closed()
+
+    try:
+        assert worker_event_loop.run(get_running_loop()) is not loop
+    finally:
+        worker_event_loop.shutdown()
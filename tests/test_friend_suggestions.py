@@ -0,0 +1,58 @@
+from uuid import uuid4
+
+from app.friend_suggestions import get_adjacency_matrix, rank_friend_suggestions
+from app.friendship_graph import FriendshipGraph
+
+
+def get_graph(users_ids, friendships):
+    graph = FriendshipGraph()
+    graph.extend(
+        (users_ids[user_1_index], users_ids[user_2_index])
+        for user_1_index, user_2_index in friendships
+    )
+    graph.sort()
+    return graph
+
+
+def test_get_adjacency_matrix():
+    users_ids = [uuid4() for _ in range(4)]
+    graph = get_graph(users_ids, [(0, 1), (0, 2), (2, 3)])
+
+    adjacency = get_adjacency_matrix(graph).toarray()
+
+    assert adjacency.tolist() == [
+        [0, 1, 1, 0],
+        [1, 0, 0, 0],
+        [1, 0, 0, 1],
+        [0, 0, 1, 0],
+    ]
+
+
+def test_rank_friend_suggestions_by_mutual_friends():
+    users_ids = [uuid4() for _ in range(7)]
+    # 1, 2 and 3 are friends of 0. 4 is a friend of all of them, 5 of two, 6
+    # of one, 3 is a friend of 1 as well.
+    graph = get_graph(
+        users_ids,
+        [(0, 1), (0, 2), (0, 3), (1, 4), (2, 4), (3, 4), (1, 5), (2, 5), (3, 6)]
+        + [(1, 3)],
+    )
+    adjacency = get_adjacency_matrix(graph)
+
+    assert rank_friend_suggestions(adjacency, [0], limit=3) == [
+        [(4, 3), (5, 2), (6, 1)]
+    ]
+    assert rank_friend_suggestions(adjacency, [0], limit=1) == [[(4, 3)]]
+
+
+def test_rank_friend_suggestions_of_several_users():
+    users_ids = [uuid4() for _ in range(5)]
+    graph = get_graph(users_ids, [(0, 1), (1, 2), (0, 3), (3, 2), (3, 4)])
+
+    assert rank_friend_suggestions(
+        get_adjacency_matrix(graph), [0, 2, 4], limit=10
+    ) == [
+        [(2, 2), (4, 1)],
+        [(0, 2), (4, 1)],
+        [(0, 1), (2, 1)],
+    ]
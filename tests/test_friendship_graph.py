@@ -0,0 +1,63 @@
+from uuid import uuid4
+
+from app.friendship_graph import FriendshipGraph
+
+
+def get_graph(*friendships):
+    graph = FriendshipGraph()
+    graph.extend(friendships)
+    graph.sort()
+    return graph
+
+
+def test_are_friends_in_both_directions():
+    user_1_id, user_2_id, user_3_id = uuid4(), uuid4(), uuid4()
+    graph = get_graph((user_1_id, user_2_id), (user_2_id, user_3_id))
+
+    assert graph.are_friends(user_1_id, user_2_id) is True
+    assert graph.are_friends(user_2_id, user_1_id) is True
+    assert graph.are_friends(user_1_id, user_3_id) is False
+    assert graph.are_friends(user_1_id, uuid4()) is False
+    assert graph.are_friends(uuid4(), uuid4()) is False
+
+
+def test_get_friends_ids_and_count_friends():
+    user_id = uuid4()
+    friends_ids = [uuid4() for _ in range(5)]
+    graph = get_graph(
+        *((user_id, friend_id) for friend_id in reversed(friends_ids)),
+        (friends_ids[0], friends_ids[1]),
+    )
+
+    assert sorted(graph.get_friends_ids(user_id)) == sorted(friends_ids)
+    assert graph.count_friends(user_id) == 5
+    assert graph.count_friends(friends_ids[0]) == 2
+    assert graph.get_friends_ids(uuid4()) == []
+    assert graph.count_friends(uuid4()) == 0
+    assert len(graph) == 6
+    assert graph.friendships_count == 6
+
+
+def test_add_friendship_keeps_friends_sorted():
+    user_id = uuid4()
+    friends_ids = [uuid4() for _ in range(10)]
+    graph = get_graph(*((user_id, friend_id) for friend_id in friends_ids[::2]))
+
+    for friend_id in friends_ids[1::2]:
+        graph.add_friendship(friend_id, user_id)
+
+    assert all(graph.are_friends(user_id, friend_id) for friend_id in friends_ids)
+    assert list(graph._friends[graph._indexes[user_id]]) == sorted(
+        graph._friends[graph._indexes[user_id]]
+    )
+    assert graph.friendships_count == 10
+
+
+def test_add_friendship_skips_existing_friendship():
+    user_1_id, user_2_id = uuid4(), uuid4()
+    graph = get_graph((user_1_id, user_2_id))
+
+    graph.add_friendship(user_2_id, user_1_id)
+
+    assert graph.get_friends_ids(user_1_id) == [user_2_id]
+    assert graph.friendships_count == 1
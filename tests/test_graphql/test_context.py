@@ -0,0 +1,56 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from app.graphql.context import get_context
+from app.graphql.data_loaders import DataLoaders
+from app.jwt_tokens import create_access_token
+
+
+async def test_get_context_creates_data_loaders_per_request():
+    context_1 = await get_context()
+    context_2 = await get_context()
+
+    assert isinstance(context_1["data_loaders"], DataLoaders)
+    assert context_1["data_loaders"] is not context_2["data_loaders"]
+    assert (
+        context_1["data_loaders"].users_by_ids
+        is not context_2["data_loaders"].users_by_ids
+    )
+
+
+def get_connection(headers=None, query_params=None):
+    return Mock(headers=headers or {}, query_params=query_params or {})
+
+
+@pytest.mark.parametrize(
+    "get_headers,get_query_params,is_authenticated",
+    (
+        (lambda token: {"Authorization": f"Bearer {token}"}, lambda token: {}, True),
+        (lambda token: {"Authorization": f"bearer {token}"}, lambda token: {}, True),
+        (lambda token: {}, lambda token: {"auth": token}, True),
+        (lambda token: {"Authorization": f"Token {token}"}, lambda token: {}, False),
+        (lambda token: {"Authorization": "Bearer invalid"}, lambda token: {}, False),
+        (lambda token: {}, lambda token: {}, False),
+    ),
+)
+async def test_get_context_authenticates_request(
+    get_headers, get_query_params, is_authenticated
+):
+    user_id = uuid4()
+    token = create_access_token(user_id)
+    request = get_connection(
+        headers=get_headers(token), query_params=get_query_params(token)
+    )
+
+    context = await get_context(request=request)
+
+    assert context["user_id"] == (user_id if is_authenticated else None)
+
+
+async def test_get_context_authenticates_websocket():
+    user_id = uuid4()
+    websocket = get_connection(query_params={"auth": create_access_token(user_id)})
+
+    assert (await get_context(ws=websocket))["user_id"] == user_id
@@ -0,0 +1,71 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+from app.domain import entities
+from app.domain.events import dump_new_training_event
+from app.enums import TrainingVisibilityEnum
+from app.graphql.subscriptions.trainings import get_new_friends_training
+
+
+class MockedSubscriptionHub:
+    def __init__(self, messages):
+        self.messages = messages
+        self.routing_keys = None
+
+    @asynccontextmanager
+    async def subscribe(self, *routing_keys):
+        self.routing_keys = routing_keys
+        queue = asyncio.Queue()
+        for message in self.messages:
+            queue.put_nowait(message)
+        yield queue
+
+
+def get_training() -> entities.TrainingWithVisibility:
+    return entities.TrainingWithVisibility(
+        id=uuid4(),
+        start_time=datetime(2020, 10, 10, 10),
+        end_time=None,
+        name="name",
+        user_id=uuid4(),
+        visibility=TrainingVisibilityEnum.only_friends,
+    )
+
+
+@patch("app.graphql.subscriptions.trainings.TrainingService", autospec=True)
+async def test_new_friends_training_feed_drops_duplicate_events(
+    mocked_training_service,
+):
+    user_id = uuid4()
+    high_fan_out_friend_id = uuid4()
+    first_training, second_training = get_training(), get_training()
+    hub = MockedSubscriptionHub(
+        [
+            dump_new_training_event(first_training),
+            # Sent again by a retried fan-out chunk.
+            dump_new_training_event(first_training),
+            dump_new_training_event(second_training),
+        ]
+    )
+    mocked_training_service.get_high_fan_out_friends_ids.return_value = {
+        high_fan_out_friend_id
+    }
+    mocked_training_service.can_user_see_training.return_value = True
+    info = Mock(context={"user_id": user_id})
+
+    with patch("app.graphql.subscriptions.trainings.subscription_hub", hub):
+        trainings = get_new_friends_training(info)
+        assert [(await anext(trainings)).id for _ in range(2)] == [
+            first_training.id,
+            second_training.id,
+        ]
+        await trainings.aclose()
+
+    assert hub.routing_keys == (
+        f"new-training.{user_id}",
+        f"author-training.{high_fan_out_friend_id}",
+    )
+    assert mocked_training_service.can_user_see_training.await_count == 2
@@ -1,8 +1,13 @@
 import pytest
 
 from app.config import PASSWORD_MIN_LENGTH
-from app.graphql.exceptions import InvalidEmail, InvalidPassword
-from app.graphql.validators import validate_email, validate_password
+from app.graphql.exceptions import InvalidBatchSize, InvalidEmail, InvalidPassword
+from app.graphql.validators import (
+    MAX_BATCH_SIZE,
+    validate_batch_size,
+    validate_email,
+    validate_password,
+)
 
 
 def test_validate_email_correct():
@@ -39,3 +44,14 @@ def test_validate_password_incorrect(password, expected_message):
     with pytest.raises(InvalidPassword) as e:
         validate_password(password)
     assert e.value.message == expected_message
+
+
+@pytest.mark.parametrize("size", (1, MAX_BATCH_SIZE))
+def test_validate_batch_size_correct(size):
+    validate_batch_size(size)
+
+
+@pytest.mark.parametrize("size", (0, MAX_BATCH_SIZE + 1))
+def test_validate_batch_size_incorrect(size):
+    with pytest.raises(InvalidBatchSize):
+        validate_batch_size(size)
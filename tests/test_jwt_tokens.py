@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+from freezegun import freeze_time
+from jose import jwt
+
+from app import config
+from app.jwt_tokens import create_access_token, get_user_id_from_token
+
+
+@patch("app.jwt_tokens.jwt.decode", autospec=True, side_effect=jwt.decode)
+def test_get_user_id_from_token_caches_verified_token(mocked_decode):
+    user_id = uuid4()
+    token = create_access_token(user_id)
+
+    assert get_user_id_from_token(token) == user_id
+    assert get_user_id_from_token(token) == user_id
+
+    mocked_decode.assert_called_once()
+
+
+def test_get_user_id_from_token_rejects_cached_token_after_expiration():
+    user_id = uuid4()
+    with freeze_time() as frozen_time:
+        token = create_access_token(user_id)
+        assert get_user_id_from_token(token) == user_id
+
+        frozen_time.tick(
+            timedelta(minutes=config.JWT_EXPIRE_TIME_IN_MINUTES, seconds=1)
+        )
+
+        assert get_user_id_from_token(token) is None
+
+
+def test_get_user_id_from_token_rejects_invalid_token():
+    token = jwt.encode(
+        {"sub": str(uuid4()), "exp": datetime.utcnow() + timedelta(minutes=1)},
+        "other secret",
+        algorithm=config.JWT_ALGORITHM,
+    )
+
+    assert get_user_id_from_token(token) is None
+    assert get_user_id_from_token("invalid") is None
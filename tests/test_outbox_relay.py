@@ -0,0 +1,71 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.domain import entities
+from app.outbox_relay import relay, relay_batch, send_tasks
+
+
+@patch("app.outbox_relay.send_tasks", autospec=True)
+@patch("app.outbox_relay.OutboxRepository", autospec=True)
+async def test_relay_batch_deletes_sent_messages(mocked_repository, mocked_send_tasks):
+    messages = [
+        entities.OutboxMessage(id=1, task="task", kwargs={"number": 1}),
+        entities.OutboxMessage(id=2, task="task", kwargs={"number": 2}),
+    ]
+    mocked_repository_instance = mocked_repository.return_value.__aenter__.return_value
+    mocked_repository_instance.lock_messages.return_value = messages
+
+    assert await relay_batch(batch_size=2) == 2
+    mocked_repository_instance.lock_messages.assert_awaited_once_with(limit=2)
+    mocked_send_tasks.assert_called_once_with(messages)
+    mocked_repository_instance.delete_messages.assert_awaited_once_with([1, 2])
+
+
+@patch("app.outbox_relay.send_tasks", autospec=True)
+@patch("app.outbox_relay.OutboxRepository", autospec=True)
+async def test_relay_batch_keeps_messages_when_sending_fails(
+    mocked_repository, mocked_send_tasks
+):
+    mocked_repository_instance = mocked_repository.return_value.__aenter__.return_value
+    mocked_repository_instance.lock_messages.return_value = [
+        entities.OutboxMessage(id=1, task="task", kwargs={})
+    ]
+    mocked_send_tasks.side_effect = ConnectionError
+
+    with pytest.raises(ConnectionError):
+        await relay_batch(batch_size=2)
+    mocked_repository_instance.delete_messages.assert_not_awaited()
+
+
+@patch("app.outbox_relay.tasks.app", autospec=True)
+def test_send_tasks_uses_one_producer(mocked_app):
+    producer = mocked_app.producer_or_acquire.return_value.__enter__.return_value
+    send_tasks(
+        [
+            entities.OutboxMessage(id=1, task="app.tasks.a", kwargs={"x": 1}),
+            entities.OutboxMessage(id=2, task="app.tasks.b", kwargs={"y": 2}),
+        ]
+    )
+
+    assert mocked_app.producer_or_acquire.call_count == 1
+    assert [call.args for call in mocked_app.send_task.call_args_list] == [
+        ("app.tasks.a",),
+        ("app.tasks.b",),
+    ]
+    assert all(
+        call.kwargs["producer"] is producer
+        for call in mocked_app.send_task.call_args_list
+    )
+
+
+@patch("app.outbox_relay.RETRY_DELAY_IN_SECONDS", 0.01)
+@patch("app.outbox_relay.relay_batch", autospec=True)
+async def test_relay_keeps_running_after_failed_batch(mocked_relay_batch):
+    # The third call stops the loop, CancelledError is not caught.
+    mocked_relay_batch.side_effect = [ConnectionError, 0, asyncio.CancelledError]
+
+    with pytest.raises(asyncio.CancelledError):
+        await relay(batch_size=2, poll_interval_in_seconds=0.01)
+    assert mocked_relay_batch.await_count == 3
@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+import pytest
+
+from app.passwords import (
+    PasswordHashingPool,
+    PasswordHashingQueueFull,
+    async_get_password_hash,
+    async_verify_password,
+    password_hashing_queue_depth,
+    password_hashing_rejected,
+)
+
+
+async def test_async_get_password_hash_and_verify_password():
+    hashed_password = await async_get_password_hash("password")
+
+    assert await async_verify_password("password", hashed_password) is True
+    assert await async_verify_password("other", hashed_password) is False
+    assert password_hashing_queue_depth.value == 0
+
+
+async def test_pool_rejects_calls_when_queue_is_full():
+    pool = PasswordHashingPool(max_workers=1, max_queue_size=1)
+    rejected_before = password_hashing_rejected.value
+    try:
+        first_call = asyncio.create_task(pool.run(time.sleep, 0.1))
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordHashingQueueFull):
+            await pool.run(time.sleep, 0)
+
+        await first_call
+    finally:
+        pool.shutdown()
+
+    assert password_hashing_rejected.value == rejected_before + 1
+    assert password_hashing_queue_depth.value == 0
@@ -0,0 +1,267 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+from app.rabbitmq import RabbitMQPublisher, SubscriptionHub
+
+
+class MockedExchange:
+    def __init__(self, name):
+        self.name = name
+        self.published_messages = []
+
+    async def publish(self, message, routing_key):
+        await asyncio.sleep(0)
+        self.published_messages.append((json.loads(message.body), routing_key))
+
+
+class MockedIncomingMessage:
+    def __init__(self, message, routing_key):
+        self.body = json.dumps(message).encode()
+        self.routing_key = routing_key
+
+
+class MockedQueue:
+    def __init__(self):
+        self.routing_keys = set()
+        self.callback = None
+
+    async def bind(self, exchange, routing_key):
+        self.routing_keys.add(routing_key)
+
+    async def unbind(self, exchange, routing_key):
+        self.routing_keys.remove(routing_key)
+
+    async def consume(self, callback, no_ack):
+        self.callback = callback
+
+    async def deliver(self, message, routing_key):
+        if routing_key in self.routing_keys:
+            await self.callback(MockedIncomingMessage(message, routing_key))
+
+
+class MockedChannel:
+    def __init__(self):
+        self.exchange = None
+        self.queues = []
+        self.is_closed = False
+
+    async def declare_exchange(self, name, type, durable):
+        self.exchange = MockedExchange(name)
+        return self.exchange
+
+    async def get_exchange(self, name, ensure):
+        assert self.exchange.name == name
+        return self.exchange
+
+    async def declare_queue(self, exclusive):
+        queue = MockedQueue()
+        self.queues.append(queue)
+        return queue
+
+    async def close(self):
+        self.is_closed = True
+
+
+class MockedConnection:
+    def __init__(self):
+        self.channels = []
+        self.is_closed = False
+
+    async def channel(self):
+        channel = MockedChannel()
+        self.channels.append(channel)
+        return channel
+
+    async def close(self):
+        self.is_closed = True
+
+    def get_published_messages(self):
+        return sorted(
+            (
+                message
+                for channel in self.channels
+                for message in channel.exchange.published_messages
+            ),
+            key=lambda message: message[1],
+        )
+
+
+@patch("app.rabbitmq.aio_pika.connect_robust")
+async def test_publisher_reuses_connection_and_channels(mocked_connect_robust):
+    connection = MockedConnection()
+    mocked_connect_robust.return_value = connection
+    publisher = RabbitMQPublisher(
+        url="amqp://test", exchange_name="test", channel_pool_size=2
+    )
+
+    await asyncio.gather(
+        *(publisher.publish({"id": i}, routing_key=f"key-{i}") for i in range(10))
+    )
+
+    mocked_connect_robust.assert_awaited_once_with("amqp://test")
+    assert len(connection.channels) == 2
+    assert connection.get_published_messages() == sorted(
+        (({"id": i}, f"key-{i}") for i in range(10)), key=lambda message: message[1]
+    )
+
+
+@patch("app.rabbitmq.aio_pika.connect_robust")
+async def test_publisher_close_closes_channels_and_connection(mocked_connect_robust):
+    connection = MockedConnection()
+    mocked_connect_robust.return_value = connection
+    publisher = RabbitMQPublisher(
+        url="amqp://test", exchange_name="test", channel_pool_size=2
+    )
+    await publisher.publish({}, routing_key="key")
+
+    await publisher.close()
+
+    assert connection.is_closed
+    assert all(channel.is_closed for channel in connection.channels)
+
+    await publisher.publish({}, routing_key="key")
+
+    assert mocked_connect_robust.await_count == 2
+
+
+@patch("app.rabbitmq.aio_pika.connect_robust")
+def test_publisher_reconnects_in_new_event_loop(mocked_connect_robust):
+    mocked_connect_robust.side_effect = lambda url: MockedConnection()
+    publisher = RabbitMQPublisher(
+        url="amqp://test", exchange_name="test", channel_pool_size=2
+    )
+
+    asyncio.run(publisher.publish({}, routing_key="key"))
+    asyncio.run(publisher.publish({}, routing_key="key"))
+
+    assert mocked_connect_robust.call_count == 2
+
+
+@patch("app.rabbitmq.aio_pika.connect_robust")
+async def test_subscription_hub_shares_one_queue_between_subscribers(
+    mocked_connect_robust,
+):
+    connection = MockedConnection()
+    mocked_connect_robust.return_value = connection
+    hub = SubscriptionHub(
+        url="amqp://test", exchange_name="test", subscriber_queue_size=10
+    )
+
+    async with (
+        hub.subscribe("user-1") as first_subscriber,
+        hub.subscribe("user-1") as second_subscriber,
+        hub.subscribe("user-2") as third_subscriber,
+    ):
+        [channel] = connection.channels
+        [queue] = channel.queues
+        assert queue.routing_keys == {"user-1", "user-2"}
+
+        await queue.deliver({"id": 1}, routing_key="user-1")
+
+        assert first_subscriber.get_nowait() == {"id": 1}
+        assert second_subscriber.get_nowait() == {"id": 1}
+        assert third_subscriber.empty()
+
+    mocked_connect_robust.assert_awaited_once_with("amqp://test")
+    assert queue.routing_keys == set()
+
+
+@patch("app.rabbitmq.aio_pika.connect_robust")
+async def test_subscription_hub_unbinds_after_last_subscriber(mocked_connect_robust):
+    connection = MockedConnection()
+    mocked_connect_robust.return_value = connection
+    hub = SubscriptionHub(
+        url="amqp://test", exchange_name="test", subscriber_queue_size=10
+    )
+
+    async with hub.subscribe("user-1"):
+        async with hub.subscribe("user-1"):
+            pass
+        [queue] = connection.channels[0].queues
+        assert queue.routing_keys == {"user-1"}
+
+    assert queue.routing_keys == set()
+
+
+@patch("app.rabbitmq.aio_pika.connect_robust")
+async def test_subscription_hub_subscribes_to_several_routing_keys(
+    mocked_connect_robust,
+):
+    connection = MockedConnection()
+    mocked_connect_robust.return_value = connection
+    hub = SubscriptionHub(
+        url="amqp://test", exchange_name="test", subscriber_queue_size=10
+    )
+
+    async with hub.subscribe("user-1", "author-1") as first_subscriber:
+        async with hub.subscribe("user-2", "author-1") as second_subscriber:
+            [queue] = connection.channels[0].queues
+            assert queue.routing_keys == {"user-1", "user-2", "author-1"}
+
+            await queue.deliver({"id": 1}, routing_key="user-1")
+            await queue.deliver({"id": 2}, routing_key="author-1")
+
+            assert first_subscriber.get_nowait() == {"id": 1}
+            assert first_subscriber.get_nowait() == {"id": 2}
+            assert second_subscriber.get_nowait() == {"id": 2}
+            assert second_subscriber.empty()
+
+        assert queue.routing_keys == {"user-1", "author-1"}
+
+    assert queue.routing_keys == set()
+
+
+@patch("app.rabbitmq.aio_pika.connect_robust")
+async def test_subscription_hub_drops_messages_for_full_subscriber(
+    mocked_connect_robust,
+):
+    connection = MockedConnection()
+    mocked_connect_robust.return_value = connection
+    hub = SubscriptionHub(
+        url="amqp://test", exchange_name="test", subscriber_queue_size=1
+    )
+
+    async with (
+        hub.subscribe("user-1") as slow_subscriber,
+        hub.subscribe("user-1") as fast_subscriber,
+    ):
+        [queue] = connection.channels[0].queues
+        await queue.deliver({"id": 1}, routing_key="user-1")
+        assert fast_subscriber.get_nowait() == {"id": 1}
+
+        await queue.deliver({"id": 2}, routing_key="user-1")
+
+        assert fast_subscriber.get_nowait() == {"id": 2}
+        assert slow_subscriber.get_nowait() == {"id": 1}
+        assert slow_subscriber.empty()
+
+
+@patch("app.rabbitmq.aio_pika.connect_robust")
+async def test_subscription_hub_subscriber_queue_size(mocked_connect_robust):
+    connection = MockedConnection()
+    mocked_connect_robust.return_value = connection
+    hub = SubscriptionHub(
+        url="amqp://test", exchange_name="test", subscriber_queue_size=1
+    )
+
+    async with hub.subscribe("user-1", queue_size=0) as subscriber:
+        [queue] = connection.channels[0].queues
+        for message_id in range(3):
+            await queue.deliver({"id": message_id}, routing_key="user-1")
+
+        assert subscriber.qsize() == 3
+
+
+@patch("app.rabbitmq.aio_pika.connect_robust")
+async def test_subscription_hub_subscriber_leaves_after_close(mocked_connect_robust):
+    connection = MockedConnection()
+    mocked_connect_robust.return_value = connection
+    hub = SubscriptionHub(
+        url="amqp://test", exchange_name="test", subscriber_queue_size=10
+    )
+
+    async with hub.subscribe("user-1"):
+        await hub.close()
+
+    assert connection.is_closed
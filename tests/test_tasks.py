@@ -0,0 +1,222 @@
+from datetime import datetime
+from unittest.mock import call, patch
+from uuid import uuid4
+
+from app.domain import entities
+from app.domain.events import dump_new_friendship_event, dump_new_training_event
+from app.enums import TrainingVisibilityEnum
+from app.rabbitmq import NEW_FRIENDSHIP_ROUTING_KEY
+from app.tasks import (
+    async_fan_out_training_chunk,
+    async_handle_new_friendship,
+    async_handle_new_training,
+    async_reconcile_reaction_counts,
+)
+
+
+def get_training(visibility: TrainingVisibilityEnum) -> entities.TrainingWithVisibility:
+    return entities.TrainingWithVisibility(
+        id=uuid4(),
+        start_time=datetime.utcnow(),
+        end_time=None,
+        name="name",
+        user_id=uuid4(),
+        visibility=visibility,
+    )
+
+
+@patch("app.tasks.FEED_FAN_OUT_CHUNK_SIZE", 2)
+@patch("app.tasks.group", autospec=True)
+@patch("app.tasks.publish_message", autospec=True)
+@patch("app.tasks.UnitOfWork", autospec=True)
+@patch("app.tasks.TimelineRepository", autospec=True)
+@patch("app.tasks.FriendshipRepository", autospec=True)
+@patch("app.tasks.TrainingRepository", autospec=True)
+async def test_handle_new_training_fans_out_in_chunks(
+    mocked_training_repository,
+    mocked_friendship_repository,
+    mocked_timeline_repository,
+    mocked_unit_of_work,
+    mocked_publish_message,
+    mocked_group,
+):
+    training = get_training(TrainingVisibilityEnum.only_friends)
+    friends_ids = sorted(uuid4() for _ in range(5))
+    mocked_training_repository_instance = (
+        mocked_training_repository.return_value.__aenter__.return_value
+    )
+    mocked_training_repository_instance.get_training_with_visibility.return_value = (
+        training
+    )
+    mocked_friendship_repository_instance = (
+        mocked_friendship_repository.return_value.__aenter__.return_value
+    )
+    mocked_friendship_repository_instance.count_user_friends.return_value = 5
+    mocked_friendship_repository_instance.get_user_friends_ids.return_value = set(
+        friends_ids
+    )
+
+    await async_handle_new_training(
+        user_id=str(training.user_id), training_id=str(training.id)
+    )
+
+    mocked_training_repository_instance.get_training_with_visibility.assert_awaited_once_with(  # noqa
+        training_id=training.id
+    )
+    [subtasks] = mocked_group.call_args.args
+    assert [subtask.kwargs for subtask in subtasks] == [
+        {
+            "training_id": str(training.id),
+            "event": dump_new_training_event(training),
+            "friends_ids": [str(friend_id) for friend_id in chunk],
+        }
+        for chunk in (friends_ids[:2], friends_ids[2:4], friends_ids[4:])
+    ]
+    mocked_group.return_value.delay.assert_called_once_with()
+    mocked_timeline_repository.return_value.__aenter__.return_value.mark_high_fan_out_author.assert_not_awaited()  # noqa
+    mocked_publish_message.assert_not_awaited()
+
+
+@patch("app.tasks.publish_message", autospec=True)
+@patch("app.tasks.TimelineRepository", autospec=True)
+async def test_fan_out_training_chunk_publishes_to_new_viewers_only(
+    mocked_timeline_repository, mocked_publish_message
+):
+    training = get_training(TrainingVisibilityEnum.only_friends)
+    event = dump_new_training_event(training)
+    served_friend_id, new_friend_id = uuid4(), uuid4()
+    mocked_timeline_repository_instance = (
+        mocked_timeline_repository.return_value.__aenter__.return_value
+    )
+    mocked_timeline_repository_instance.add_training_to_timelines.return_value = {
+        new_friend_id
+    }
+
+    await async_fan_out_training_chunk(
+        training_id=str(training.id),
+        event=event,
+        friends_ids=[str(served_friend_id), str(new_friend_id)],
+    )
+
+    mocked_timeline_repository_instance.add_training_to_timelines.assert_awaited_once_with(  # noqa
+        training_id=training.id, viewers_ids=[served_friend_id, new_friend_id]
+    )
+    assert mocked_publish_message.await_args_list == [
+        call(message=event, routing_key=f"new-training.{new_friend_id}")
+    ]
+
+
+@patch("app.tasks.FEED_FAN_OUT_MAX_FRIENDS", 2)
+@patch("app.tasks.publish_message", autospec=True)
+@patch("app.tasks.UnitOfWork", autospec=True)
+@patch("app.tasks.TimelineRepository", autospec=True)
+@patch("app.tasks.FriendshipRepository", autospec=True)
+@patch("app.tasks.TrainingRepository", autospec=True)
+async def test_handle_new_training_publishes_once_for_high_fan_out_author(
+    mocked_training_repository,
+    mocked_friendship_repository,
+    mocked_timeline_repository,
+    mocked_unit_of_work,
+    mocked_publish_message,
+):
+    training = get_training(TrainingVisibilityEnum.public)
+    mocked_training_repository.return_value.__aenter__.return_value.get_training_with_visibility.return_value = (  # noqa
+        training
+    )
+    mocked_friendship_repository_instance = (
+        mocked_friendship_repository.return_value.__aenter__.return_value
+    )
+    mocked_friendship_repository_instance.count_user_friends.return_value = 3
+
+    await async_handle_new_training(
+        user_id=str(training.user_id), training_id=str(training.id)
+    )
+
+    mocked_friendship_repository_instance.count_user_friends.assert_awaited_once_with(
+        user_id=training.user_id
+    )
+    mocked_friendship_repository_instance.get_user_friends_ids.assert_not_awaited()
+    mocked_timeline_repository_instance = (
+        mocked_timeline_repository.return_value.__aenter__.return_value
+    )
+    mocked_timeline_repository_instance.mark_high_fan_out_author.assert_awaited_once_with(  # noqa
+        user_id=training.user_id
+    )
+    assert mocked_publish_message.await_args_list == [
+        call(
+            message=dump_new_training_event(training),
+            routing_key=f"author-training.{training.user_id}",
+        )
+    ]
+
+
+@patch("app.tasks.publish_message", autospec=True)
+@patch("app.tasks.UnitOfWork", autospec=True)
+@patch("app.tasks.TimelineRepository", autospec=True)
+@patch("app.tasks.FriendshipRepository", autospec=True)
+@patch("app.tasks.TrainingRepository", autospec=True)
+async def test_handle_new_training_skips_private_training(
+    mocked_training_repository,
+    mocked_friendship_repository,
+    mocked_timeline_repository,
+    mocked_unit_of_work,
+    mocked_publish_message,
+):
+    training = get_training(TrainingVisibilityEnum.private)
+    mocked_training_repository_instance = (
+        mocked_training_repository.return_value.__aenter__.return_value
+    )
+    mocked_training_repository_instance.get_training_with_visibility.return_value = (
+        training
+    )
+
+    await async_handle_new_training(
+        user_id=str(training.user_id), training_id=str(training.id)
+    )
+
+    mocked_friendship_repository.return_value.__aenter__.return_value.get_user_friends_ids.assert_not_awaited()  # noqa
+    mocked_timeline_repository.return_value.__aenter__.return_value.mark_high_fan_out_author.assert_not_awaited()  # noqa
+    mocked_publish_message.assert_not_awaited()
+
+
+@patch("app.tasks.FriendSuggestionService", autospec=True)
+@patch("app.tasks.publish_message", autospec=True)
+@patch("app.tasks.TimelineRepository", autospec=True)
+async def test_handle_new_friendship_fills_both_timelines(
+    mocked_repository, mocked_publish_message, mocked_friend_suggestion_service
+):
+    user_1_id, user_2_id = uuid4(), uuid4()
+
+    await async_handle_new_friendship(
+        user_1_id=str(user_1_id), user_2_id=str(user_2_id)
+    )
+
+    mocked_repository.return_value.__aenter__.return_value.add_friends_trainings_to_timelines.assert_awaited_once_with(  # noqa
+        user_1_id=user_1_id, user_2_id=user_2_id
+    )
+    mocked_publish_message.assert_awaited_once_with(
+        message=dump_new_friendship_event(user_1_id, user_2_id),
+        routing_key=NEW_FRIENDSHIP_ROUTING_KEY,
+    )
+    mocked_friend_suggestion_service.refresh_friend_suggestions.assert_has_awaits(
+        [call(user_1_id), call(user_2_id)]
+    )
+
+
+@patch("app.tasks.ReactionRepository", autospec=True)
+async def test_reconcile_reaction_counts_goes_through_all_batches(mocked_repository):
+    training_ids = [uuid4(), uuid4()]
+    mocked_repository_instance = mocked_repository.return_value.__aenter__.return_value
+    mocked_repository_instance.reconcile_reaction_counts.side_effect = [
+        (training_ids[0], 2),
+        (training_ids[1], 1),
+        (None, 0),
+    ]
+
+    assert await async_reconcile_reaction_counts(batch_size=10) == 3
+    assert mocked_repository_instance.reconcile_reaction_counts.await_args_list == [
+        call(after=None, limit=10),
+        call(after=training_ids[0], limit=10),
+        call(after=training_ids[1], limit=10),
+    ]
+    assert mocked_repository.call_count == 3